@@ -20,3 +20,13 @@ class LinksRegister(BaseModel):
 
     def register_page(self, page_number: int, width: float, height: float):
         self.page_sizes[page_number] = (width, height)
+
+    def unregister_page(self, page_number: int):
+        """
+        Removes all links and link targets that were registered for a page (before the page is drawn again).
+        """
+        for link_target in list(self.links.keys()):
+            self.links[link_target] = [link for link in self.links[link_target] if link[0] != page_number]
+            if len(self.links[link_target]) == 0:
+                del self.links[link_target]
+        self.link_targets = {key: value for key, value in self.link_targets.items() if value[0] != page_number}
@@ -21,5 +21,11 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 from ._knowledgeagendadatabase import KnowledgeAgendaDatabase
 from ._impactpathwaydatabase import ImpactPathwayDatabase
 from ._endoflifedatabase import EndOfLifeDatabase, EndOfLifeCell, Color, Driver, Function
-from ._svgtopdf import svg_to_pdf, svg_to_pdf_chrome
-from ._pdf import merge_pdf_files, add_links
+from ._pdfconverter import PdfConverter
+from ._cairosvg import CairoSvgPdfConverter
+from ._inkscape import InkscapePdfConverter, find_inkscape
+from ._svgtopdf import svg_to_pdf, svg_to_pdf_chrome, ChromiumPdfConverter
+from ._async_svgtopdf import AsyncChromiumPdfConverter, PdfConversionError
+from ._svgcompaction import SvgCompaction, compact_svg
+from ._pdf import merge_pdf_files, merge_pdf_bytes, add_links, insert_links
+from ._vectorpdf import VectorPdfRenderer
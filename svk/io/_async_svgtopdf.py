@@ -0,0 +1,208 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from typing import Iterable
+from playwright.async_api import async_playwright, Browser, Error, Page, Playwright
+from svgwrite import Drawing
+from svk.io._pdfconverter import _svg_content
+from svk.io._svgcompaction import SvgCompaction
+from svk.io._svgtopdf import _drawing_size, _svg_html
+import asyncio
+
+
+class PdfConversionError(Exception):
+    """
+    Raised when one or more pages could not be converted to pdf. The other pages are converted.
+    """
+
+    def __init__(self, failures: dict[str, BaseException]):
+        self.failures: dict[str, BaseException] = failures
+        """The error per pdf path (or page) that could not be written."""
+        super().__init__(
+            f"{len(failures)} page(s) could not be converted to pdf: "
+            + "; ".join(f"{pdf_path}: {error!r}" for pdf_path, error in failures.items())
+        )
+
+
+class AsyncChromiumPdfConverter:
+    """
+    Converts svg drawings to pdf concurrently, with a single headless Chromium browser and at most max_concurrency browser pages
+    (Playwright async API). Browser pages are reused by the next conversions. When the browser crashes or disconnects, it is
+    restarted for the next conversions (conversions that were running fail).
+    """
+
+    def __init__(self, max_concurrency: int = 4, timeout: float = 30.0):
+        if max_concurrency < 1:
+            raise ValueError("At least one page should be converted at a time.")
+
+        self.max_concurrency: int = max_concurrency
+        """The maximum number of pages that is converted at the same time."""
+        self.timeout: float = timeout
+        """The maximum time (in seconds) the conversion of a single page may take."""
+
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._idle_pages: list[Page] = []
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncChromiumPdfConverter":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def convert(self, svg_dwg: Drawing, pdf_path: str, compaction: SvgCompaction | None = None) -> int:
+        """
+        Converts a drawing to a pdf file, as soon as one of the browser pages is available.
+
+        :param svg_dwg: The drawing (svgwrite.Drawing or StreamingDrawing).
+        :type svg_dwg: Drawing
+        :param pdf_path: Path to the output pdf file.
+        :type pdf_path: str
+        :param compaction: Optional compaction of the svg before it is sent to the browser.
+        :type compaction: SvgCompaction | None
+        :return: The number of bytes saved by compacting the svg (0 without compaction).
+        :rtype: int
+        """
+        return (await self._convert(svg_dwg, pdf_path, compaction))[1]
+
+    async def convert_to_bytes(self, svg_dwg: Drawing, compaction: SvgCompaction | None = None) -> tuple[bytes, int]:
+        """
+        Converts a drawing to a pdf document in memory, as soon as one of the browser pages is available.
+
+        :param svg_dwg: The drawing (svgwrite.Drawing or StreamingDrawing).
+        :type svg_dwg: Drawing
+        :param compaction: Optional compaction of the svg before it is sent to the browser.
+        :type compaction: SvgCompaction | None
+        :return: The pdf document and the number of bytes saved by compacting the svg (0 without compaction).
+        :rtype: tuple[bytes, int]
+        """
+        return await self._convert(svg_dwg, None, compaction)
+
+    async def convert_all(
+        self, drawings: Iterable[tuple[Drawing, str]], compaction: SvgCompaction | None = None
+    ) -> list[int]:
+        """
+        Converts several drawings concurrently. All drawings are converted, also when some of them fail.
+
+        :param drawings: The drawings and the paths of their pdf files.
+        :type drawings: Iterable[tuple[Drawing, str]]
+        :param compaction: Optional compaction of the svg before it is sent to the browser.
+        :type compaction: SvgCompaction | None
+        :raises PdfConversionError: When one or more drawings could not be converted.
+        :return: The number of bytes saved by compaction per drawing (in the same order as the drawings).
+        :rtype: list[int]
+        """
+        drawings = list(drawings)
+        results = await asyncio.gather(
+            *(self.convert(svg_dwg, pdf_path, compaction) for svg_dwg, pdf_path in drawings), return_exceptions=True
+        )
+        failures = {pdf_path: result for (_, pdf_path), result in zip(drawings, results) if isinstance(result, BaseException)}
+        if failures:
+            raise PdfConversionError(failures)
+        return [result for result in results if isinstance(result, int)]
+
+    async def convert_all_to_bytes(
+        self, svg_dwgs: Iterable[Drawing], compaction: SvgCompaction | None = None
+    ) -> list[tuple[bytes, int]]:
+        """
+        Converts several drawings concurrently to pdf documents in memory. All drawings are converted, also when some of them
+        fail.
+
+        :param svg_dwgs: The drawings.
+        :type svg_dwgs: Iterable[Drawing]
+        :param compaction: Optional compaction of the svg before it is sent to the browser.
+        :type compaction: SvgCompaction | None
+        :raises PdfConversionError: When one or more drawings could not be converted (the failures are identified by the
+            position of the drawing, "page 1" being the first).
+        :return: The pdf document and the number of bytes saved by compaction per drawing (in the same order as the drawings).
+        :rtype: list[tuple[bytes, int]]
+        """
+        results = await asyncio.gather(
+            *(self.convert_to_bytes(svg_dwg, compaction) for svg_dwg in svg_dwgs), return_exceptions=True
+        )
+        failures = {
+            f"page {i_page + 1}": result for i_page, result in enumerate(results) if isinstance(result, BaseException)
+        }
+        if failures:
+            raise PdfConversionError(failures)
+        return [result for result in results if isinstance(result, tuple)]
+
+    async def close(self):
+        """
+        Closes the browser (a next conversion starts a new one).
+        """
+        await self._close_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _convert(self, svg_dwg: Drawing, pdf_path: str | None, compaction: SvgCompaction | None) -> tuple[bytes, int]:
+        svg_content, bytes_saved = _svg_content(svg_dwg, compaction)
+        html = _svg_html(svg_content)
+        width, height = _drawing_size(svg_dwg)
+        async with self._semaphore:
+            page = await self._get_page()
+            try:
+                pdf = await asyncio.wait_for(self._print(page, html, pdf_path, width, height), self.timeout)
+            except BaseException:
+                await _close_page(page)
+                raise
+            self._idle_pages.append(page)
+
+        return pdf, bytes_saved
+
+    async def _print(self, page: Page, html: str, pdf_path: str | None, width: str, height: str) -> bytes:
+        await page.set_content(html)
+        return await page.pdf(path=pdf_path, width=width, height=height, print_background=True)
+
+    async def _get_page(self) -> Page:
+        async with self._browser_lock:
+            if self._browser is not None and not self._browser.is_connected():
+                await self._close_browser()
+            if self._browser is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch()
+
+            while self._idle_pages:
+                page = self._idle_pages.pop()
+                if not page.is_closed():
+                    return page
+            page = await self._browser.new_page()
+            page.set_default_timeout(self.timeout * 1000)
+            return page
+
+    async def _close_browser(self):
+        self._idle_pages = []
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Error:
+                pass
+            self._browser = None
+
+
+async def _close_page(page: Page):
+    try:
+        await page.close()
+    except Error:
+        pass
@@ -0,0 +1,158 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from queue import Empty, Queue
+from threading import Thread
+from typing import IO
+from svgwrite import Drawing
+from svk.io._pdfconverter import PdfConverter, _svg_content
+from svk.io._svgcompaction import SvgCompaction
+import os
+import shutil
+import subprocess
+import tempfile
+
+_windows_inkscape_path = "C:/Program Files/Inkscape/bin/inkscape.exe"
+_prompt = b"> "
+
+
+def find_inkscape() -> str:
+    """
+    Returns the Inkscape executable: the one on the PATH, or the default Windows installation.
+
+    :raises FileNotFoundError: When Inkscape cannot be found.
+    :return: The path of the executable.
+    :rtype: str
+    """
+    executable = shutil.which("inkscape")
+    if executable is None and os.path.exists(_windows_inkscape_path):
+        executable = _windows_inkscape_path
+    if executable is None:
+        raise FileNotFoundError("Inkscape could not be found on the PATH.")
+    return executable
+
+
+class InkscapePdfConverter(PdfConverter):
+    """
+    Converts svg drawings to pdf with a single Inkscape process in shell mode (inkscape --shell) that is kept open between
+    conversions (for a build, or a batch of builds), instead of starting Inkscape for every page.
+
+    Inkscape opens documents from files only, the svg and pdf of a page are exchanged through a private temporary directory (on
+    the local disk, not in the output dir). The process is started on the first conversion. When it exits unexpectedly, it is
+    restarted on the next conversion. A conversion that takes longer than the timeout fails with a TimeoutError (the process is
+    stopped).
+    """
+
+    def __init__(self, executable: str | None = None, timeout: float = 60.0):
+        self.executable: str | None = executable
+        """The Inkscape executable (found on the PATH when not specified)."""
+        self.timeout: float = timeout
+        """The maximum time (in seconds) the conversion of a single page may take."""
+
+        self._process: subprocess.Popen | None = None
+        self._output: Queue[bytes | None] = Queue()
+        self._directory: tempfile.TemporaryDirectory | None = None
+        self._last_output: str = ""
+
+    def convert_to_bytes(self, svg_dwg: Drawing, compaction: SvgCompaction | None = None) -> tuple[bytes, int]:
+        content, bytes_saved = _svg_content(svg_dwg, compaction)
+        directory = self._get_directory()
+        svg_path = os.path.join(directory, "page.svg")
+        pdf_path = os.path.join(directory, "page.pdf")
+        with open(svg_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        if os.path.exists(pdf_path):
+            os.remove(pdf_path)
+
+        self._run(f"file-open:{svg_path};export-type:pdf;export-filename:{pdf_path};export-do;file-close")
+        if not os.path.exists(pdf_path):
+            raise RuntimeError(f"Inkscape did not export the page to pdf: {self._last_output}")
+        with open(pdf_path, "rb") as file:
+            return file.read(), bytes_saved
+
+    def close(self):
+        """
+        Stops the Inkscape process and removes the temporary directory (a next conversion starts a new process).
+        """
+        self._stop_process()
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+    def _run(self, actions: str):
+        process = self._get_process()
+        try:
+            process.stdin.write(actions.encode("utf-8") + b"\n")
+            process.stdin.flush()
+        except OSError:
+            self._stop_process()
+            raise RuntimeError("The Inkscape process exited unexpectedly.")
+        self._wait_for_prompt()
+
+    def _wait_for_prompt(self):
+        # Inkscape prints a prompt when it is ready for the next line of actions.
+        output = b""
+        while not output.endswith(_prompt):
+            try:
+                chunk = self._output.get(timeout=self.timeout)
+            except Empty:
+                self._stop_process()
+                raise TimeoutError(f"Inkscape did not respond within {self.timeout} seconds.")
+            if chunk is None:
+                self._stop_process()
+                raise RuntimeError(f"The Inkscape process exited unexpectedly: {output.decode(errors='replace')}")
+            output += chunk
+        self._last_output = output[: -len(_prompt)].decode(errors="replace").strip()
+
+    def _get_process(self) -> subprocess.Popen:
+        if self._process is not None and self._process.poll() is not None:
+            self._stop_process()
+        if self._process is None:
+            executable = self.executable if self.executable is not None else find_inkscape()
+            self._process = subprocess.Popen(
+                [executable, "--shell"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            self._output = Queue()
+            Thread(target=_read_output, args=(self._process.stdout, self._output), daemon=True).start()
+            self._wait_for_prompt()
+        return self._process
+
+    def _get_directory(self) -> str:
+        if self._directory is None:
+            self._directory = tempfile.TemporaryDirectory(prefix="svk-inkscape-")
+        return self._directory.name
+
+    def _stop_process(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.write(b"quit\n")
+            process.stdin.close()
+            process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+
+def _read_output(stream: IO[bytes], output: Queue):
+    for chunk in iter(lambda: os.read(stream.fileno(), 4096), b""):
+        output.put(chunk)
+    output.put(None)
@@ -1,3 +1,4 @@
+from typing import Iterable
 from PyPDF2 import PdfMerger
 from svk.data import LinksRegister
 import fitz
@@ -13,6 +14,22 @@ def merge_pdf_files(input_files: list[str], output_file: str):
     merger.close()
 
 
+def merge_pdf_bytes(pdfs: Iterable[bytes]) -> fitz.Document:
+    """
+    Merges pdf documents (in memory) into a new pdf document, without reading or writing files.
+
+    :param pdfs: The pdf documents, in page order.
+    :type pdfs: Iterable[bytes]
+    :return: The merged pdf document.
+    :rtype: fitz.Document
+    """
+    doc = fitz.open()
+    for pdf in pdfs:
+        with fitz.open(stream=pdf, filetype="pdf") as pdf_doc:
+            doc.insert_pdf(pdf_doc)
+    return doc
+
+
 def _scale_coordinates(x: float, y: float, svg_width: float, svg_height: float, pdf_width: float, pdf_height: float):
     x_pdf = x * pdf_width / svg_width
     y_pdf = y * pdf_height / svg_height
@@ -21,6 +38,21 @@ def _scale_coordinates(x: float, y: float, svg_width: float, svg_height: float,
 
 def add_links(input_pdf_file: str, output_file: str, links_manager: LinksRegister):
     doc = fitz.open(input_pdf_file)
+    insert_links(doc, links_manager)
+    doc.save(output_file)
+    doc.close()
+
+
+def insert_links(doc: fitz.Document, links_manager: LinksRegister):
+    """
+    Inserts the links of a links register in an (open) pdf document. Link positions are scaled from the svg page sizes to the pdf
+    page sizes.
+
+    :param doc: The pdf document.
+    :type doc: fitz.Document
+    :param links_manager: The links register with the links, link targets and svg page sizes.
+    :type links_manager: LinksRegister
+    """
     links = links_manager.links
     link_targets = links_manager.link_targets
     svg_sizes = links_manager.page_sizes
@@ -60,6 +92,3 @@ def add_links(input_pdf_file: str, output_file: str, links_manager: LinksRegiste
                     "color": (1, 0, 0),
                 }
             )
-
-    doc.save(output_file)
-    doc.close()
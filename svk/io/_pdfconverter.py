@@ -0,0 +1,127 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from abc import ABC, abstractmethod
+from svgwrite import Drawing
+from svk.io._pdf import merge_pdf_bytes
+from svk.io._svgcompaction import SvgCompaction, compact_svg
+
+
+class PdfConverter(ABC):
+    """
+    Converts svg drawings to pdf. A converter can be kept open for a build (or a batch of builds) and is closed when it is used as
+    a context manager. Implementations convert a single drawing to pdf bytes, writing files and combining pages into one document
+    is shared.
+    """
+
+    def __enter__(self) -> "PdfConverter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @abstractmethod
+    def convert_to_bytes(self, svg_dwg: Drawing, compaction: SvgCompaction | None = None) -> tuple[bytes, int]:
+        """
+        Converts a drawing to a pdf document in memory.
+
+        :param svg_dwg: The drawing (svgwrite.Drawing or StreamingDrawing).
+        :type svg_dwg: Drawing
+        :param compaction: Optional compaction of the svg before it is converted.
+        :type compaction: SvgCompaction | None
+        :return: The pdf document and the number of bytes saved by compacting the svg (0 without compaction).
+        :rtype: tuple[bytes, int]
+        """
+
+    def convert(self, svg_dwg: Drawing, pdf_path: str, compaction: SvgCompaction | None = None) -> int:
+        """
+        Converts a drawing to a pdf file.
+
+        :param svg_dwg: The drawing (svgwrite.Drawing or StreamingDrawing).
+        :type svg_dwg: Drawing
+        :param pdf_path: Path to the output pdf file.
+        :type pdf_path: str
+        :param compaction: Optional compaction of the svg before it is converted.
+        :type compaction: SvgCompaction | None
+        :return: The number of bytes saved by compacting the svg (0 without compaction).
+        :rtype: int
+        """
+        pdf, bytes_saved = self.convert_to_bytes(svg_dwg, compaction)
+        with open(pdf_path, "wb") as file:
+            file.write(pdf)
+        return bytes_saved
+
+    def convert_document(self, svg_dwgs: list[Drawing], pdf_path: str, compaction: SvgCompaction | None = None) -> list[int]:
+        """
+        Converts several drawings to a single pdf file (a page per drawing, with the size of the drawing).
+
+        :param svg_dwgs: The drawings (svgwrite.Drawing or StreamingDrawing), in page order.
+        :type svg_dwgs: list[Drawing]
+        :param pdf_path: Path to the output pdf file.
+        :type pdf_path: str
+        :param compaction: Optional compaction of the svg before it is converted.
+        :type compaction: SvgCompaction | None
+        :return: The number of bytes saved by compacting the svg of each drawing (0 without compaction).
+        :rtype: list[int]
+        """
+        pdf, bytes_saved = self.convert_document_to_bytes(svg_dwgs, compaction)
+        with open(pdf_path, "wb") as file:
+            file.write(pdf)
+        return bytes_saved
+
+    def convert_document_to_bytes(
+        self, svg_dwgs: list[Drawing], compaction: SvgCompaction | None = None
+    ) -> tuple[bytes, list[int]]:
+        """
+        Converts several drawings to a single pdf document in memory (a page per drawing, with the size of the drawing). By
+        default, the drawings are converted one by one and the pages are merged.
+
+        :param svg_dwgs: The drawings (svgwrite.Drawing or StreamingDrawing), in page order.
+        :type svg_dwgs: list[Drawing]
+        :param compaction: Optional compaction of the svg before it is converted.
+        :type compaction: SvgCompaction | None
+        :return: The pdf document and the number of bytes saved by compacting the svg of each drawing (0 without compaction).
+        :rtype: tuple[bytes, list[int]]
+        """
+        conversions = [self.convert_to_bytes(svg_dwg, compaction) for svg_dwg in svg_dwgs]
+        with merge_pdf_bytes(pdf for pdf, _ in conversions) as doc:
+            return doc.tobytes(garbage=3, deflate=True), [bytes_saved for _, bytes_saved in conversions]
+
+    def close(self):
+        """
+        Releases the resources of the converter (a next conversion acquires them again).
+        """
+
+
+def _svg_content(svg_dwg: Drawing, compaction: SvgCompaction | None) -> tuple[str, int]:
+    """
+    Returns the svg of a drawing, compacted if specified.
+
+    :param svg_dwg: The drawing (svgwrite.Drawing or StreamingDrawing).
+    :type svg_dwg: Drawing
+    :param compaction: Optional compaction of the svg.
+    :type compaction: SvgCompaction | None
+    :return: The svg and the number of bytes saved by compacting it (0 without compaction).
+    :rtype: tuple[str, int]
+    """
+    content = svg_dwg.tostring()
+    if compaction is None:
+        return content, 0
+    return compact_svg(content, compaction)
@@ -0,0 +1,173 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydantic import BaseModel
+import re
+
+_tag_pattern = re.compile(r"<[^>]*>")
+_attribute_pattern = re.compile(r'(\s+)([^\s=]+)="([^"]*)"')
+_decimal_pattern = re.compile(r"-?(?:\d+\.\d*|\.\d+)")
+_path_token_pattern = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[A-Za-z]")
+_zero_length_pattern = re.compile(r"-?(?:0+\.?0*|\.0+)(?:em|px)?")
+
+_inherited_initial_values: dict[str, str] = {
+    "fill": "black",
+    "fill-opacity": "1",
+    "fill-rule": "nonzero",
+    "stroke": "none",
+    "stroke-width": "1",
+    "stroke-opacity": "1",
+    "stroke-linecap": "butt",
+    "stroke-linejoin": "miter",
+    "stroke-dasharray": "none",
+    "font-style": "normal",
+    "font-weight": "normal",
+    "text-anchor": "start",
+    "visibility": "visible",
+}
+"""Initial values of inherited presentation attributes (an attribute is redundant if it equals the inherited value)."""
+
+_inherited_attributes = set(_inherited_initial_values) | {"font-family", "font-size"}
+"""Presentation attributes that are inherited by sub elements."""
+
+_zero_default_attributes: dict[str, set[str]] = {
+    "rect": {"x", "y"},
+    "use": {"x", "y"},
+    "text": {"x", "y", "dx", "dy"},
+    "tspan": {"dx", "dy"},
+}
+"""Attributes that default to zero per element (these are not inherited)."""
+
+_non_numeric_attributes = {"id", "class", "href", "xlink:href", "target", "font-family", "version", "baseProfile"}
+"""Attributes that never contain numbers that should be rounded."""
+
+
+class SvgCompaction(BaseModel):
+    """
+    Settings to compact svg output before it is written or converted: numbers are rounded to a fixed number of decimals,
+    attributes that do not change the rendering are removed and path data is written with as few characters as possible. Text
+    content is never changed.
+    """
+
+    precision: int = 2
+    """The number of decimals numbers (coordinates, sizes, transformations) are rounded to."""
+    remove_default_attributes: bool = True
+    """Remove attributes that equal their default or inherited value."""
+    shorten_path_data: bool = True
+    """Write path data without redundant separators and leading zeros."""
+
+    def compact(self, svg: str) -> str:
+        """
+        Returns the compacted svg.
+
+        :param svg: The svg string (as produced by svgwrite or the streaming svg writer).
+        :type svg: str
+        :return: The compacted svg string.
+        :rtype: str
+        """
+        # Inherited presentation attributes of all open elements. Within defs the context an element is used in is unknown.
+        inherited_stack: list[dict[str, str]] = [dict(_inherited_initial_values)]
+
+        def compact_tag(match: re.Match) -> str:
+            tag = match.group(0)
+            if tag.startswith("</"):
+                if len(inherited_stack) > 1:
+                    inherited_stack.pop()
+                return tag
+            if tag.startswith("<?") or tag.startswith("<!"):
+                return tag
+
+            name = tag[1:].split(None, 1)[0].rstrip("/>")
+            self_closing = tag.endswith("/>")
+            inherited = {} if name == "defs" else dict(inherited_stack[-1])
+
+            def compact_attribute(attribute_match: re.Match) -> str:
+                whitespace, key, value = attribute_match.groups()
+                value = self._compact_value(key, value)
+                if self.remove_default_attributes and name != "svg":
+                    if key in inherited and inherited[key] == value:
+                        return ""
+                    if key in _zero_default_attributes.get(name, ()) and _zero_length_pattern.fullmatch(value):
+                        return ""
+                    if key == "opacity" and value == "1":
+                        return ""
+                if key in _inherited_attributes:
+                    inherited[key] = value
+                return f'{whitespace}{key}="{value}"'
+
+            compacted = _attribute_pattern.sub(compact_attribute, tag)
+            if not self_closing:
+                # Style attributes and classes are not tracked, so nothing is known about what the children inherit.
+                inherited_stack.append({} if ' style="' in tag or ' class="' in tag else inherited)
+            return compacted
+
+        return _tag_pattern.sub(compact_tag, svg)
+
+    def _compact_value(self, key: str, value: str) -> str:
+        if key in _non_numeric_attributes or key.startswith("xmlns") or value.startswith("url(") or value.startswith("#"):
+            return value
+        if key == "d" and self.shorten_path_data:
+            return self._shorten_path(value)
+        return _decimal_pattern.sub(lambda number: self._format_number(number.group(0)), value)
+
+    def _format_number(self, number: str) -> str:
+        formatted = f"{float(number):.{self.precision}f}"
+        if "." in formatted:
+            formatted = formatted.rstrip("0").rstrip(".")
+        return "0" if formatted == "-0" else formatted
+
+    def _shorten_path(self, path_data: str) -> str:
+        shortened: list[str] = []
+        previous_number: str | None = None
+        for token in _path_token_pattern.findall(path_data):
+            if token.isalpha():
+                shortened.append(token)
+                previous_number = None
+                continue
+
+            number = self._format_number(token) if "e" not in token.lower() else token
+            if number.startswith("0."):
+                number = number[1:]
+            elif number.startswith("-0."):
+                number = "-" + number[2:]
+            # A separator is only needed if the number could otherwise be read as part of the previous number.
+            if previous_number is not None and not (
+                number.startswith("-") or (number.startswith(".") and "." in previous_number)
+            ):
+                shortened.append(" ")
+            shortened.append(number)
+            previous_number = number
+        return "".join(shortened)
+
+
+def compact_svg(svg: str, compaction: SvgCompaction | None = None) -> tuple[str, int]:
+    """
+    Compacts an svg string.
+
+    :param svg: The svg string.
+    :type svg: str
+    :param compaction: The compaction settings (default settings when not specified).
+    :type compaction: SvgCompaction | None
+    :return: The compacted svg and the number of bytes that were saved.
+    :rtype: tuple[str, int]
+    """
+    compaction = compaction if compaction is not None else SvgCompaction()
+    compacted = compaction.compact(svg)
+    return compacted, len(svg.encode("utf-8")) - len(compacted.encode("utf-8"))
@@ -18,58 +18,240 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, Browser, Error, Page, Playwright
+from typing import Any
 from svgwrite import Drawing
+from svk.io._inkscape import InkscapePdfConverter
+from svk.io._pdfconverter import PdfConverter, _svg_content
+from svk.io._svgcompaction import SvgCompaction
+import asyncio
 import os
 
 
 def svg_to_pdf(dwg: Drawing, output_dir: str, file_name: str) -> str:
-    import subprocess
-
+    """
+    Converts a drawing to pdf (in the output dir) with Inkscape. Use an InkscapePdfConverter to convert several pages with the
+    same Inkscape process.
+    """
     if not os.path.exists(output_dir):
         raise FileExistsError(f"The specified output directory does not exist: {output_dir}")
 
     name, extension = os.path.splitext(os.path.basename(file_name))
-    svg_image_path = os.path.join(output_dir, name + ".svg")
     pdf_image_path = os.path.join(output_dir, name + ".pdf")
-
-    dwg.saveas(svg_image_path)
-    inkscape_path = "C:/Program Files/Inkscape/bin/inkscape.exe"
-    subprocess.run([inkscape_path, svg_image_path, "--export-type=pdf", f"--export-filename={pdf_image_path}"])
+    with InkscapePdfConverter() as converter:
+        converter.convert(dwg, pdf_image_path)
 
     return pdf_image_path
 
 
-def svg_to_pdf_chrome(svg_dwg: Drawing, pdf_path: str):
+def svg_to_pdf_chrome(svg_dwg: Drawing, pdf_path: str, compaction: SvgCompaction | None = None) -> int:
     """
     Save an svgwrite.Drawing object to PDF with all effects and links preserved.
 
+    This starts (and closes) a browser for a single page, use a ChromiumPdfConverter to convert several pages.
+
     Parameters:
     -----------
     svg_dwg : svgwrite.Drawing
         The svgwrite SVG object to export.
     pdf_path : str
         Path to the output PDF file.
+    compaction : SvgCompaction | None
+        Optional compaction of the svg before it is sent to the browser.
+
+    Returns:
+    --------
+    int
+        The number of bytes saved by compacting the svg (0 without compaction).
     """
-    svg_content = svg_dwg.tostring()
+    with ChromiumPdfConverter() as converter:
+        return converter.convert(svg_dwg, pdf_path, compaction)
+
+
+class ChromiumPdfConverter(PdfConverter):
+    """
+    Converts svg drawings to pdf with a headless Chromium browser that is kept open between conversions (for a build, or a batch
+    of builds), instead of launching a browser for every page.
+
+    The browser is started on the first conversion and a single browser page is reused. When the browser disconnects or the
+    browser page crashes, the browser is restarted and the conversion is tried once more (other errors are raised). A conversion
+    that takes longer than the timeout (loading the svg and printing it) fails with a TimeoutError and the browser page is
+    replaced before the next conversion. The browser is driven from a private event loop, so a converter cannot be used while an
+    event loop is running in the same thread (use an AsyncChromiumPdfConverter there).
+    """
+
+    def __init__(self, timeout: float = 30.0):
+        self.timeout: float = timeout
+        """The maximum time (in seconds) the conversion of a single page may take."""
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._page: Page | None = None
+        self._page_crashed: bool = False
+
+    def convert(self, svg_dwg: Drawing, pdf_path: str, compaction: SvgCompaction | None = None) -> int:
+        """
+        Converts a drawing to a pdf file.
+
+        :param svg_dwg: The drawing (svgwrite.Drawing or StreamingDrawing).
+        :type svg_dwg: Drawing
+        :param pdf_path: Path to the output pdf file.
+        :type pdf_path: str
+        :param compaction: Optional compaction of the svg before it is sent to the browser.
+        :type compaction: SvgCompaction | None
+        :return: The number of bytes saved by compacting the svg (0 without compaction).
+        :rtype: int
+        """
+        svg_content, bytes_saved = _svg_content(svg_dwg, compaction)
+        width, height = _drawing_size(svg_dwg)
+        self._print(_svg_html(svg_content), pdf_path, width=width, height=height)
+        return bytes_saved
+
+    def convert_to_bytes(self, svg_dwg: Drawing, compaction: SvgCompaction | None = None) -> tuple[bytes, int]:
+        svg_content, bytes_saved = _svg_content(svg_dwg, compaction)
+        width, height = _drawing_size(svg_dwg)
+        return self._print(_svg_html(svg_content), None, width=width, height=height), bytes_saved
+
+    def convert_document_to_bytes(
+        self, svg_dwgs: list[Drawing], compaction: SvgCompaction | None = None
+    ) -> tuple[bytes, list[int]]:
+        """
+        Converts several drawings to a single pdf document (a page per drawing, with the size of the drawing). All drawings are
+        put in one html document that is printed at once (the timeout applies to the whole document).
+
+        :param svg_dwgs: The drawings (svgwrite.Drawing or StreamingDrawing), in page order.
+        :type svg_dwgs: list[Drawing]
+        :param compaction: Optional compaction of the svg before it is sent to the browser.
+        :type compaction: SvgCompaction | None
+        :return: The pdf document and the number of bytes saved by compacting the svg of each drawing (0 without compaction).
+        :rtype: tuple[bytes, list[int]]
+        """
+        page_styles: list[str] = []
+        page_contents: list[str] = []
+        bytes_saved: list[int] = []
+        for i_page, svg_dwg in enumerate(svg_dwgs):
+            svg_content, page_bytes_saved = _svg_content(svg_dwg, compaction)
+            bytes_saved.append(page_bytes_saved)
+
+            width, height = _drawing_size(svg_dwg)
+            page_styles.append(
+                f"@page page-{i_page} {{ size: {width} {height}; margin: 0; }}\n          "
+                f".page-{i_page} {{ page: page-{i_page}; width: {width}; height: {height}; }}"
+            )
+            page_contents.append(f'<div class="page page-{i_page}">{svg_content}</div>')
 
-    html = f"""
+        page_style_rules = "\n          ".join(page_styles)
+        html = f"""
     <html>
-      <body style="margin:0; padding:0;">
-        {svg_content}
+      <head>
+        <style>
+          body {{ margin: 0; padding: 0; }}
+          .page {{ overflow: hidden; break-after: page; }}
+          .page:last-child {{ break-after: auto; }}
+          .page > svg {{ display: block; }}
+          {page_style_rules}
+        </style>
+      </head>
+      <body>
+        {"".join(page_contents)}
       </body>
     </html>
     """
+        return self._print(html, None, prefer_css_page_size=True), bytes_saved
+
+    def close(self):
+        """
+        Closes the browser (a next conversion starts a new one).
+        """
+        if self._loop is None:
+            return
+        self._loop.run_until_complete(self._close())
+        self._loop.close()
+        self._loop = None
+
+    def _print(self, html: str, pdf_path: str | None, **pdf_options: Any) -> bytes:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self._print_or_restart(html, pdf_path, **pdf_options))
+
+    async def _print_or_restart(self, html: str, pdf_path: str | None, **pdf_options: Any) -> bytes:
+        try:
+            return await self._print_page(html, pdf_path, **pdf_options)
+        except Error:
+            if self._browser is not None and self._browser.is_connected() and not self._page_crashed:
+                raise
+            # The browser disconnected or the page crashed: start a new one and try once more.
+            await self._close_browser()
+            return await self._print_page(html, pdf_path, **pdf_options)
+
+    async def _print_page(self, html: str, pdf_path: str | None, **pdf_options: Any) -> bytes:
+        page = await self._get_page()
+        try:
+            return await asyncio.wait_for(self._load_and_print(page, html, pdf_path, **pdf_options), self.timeout)
+        except BaseException:
+            await self._close_page()
+            raise
+
+    async def _load_and_print(self, page: Page, html: str, pdf_path: str | None, **pdf_options: Any) -> bytes:
+        await page.set_content(html)
+        return await page.pdf(path=pdf_path, print_background=True, **pdf_options)
+
+    async def _get_page(self) -> Page:
+        if self._browser is not None and not self._browser.is_connected():
+            await self._close_browser()
+        if self._browser is None:
+            self._browser = await self._launch_browser()
+        if self._page is None or self._page.is_closed():
+            self._page = await self._browser.new_page()
+            self._page.set_default_timeout(self.timeout * 1000)
+            self._page.on("crash", self._on_page_crash)
+            self._page_crashed = False
+        return self._page
+
+    async def _launch_browser(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    def _on_page_crash(self, page: Page):
+        self._page_crashed = True
 
-        page.set_content(html)
+    async def _close_page(self):
+        if self._page is not None:
+            try:
+                await self._page.close()
+            except Error:
+                pass
+            self._page = None
 
-        width = str(svg_dwg.attribs.get("width")) if "width" in svg_dwg.attribs else "800px"
-        height = str(svg_dwg.attribs.get("height")) if "height" in svg_dwg.attribs else "600px"
+    async def _close_browser(self):
+        self._page = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Error:
+                pass
+            self._browser = None
+
+    async def _close(self):
+        await self._close_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+def _svg_html(svg_content: str) -> str:
+    return f"""
+    <html>
+      <body style="margin:0; padding:0;">
+        {svg_content}
+      </body>
+    </html>
+    """
 
-        page.pdf(path=pdf_path, width=width, height=height, print_background=True)
 
-        browser.close()
+def _drawing_size(svg_dwg: Drawing) -> tuple[str, str]:
+    width = str(svg_dwg.attribs.get("width")) if "width" in svg_dwg.attribs else "800px"
+    height = str(svg_dwg.attribs.get("height")) if "height" in svg_dwg.attribs else "600px"
+    return width, height
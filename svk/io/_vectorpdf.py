@@ -0,0 +1,1078 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from math import atan2, ceil, cos, pi, radians, sin, sqrt, tan
+from pydantic import BaseModel
+from fitz.utils import getColor
+from svgwrite import Drawing
+from svk.data import LinksRegister
+from svk.io._pdf import insert_links
+import fitz
+import re
+import xml.etree.ElementTree as ElementTree
+
+_svg_namespace = "{http://www.w3.org/2000/svg}"
+_xlink_href = "{http://www.w3.org/1999/xlink}href"
+_xml_space = "{http://www.w3.org/XML/1998/namespace}space"
+
+_points_per_pixel = 0.75
+"""Svg user units are css pixels (96 per inch), pdf units are points (72 per inch)."""
+
+_inherited_properties = {
+    "fill",
+    "fill-opacity",
+    "fill-rule",
+    "stroke",
+    "stroke-width",
+    "stroke-opacity",
+    "stroke-linecap",
+    "stroke-linejoin",
+    "stroke-dasharray",
+    "font-size",
+    "font-weight",
+    "font-style",
+    "font-family",
+    "text-anchor",
+    "dominant-baseline",
+    "text-decoration",
+    "visibility",
+}
+"""Presentation properties that are passed on to sub elements (text-decoration is not inherited, but it is drawn for all
+descendants, which amounts to the same)."""
+
+_style_properties = _inherited_properties | {"opacity", "display"}
+"""All presentation properties the renderer supports."""
+
+_initial_style: dict[str, str] = {
+    "fill": "black",
+    "stroke": "none",
+    "stroke-width": "1",
+    "font-size": "16",
+    "text-anchor": "start",
+    "dominant-baseline": "auto",
+}
+"""Initial values of the presentation properties (the others default to an absent key)."""
+
+_baseline_shifts: dict[str, float] = {
+    "text-before-edge": 0.905,
+    "hanging": 0.8 * 0.905,
+    "middle": 0.519 / 2,
+    "central": (0.905 - 0.212) / 2,
+    "text-after-edge": -0.212,
+    "after-edge": -0.212,
+}
+"""Distance (in em) from the position of a text to its alphabetic baseline per dominant baseline (arial ascent, descent and
+x-height)."""
+
+_font_names: dict[tuple[bool, bool], str] = {
+    (False, False): "helv",
+    (True, False): "hebo",
+    (False, True): "heit",
+    (True, True): "hebi",
+}
+"""The built-in font (helvetica, which has the same metrics as arial) per (bold, italic)."""
+
+_line_caps = {"butt": 0, "round": 1, "square": 2}
+_line_joins = {"miter": 0, "round": 1, "bevel": 2}
+
+_number_pattern = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_path_token_pattern = re.compile(r"[A-Za-z]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_transform_pattern = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)")
+_css_rule_pattern = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_whitespace_pattern = re.compile(r"\s+")
+
+
+class VectorPdfRenderer(BaseModel):
+    """
+    Renders svg drawings (as drawn by the pages) straight into pdf content streams with PyMuPDF, without a browser.
+
+    The renderer supports the svg subset the elements use: text (with tspans, anchors, dominant baselines and links), rects,
+    circles, ellipses, lines, polygons, paths, groups with transformations, css classes, linear and radial gradients (as pdf
+    shading patterns) and symbols or templates that are reused. Text is written with the built-in Helvetica fonts, which share
+    their metrics with Arial (the font the text layout is measured with). Links of the links register are added to the document
+    directly.
+    """
+
+    symbols_as_forms: bool = True
+    """Write symbols and templates that are reused (and contain no text or gradients) once per document as form XObjects."""
+    subset_fonts: bool = True
+    """Only embed the glyphs that are used."""
+
+    def render(self, svg_dwgs: list[Drawing], pdf_path: str, links_register: LinksRegister | None = None):
+        """
+        Renders drawings to a single pdf file (a page per drawing, with the size of the drawing).
+
+        :param svg_dwgs: The drawings (svgwrite.Drawing or StreamingDrawing), in page order.
+        :type svg_dwgs: list[Drawing]
+        :param pdf_path: Path to the output pdf file.
+        :type pdf_path: str
+        :param links_register: The links (between pages) to add to the pdf.
+        :type links_register: LinksRegister | None
+        """
+        doc = self.render_document(svg_dwgs, links_register)
+        try:
+            doc.save(pdf_path, garbage=3, deflate=True)
+        finally:
+            doc.close()
+
+    def render_document(self, svg_dwgs: list[Drawing], links_register: LinksRegister | None = None) -> fitz.Document:
+        """
+        Renders drawings to a new (in-memory) pdf document.
+
+        :param svg_dwgs: The drawings (svgwrite.Drawing or StreamingDrawing), in page order.
+        :type svg_dwgs: list[Drawing]
+        :param links_register: The links (between pages) to add to the pdf.
+        :type links_register: LinksRegister | None
+        :return: The pdf document.
+        :rtype: fitz.Document
+        """
+        doc = fitz.open()
+        resources = _DocumentResources(doc)
+        for svg_dwg in svg_dwgs:
+            _SvgPageRenderer(doc, resources, self.symbols_as_forms).render(svg_dwg.tostring())
+        if links_register is not None:
+            insert_links(doc, links_register)
+        if self.subset_fonts:
+            doc.subset_fonts()
+        return doc
+
+    def render_page(self, doc: fitz.Document, svg: str) -> fitz.Page:
+        """
+        Renders a single svg document as a new page at the end of a pdf document.
+
+        :param doc: The pdf document.
+        :type doc: fitz.Document
+        :param svg: The svg document.
+        :type svg: str
+        :return: The new page.
+        :rtype: fitz.Page
+        """
+        return _SvgPageRenderer(doc, _DocumentResources(doc), self.symbols_as_forms).render(svg)
+
+
+class _DocumentResources:
+    """
+    Pdf objects that are shared by all pages of a document: fonts, graphics states (opacity) and form XObjects.
+    """
+
+    def __init__(self, doc: fitz.Document):
+        self.doc: fitz.Document = doc
+        self.fonts: dict[str, tuple[str, int]] = {}
+        """Resource name and xref per built-in font name."""
+        self.graphics_states: dict[tuple[float, float], tuple[str, int]] = {}
+        """Resource name and xref of the graphics state per (fill opacity, stroke opacity)."""
+        self.forms: dict[tuple, tuple[str, int]] = {}
+        """Resource name and xref of the form XObject per (element id, inherited presentation properties)."""
+
+    def font(self, page: fitz.Page, font_name: str) -> tuple[str, int]:
+        if font_name not in self.fonts:
+            name = f"Fv{len(self.fonts)}"
+            # Embedded as a Type0 font (Identity-H), such that text is written as glyph ids and all characters are available.
+            xref = page.insert_font(fontname=name, fontbuffer=_load_font(font_name).buffer)
+            self.fonts[font_name] = (name, xref)
+        return self.fonts[font_name]
+
+    def graphics_state(self, fill_opacity: float, stroke_opacity: float) -> tuple[str, int]:
+        key = (round(fill_opacity, 4), round(stroke_opacity, 4))
+        if key not in self.graphics_states:
+            xref = self.new_object(f"<< /Type /ExtGState /ca {_format(key[0])} /CA {_format(key[1])} >>")
+            self.graphics_states[key] = (f"Gv{len(self.graphics_states)}", xref)
+        return self.graphics_states[key]
+
+    def new_object(self, definition: str, stream: bytes | None = None) -> int:
+        xref = self.doc.get_new_xref()
+        self.doc.update_object(xref, definition)
+        if stream is not None:
+            self.doc.update_stream(xref, stream)
+        return xref
+
+
+class _TextRun:
+    """
+    A piece of text with a single style, with the position attributes of the (first) element it belongs to.
+    """
+
+    __slots__ = ("text", "style", "position", "link")
+
+    def __init__(self, text: str, style: dict[str, str], position: dict[str, str], link: str | None):
+        self.text = text
+        self.style = style
+        self.position = position
+        self.link = link
+
+
+class _SvgPageRenderer:
+    """
+    Renders one svg document to a new pdf page.
+
+    All elements are written (in document order) into a single content stream: shapes as path operations and text as glyphs of
+    the embedded fonts, both in svg user units with the current transformation of the element.
+    """
+
+    def __init__(self, doc: fitz.Document, resources: _DocumentResources, symbols_as_forms: bool):
+        self.doc = doc
+        self.resources = resources
+        self.symbols_as_forms = symbols_as_forms
+
+        self._page: fitz.Page | None = None
+        self._base: fitz.Matrix = fitz.Matrix(1, 1)
+        """Transformation from svg page units (pixels, y downwards) to pdf units (points, y upwards)."""
+        self._css: dict[str, dict[str, str]] = {}
+        self._elements: dict[str, ElementTree.Element] = {}
+        self._operations: list[str] = []
+        self._page_resources: dict[str, dict[str, int]] = {"Font": {}, "ExtGState": {}, "Pattern": {}, "XObject": {}}
+        self._form_operations: list[str] | None = None
+        """The operations of the form XObject that is being written (if any)."""
+        self._form_resources: dict[str, int] = {}
+        self._form_eligible: dict[str, bool] = {}
+        self._uri_links: list[tuple[tuple[float, float, float, float], str]] = []
+
+    def render(self, svg: str) -> fitz.Page:
+        root = ElementTree.fromstring(svg)
+        width, height = _length(root.get("width"), 100.0), _length(root.get("height"), 100.0)
+        self._page = self.doc.new_page(width=width * _points_per_pixel, height=height * _points_per_pixel)
+        self._base = fitz.Matrix(_points_per_pixel, 0, 0, -_points_per_pixel, 0, height * _points_per_pixel)
+
+        for element in root.iter():
+            if element.get("id") is not None:
+                self._elements[element.get("id")] = element
+            if _tag(element) == "style" and element.text:
+                self._parse_css(element.text)
+
+        ctm = fitz.Matrix(1, 1)
+        if root.get("viewBox") is not None:
+            ctm = _view_box_matrix(root.get("viewBox"), width, height)
+        self._draw_children(root, dict(_initial_style), ctm)
+
+        content = f"q {_format_matrix(self._base)} cm\n" + "\n".join(self._operations) + "\nQ\n"
+        self.doc.xref_set_key(self._page.xref, "Contents", f"{self.resources.new_object('<< >>', content.encode())} 0 R")
+        self._apply_resources()
+        for rect, uri in self._uri_links:
+            self._page.insert_link({"kind": fitz.LINK_URI, "from": fitz.Rect(rect) * _points_per_pixel, "uri": uri})
+        return self._page
+
+    def _parse_css(self, css: str):
+        for selectors, declarations in _css_rule_pattern.findall(css):
+            properties = _parse_declarations(declarations)
+            for selector in selectors.split(","):
+                selector = selector.strip()
+                if selector.startswith("."):
+                    self._css.setdefault(selector[1:], {}).update(properties)
+
+    def _style(self, element: ElementTree.Element, parent_style: dict[str, str]) -> dict[str, str]:
+        # Css rules take precedence over presentation attributes, style attributes over both.
+        style = {key: value for key, value in parent_style.items() if key in _inherited_properties}
+        for key, value in element.attrib.items():
+            if key in _style_properties:
+                style[key] = value
+        for class_name in element.get("class", "").split():
+            style.update(self._css.get(class_name, {}))
+        if element.get("style") is not None:
+            style.update(_parse_declarations(element.get("style")))
+        if style.get("text-anchor") not in ("start", "middle", "end"):
+            style["text-anchor"] = parent_style.get("text-anchor", "start")
+        if "font-size" in style:
+            style["font-size"] = _format(_font_size(style["font-size"], parent_style))
+        return style
+
+    def _draw_children(self, element: ElementTree.Element, style: dict[str, str], ctm: fitz.Matrix):
+        for child in element:
+            self._draw_element(child, style, ctm)
+
+    def _draw_element(self, element: ElementTree.Element, parent_style: dict[str, str], parent_ctm: fitz.Matrix):
+        tag = _tag(element)
+        if tag in ("defs", "style", "symbol", "linearGradient", "radialGradient", "title", "desc", "metadata"):
+            return
+
+        style = self._style(element, parent_style)
+        if style.get("display") == "none":
+            return
+        ctm = parent_ctm
+        if element.get("transform") is not None:
+            ctm = _parse_transform(element.get("transform")) * parent_ctm
+
+        if tag in ("g", "a", "svg"):
+            self._draw_children(element, style, ctm)
+        elif tag == "use":
+            self._draw_use(element, style, ctm)
+        elif tag == "text":
+            self._draw_text(element, style, ctm)
+        elif style.get("visibility") not in ("hidden", "collapse"):
+            shape = _shape(tag, element)
+            if shape is not None:
+                self._draw_shape(shape[0], shape[1], style, ctm, closed=tag != "line" and tag != "polyline")
+
+    def _draw_use(self, element: ElementTree.Element, style: dict[str, str], ctm: fitz.Matrix):
+        target = self._elements.get(element.get(_xlink_href, element.get("href", "")).lstrip("#"))
+        if target is None:
+            return
+
+        ctm = fitz.Matrix(1, 0, 0, 1, _length(element.get("x")), _length(element.get("y"))) * ctm
+        bounding_box: fitz.Rect | None = None
+        if _tag(target) == "symbol" and target.get("viewBox") is not None:
+            x, y, view_width, view_height = _view_box(target.get("viewBox"))
+            width, height = _length(element.get("width"), view_width), _length(element.get("height"), view_height)
+            ctm = _view_box_matrix(target.get("viewBox"), width, height) * ctm
+            bounding_box = fitz.Rect(x, y, x + view_width, y + view_height)
+
+        if self._use_form(target, style):
+            self._place_form(target, style, ctm, bounding_box)
+        elif _tag(target) == "symbol":
+            self._draw_children(target, self._style(target, style), ctm)
+        else:
+            self._draw_element(target, style, ctm)
+
+    def _use_form(self, target: ElementTree.Element, style: dict[str, str]) -> bool:
+        # Text and gradients depend on the page (resources and position), those are drawn every time.
+        if not self.symbols_as_forms or self._form_operations is not None or target.get("id") is None:
+            return False
+        if style.get("fill", "").startswith("url(") or style.get("stroke", "").startswith("url("):
+            return False
+        eligible = self._form_eligible.get(target.get("id"))
+        if eligible is None:
+            eligible = not any(
+                _tag(element) in ("text", "use")
+                or element.get("fill", "").startswith("url(")
+                or element.get("stroke", "").startswith("url(")
+                or element.get("class") is not None
+                or element.get("style") is not None
+                for element in target.iter()
+            )
+            self._form_eligible[target.get("id")] = eligible
+        return eligible
+
+    def _place_form(
+        self, target: ElementTree.Element, style: dict[str, str], ctm: fitz.Matrix, bounding_box: fitz.Rect | None
+    ):
+        key = (target.get("id"), tuple(sorted((k, v) for k, v in style.items() if k in _inherited_properties)))
+        if key not in self.resources.forms:
+            self._form_operations, self._form_resources = [], {}
+            if _tag(target) == "symbol":
+                self._draw_children(target, self._style(target, style), fitz.Matrix(1, 1))
+            else:
+                self._draw_element(target, style, fitz.Matrix(1, 1))
+            operations, form_resources = self._form_operations, self._form_resources
+            self._form_operations, self._form_resources = None, {}
+
+            if bounding_box is None:
+                bounding_box = _operations_rect(operations)
+            states = " ".join(f"/{name} {xref} 0 R" for name, xref in form_resources.items())
+            xref = self.resources.new_object(
+                f"<< /Type /XObject /Subtype /Form /BBox [{_format_rect(bounding_box)}] "
+                f"/Resources << /ExtGState << {states} >> >> >>",
+                "\n".join(operations).encode(),
+            )
+            self.resources.forms[key] = (f"Xv{len(self.resources.forms)}", xref)
+
+        name, xref = self.resources.forms[key]
+        self._page_resources["XObject"][name] = xref
+        self._operations.append(f"q {_format_matrix(ctm)} cm /{name} Do Q")
+
+    def _draw_shape(self, path: str, rect: fitz.Rect, style: dict[str, str], ctm: fitz.Matrix, closed: bool = True):
+        opacity = _number(style.get("opacity"), 1.0)
+        fill = style.get("fill", "black") if closed else "none"
+        stroke = style.get("stroke", "none")
+        stroke_width = _length(style.get("stroke-width"), 1.0)
+        if stroke_width <= 0:
+            stroke = "none"
+
+        fill_paint = self._paint(fill, rect, ctm, stroking=False)
+        stroke_paint = self._paint(stroke, rect, ctm, stroking=True)
+        if fill_paint is None and stroke_paint is None:
+            return
+
+        operations = [f"q {_format_matrix(ctm)} cm"]
+        fill_opacity = opacity * _number(style.get("fill-opacity"), 1.0)
+        stroke_opacity = opacity * _number(style.get("stroke-opacity"), 1.0)
+        if (fill_paint is not None and fill_opacity < 1) or (stroke_paint is not None and stroke_opacity < 1):
+            operations.append(self._graphics_state(fill_opacity, stroke_opacity))
+        if fill_paint is not None:
+            operations.append(fill_paint)
+        if stroke_paint is not None:
+            operations.append(stroke_paint)
+            operations.append(f"{_format(stroke_width)} w")
+            operations.append(f"{_line_caps.get(style.get('stroke-linecap', 'butt'), 0)} J")
+            operations.append(f"{_line_joins.get(style.get('stroke-linejoin', 'miter'), 0)} j 4 M")
+            dashes = [_length(value) for value in _number_pattern.findall(style.get("stroke-dasharray", ""))]
+            if len(dashes) > 0 and sum(dashes) > 0:
+                operations.append(f"[{_format_values(dashes)}] 0 d")
+
+        operations.append(path)
+        even_odd = "*" if style.get("fill-rule") == "evenodd" else ""
+        if fill_paint is not None and stroke_paint is not None:
+            operations.append(f"B{even_odd} Q")
+        elif fill_paint is not None:
+            operations.append(f"f{even_odd} Q")
+        else:
+            operations.append("S Q")
+        self._add_operations(" ".join(operations))
+
+    def _paint(self, paint: str, rect: fitz.Rect, ctm: fitz.Matrix, stroking: bool) -> str | None:
+        paint = paint.strip()
+        if paint == "none" or paint == "transparent":
+            return None
+        if paint.startswith("url("):
+            gradient = self._elements.get(paint[4:].split(")")[0].strip().lstrip("#"))
+            if gradient is None:
+                return None
+            name = self._gradient_pattern(gradient, rect, ctm)
+            if name is None:
+                return None
+            return f"/Pattern {'CS' if stroking else 'cs'} /{name} {'SCN' if stroking else 'scn'}"
+        return f"{_format_color(_color(paint))} {'RG' if stroking else 'rg'}"
+
+    def _gradient_pattern(self, gradient: ElementTree.Element, rect: fitz.Rect, ctm: fitz.Matrix) -> str | None:
+        attributes = _gradient_attributes(gradient, self._elements)
+        stops = _gradient_stops(gradient, self._elements)
+        if len(stops) == 0:
+            return None
+
+        # The matrix of a pattern maps the gradient to the default coordinates of the page (independent of the current
+        # transformation).
+        matrix = _parse_transform(attributes.get("gradientTransform", ""))
+        if attributes.get("gradientUnits", "objectBoundingBox") == "objectBoundingBox":
+            if rect.width <= 0 or rect.height <= 0:
+                return None
+            matrix = matrix * fitz.Matrix(rect.width, 0, 0, rect.height, rect.x0, rect.y0)
+        matrix = matrix * ctm * self._base
+
+        if _tag(gradient) == "radialGradient":
+            cx, cy = _fraction(attributes.get("cx"), 0.5), _fraction(attributes.get("cy"), 0.5)
+            fx, fy = _fraction(attributes.get("fx"), cx), _fraction(attributes.get("fy"), cy)
+            coordinates = [fx, fy, 0, cx, cy, _fraction(attributes.get("r"), 0.5)]
+            shading = f"/ShadingType 3 /Coords [{_format_values(coordinates)}]"
+        else:
+            coordinates = [
+                _fraction(attributes.get("x1"), 0),
+                _fraction(attributes.get("y1"), 0),
+                _fraction(attributes.get("x2"), 1),
+                _fraction(attributes.get("y2"), 0),
+            ]
+            shading = f"/ShadingType 2 /Coords [{_format_values(coordinates)}]"
+
+        xref = self.resources.new_object(
+            f"<< /PatternType 2 /Matrix [{_format_matrix(matrix)}] /Shading << {shading} /ColorSpace /DeviceRGB "
+            f"/Function {_stops_function(stops)} /Extend [true true] >> >>"
+        )
+        name = f"Pv{len(self._page_resources['Pattern'])}"
+        self._page_resources["Pattern"][name] = xref
+        return name
+
+    def _graphics_state(self, fill_opacity: float, stroke_opacity: float) -> str:
+        name, xref = self.resources.graphics_state(fill_opacity, stroke_opacity)
+        if self._form_operations is not None:
+            self._form_resources[name] = xref
+        else:
+            self._page_resources["ExtGState"][name] = xref
+        return f"/{name} gs"
+
+    def _add_operations(self, operations: str):
+        if self._form_operations is not None:
+            self._form_operations.append(operations)
+        else:
+            self._operations.append(operations)
+
+    def _draw_text(self, element: ElementTree.Element, style: dict[str, str], ctm: fitz.Matrix):
+        runs: list[_TextRun] = []
+        self._collect_runs(element, style, runs, {}, None)
+        _collapse_whitespace(runs, element.get(_xml_space) == "preserve")
+
+        # Text chunks start at every absolute position, the text anchor of the first run applies to the whole chunk.
+        chunks: list[list[tuple[_TextRun, float, float, float]]] = []
+        x = y = 0.0
+        for run in runs:
+            font_size = _number(run.style.get("font-size"), 16.0)
+            position = run.position
+            if "x" in position or "y" in position or len(chunks) == 0:
+                chunks.append([])
+            x = _first_length(position.get("x"), x, font_size) + _first_length(position.get("dx"), 0.0, font_size)
+            y = _first_length(position.get("y"), y, font_size) + _first_length(position.get("dy"), 0.0, font_size)
+            width = _text_width(_font_name(run.style), run.text) * font_size
+            chunks[-1].append((run, x, y, width))
+            x += width
+
+        operations = [f"q {_format_matrix(ctm)} cm"]
+        for chunk in chunks:
+            chunk_width = sum(width for _, _, _, width in chunk)
+            anchor = chunk[0][0].style.get("text-anchor", "start")
+            shift = -chunk_width if anchor == "end" else -chunk_width / 2 if anchor == "middle" else 0.0
+            for run, run_x, run_y, width in chunk:
+                self._write_run(operations, run, run_x + shift, run_y, width, ctm)
+        if len(operations) > 1:
+            operations.append("Q")
+            self._add_operations(" ".join(operations))
+
+    def _collect_runs(
+        self,
+        element: ElementTree.Element,
+        style: dict[str, str],
+        runs: list[_TextRun],
+        position: dict[str, str],
+        link: str | None,
+    ):
+        for key in ("x", "y", "dx", "dy"):
+            if element.get(key) is not None:
+                position[key] = element.get(key)
+        if element.text:
+            runs.append(_TextRun(element.text, style, dict(position), link))
+            position.clear()
+
+        for child in element:
+            tag = _tag(child)
+            child_style = self._style(child, style)
+            if tag in ("tspan", "a") and child_style.get("display") != "none":
+                child_link = link
+                if tag == "a":
+                    href = child.get(_xlink_href, child.get("href"))
+                    child_link = href if href is not None and not href.startswith("#") else link
+                self._collect_runs(child, child_style, runs, position, child_link)
+            if child.tail:
+                runs.append(_TextRun(child.tail, style, dict(position), link))
+                position.clear()
+
+    def _write_run(self, operations: list[str], run: _TextRun, x: float, y: float, width: float, ctm: fitz.Matrix):
+        style = run.style
+        font_size = _number(style.get("font-size"), 16.0)
+        baseline = y + _baseline_shifts.get(style.get("dominant-baseline", "auto"), 0.0) * font_size
+
+        fill = style.get("fill", "black")
+        if fill != "none" and style.get("visibility") not in ("hidden", "collapse") and run.text.strip():
+            font_name = _font_name(style)
+            name, xref = self.resources.font(self._page, font_name)
+            self._page_resources["Font"][name] = xref
+
+            color = (0.0, 0.0, 0.0) if fill.startswith("url(") else _color(fill)
+            operations.append(f"{_format_color(color)} rg")
+            opacity = _number(style.get("opacity"), 1.0) * _number(style.get("fill-opacity"), 1.0)
+            if opacity < 1:
+                operations.append(self._graphics_state(opacity, 1.0))
+            # The text matrix flips the glyphs back upright (svg user units point downwards).
+            text_matrix = _format_values([font_size, 0, 0, -font_size, x, baseline])
+            operations.append(f"BT /{name} 1 Tf {text_matrix} Tm <{_glyphs(font_name, run.text)}> Tj ET")
+            if "underline" in style.get("text-decoration", ""):
+                underline = fitz.Rect(x, baseline + 0.07 * font_size, x + width, baseline + 0.143 * font_size)
+                operations.append(f"{_format_rect_path(underline)} f")
+            if opacity < 1:
+                operations.append(self._graphics_state(1.0, 1.0))
+
+        if run.link is not None:
+            rect = (x, baseline - 0.905 * font_size, x + width, baseline + 0.212 * font_size)
+            self._uri_links.append((tuple(fitz.Rect(rect) * ctm), run.link))
+
+    def _apply_resources(self):
+        kind, value = self.doc.xref_get_key(self._page.xref, "Resources")
+        if kind == "xref":
+            target, prefix = int(value.split()[0]), ""
+        else:
+            target, prefix = self._page.xref, "Resources/"
+        for category, entries in self._page_resources.items():
+            for name, xref in entries.items():
+                self.doc.xref_set_key(target, f"{prefix}{category}/{name}", f"{xref} 0 R")
+
+
+def _tag(element: ElementTree.Element) -> str:
+    return element.tag[len(_svg_namespace) :] if element.tag.startswith(_svg_namespace) else element.tag
+
+
+def _format(value: float) -> str:
+    formatted = f"{value:.4f}".rstrip("0").rstrip(".")
+    return "0" if formatted == "-0" else formatted
+
+
+def _format_values(values: list[float]) -> str:
+    return " ".join(_format(value) for value in values)
+
+
+def _format_matrix(matrix: fitz.Matrix) -> str:
+    return _format_values(list(matrix))
+
+
+def _format_rect(rect: fitz.Rect) -> str:
+    return _format_values([rect.x0, rect.y0, rect.x1, rect.y1])
+
+
+def _format_rect_path(rect: fitz.Rect) -> str:
+    return f"{_format_values([rect.x0, rect.y0, rect.width, rect.height])} re"
+
+
+def _format_color(color: tuple[float, float, float]) -> str:
+    return _format_values(list(color))
+
+
+def _number(value: str | None, default: float = 0.0) -> float:
+    if value is None:
+        return default
+    match = _number_pattern.search(value)
+    return float(match.group(0)) if match is not None else default
+
+
+def _length(value: str | None, default: float = 0.0) -> float:
+    if value is None or value.strip().endswith("%"):
+        return default
+    return _number(value, default)
+
+
+def _first_length(value: str | None, default: float, font_size: float) -> float:
+    if value is None or not value.strip():
+        return default
+    first = value.replace(",", " ").split()[0]
+    if first.endswith("em"):
+        return _number(first) * font_size
+    return _number(first, default)
+
+
+def _fraction(value: str | None, default: float) -> float:
+    if value is None:
+        return default
+    return _number(value) / 100 if value.strip().endswith("%") else _number(value, default)
+
+
+def _font_size(value: str, parent_style: dict[str, str]) -> float:
+    parent_size = _number(parent_style.get("font-size"), 16.0)
+    value = value.strip()
+    if value.endswith("em"):
+        return _number(value) * parent_size
+    if value.endswith("%"):
+        return _number(value) / 100 * parent_size
+    return _number(value, parent_size)
+
+
+def _parse_declarations(declarations: str) -> dict[str, str]:
+    properties: dict[str, str] = {}
+    for declaration in declarations.split(";"):
+        if ":" in declaration:
+            key, value = declaration.split(":", 1)
+            properties[key.strip()] = value.strip()
+    return properties
+
+
+@lru_cache(maxsize=256)
+def _color(value: str) -> tuple[float, float, float]:
+    value = value.strip()
+    if value.startswith("#"):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        return tuple(int(digits[i : i + 2], 16) / 255 for i in (0, 2, 4))
+    if value.startswith("rgb"):
+        components = value[value.index("(") + 1 : value.index(")")].split(",")
+        return tuple(
+            min(1.0, _number(component) / 100 if component.strip().endswith("%") else _number(component) / 255)
+            for component in components[:3]
+        )
+    if value.lower() in ("currentcolor", "inherit"):
+        return 0.0, 0.0, 0.0
+    return tuple(getColor(value.lower()))
+
+
+@lru_cache(maxsize=None)
+def _load_font(name: str) -> fitz.Font:
+    return fitz.Font(name)
+
+
+@lru_cache(maxsize=None)
+def _advance(font_name: str, character: str) -> float:
+    return _load_font(font_name).glyph_advance(ord(character))
+
+
+def _text_width(font_name: str, text: str) -> float:
+    """
+    Returns the width of a text (in em, without kerning).
+    """
+    return sum(_advance(font_name, character) for character in text)
+
+
+@lru_cache(maxsize=None)
+def _glyph(font_name: str, character: str) -> str:
+    return f"{_load_font(font_name).has_glyph(ord(character)):04x}"
+
+
+def _glyphs(font_name: str, text: str) -> str:
+    """
+    Returns a text as hexadecimal glyph ids (the encoding of the embedded Identity-H fonts).
+    """
+    return "".join(_glyph(font_name, character) for character in text)
+
+
+def _font_name(style: dict[str, str]) -> str:
+    weight = style.get("font-weight", "normal")
+    bold = weight in ("bold", "bolder") or (weight.isdigit() and int(weight) >= 600)
+    italic = style.get("font-style", "normal") in ("italic", "oblique")
+    return _font_names[(bold, italic)]
+
+
+def _collapse_whitespace(runs: list[_TextRun], preserve: bool):
+    """
+    Applies the white space handling of svg text (in place): tabs and new lines become spaces and, unless spaces are preserved,
+    consecutive spaces are collapsed and leading and trailing spaces of the whole text are removed.
+    """
+    if preserve:
+        for run in runs:
+            run.text = run.text.replace("\r", " ").replace("\n", " ").replace("\t", " ")
+        return
+
+    after_space = True
+    for run in runs:
+        text = _whitespace_pattern.sub(" ", run.text)
+        if after_space and text.startswith(" "):
+            text = text[1:]
+        if text:
+            after_space = text.endswith(" ")
+        run.text = text
+    for run in reversed(runs):
+        if run.text:
+            run.text = run.text.rstrip(" ")
+            if run.text:
+                break
+
+
+def _parse_transform(transform: str) -> fitz.Matrix:
+    matrix = fitz.Matrix(1, 1)
+    for name, arguments in _transform_pattern.findall(transform):
+        values = [float(value) for value in _number_pattern.findall(arguments)]
+        if name == "matrix" and len(values) == 6:
+            local = fitz.Matrix(*values)
+        elif name == "translate" and len(values) > 0:
+            local = fitz.Matrix(1, 0, 0, 1, values[0], values[1] if len(values) > 1 else 0)
+        elif name == "scale" and len(values) > 0:
+            local = fitz.Matrix(values[0], 0, 0, values[1] if len(values) > 1 else values[0], 0, 0)
+        elif name == "rotate" and len(values) > 0:
+            angle = radians(values[0])
+            local = fitz.Matrix(cos(angle), sin(angle), -sin(angle), cos(angle), 0, 0)
+            if len(values) == 3:
+                local = fitz.Matrix(1, 0, 0, 1, -values[1], -values[2]) * local * fitz.Matrix(1, 0, 0, 1, values[1], values[2])
+        elif name == "skewX" and len(values) > 0:
+            local = fitz.Matrix(1, 0, tan(radians(values[0])), 1, 0, 0)
+        elif name == "skewY" and len(values) > 0:
+            local = fitz.Matrix(1, tan(radians(values[0])), 0, 1, 0, 0)
+        else:
+            continue
+        # The right most transformation is applied first.
+        matrix = local * matrix
+    return matrix
+
+
+def _view_box(view_box: str) -> tuple[float, float, float, float]:
+    values = [float(value) for value in _number_pattern.findall(view_box)]
+    return (values[0], values[1], values[2], values[3]) if len(values) == 4 else (0.0, 0.0, 1.0, 1.0)
+
+
+def _view_box_matrix(view_box: str, width: float, height: float) -> fitz.Matrix:
+    """
+    Returns the transformation of a view box to a viewport (preserving the aspect ratio, centered).
+    """
+    x, y, view_width, view_height = _view_box(view_box)
+    if view_width <= 0 or view_height <= 0:
+        return fitz.Matrix(1, 1)
+    scale = min(width / view_width, height / view_height)
+    return fitz.Matrix(
+        scale,
+        0,
+        0,
+        scale,
+        (width - view_width * scale) / 2 - x * scale,
+        (height - view_height * scale) / 2 - y * scale,
+    )
+
+
+def _gradient_attributes(gradient: ElementTree.Element, elements: dict[str, ElementTree.Element]) -> dict[str, str]:
+    attributes: dict[str, str] = {}
+    while gradient is not None and len(attributes) < 100:
+        attributes = {**gradient.attrib, **attributes}
+        reference = gradient.get(_xlink_href, gradient.get("href"))
+        gradient = elements.get(reference.lstrip("#")) if reference is not None else None
+    return attributes
+
+
+def _gradient_stops(
+    gradient: ElementTree.Element, elements: dict[str, ElementTree.Element]
+) -> list[tuple[float, tuple[float, float, float]]]:
+    for _ in range(100):
+        stops: list[tuple[float, tuple[float, float, float]]] = []
+        for stop in gradient:
+            if _tag(stop) != "stop":
+                continue
+            properties = {**stop.attrib, **_parse_declarations(stop.get("style", ""))}
+            offset = min(1.0, max(0.0, _fraction(properties.get("offset"), 0.0)))
+            if len(stops) > 0:
+                offset = max(offset, stops[-1][0])
+            stops.append((offset, _color(properties.get("stop-color", "black"))))
+        reference = gradient.get(_xlink_href, gradient.get("href"))
+        if len(stops) > 0 or reference is None or reference.lstrip("#") not in elements:
+            return stops
+        gradient = elements[reference.lstrip("#")]
+    return []
+
+
+def _stops_function(stops: list[tuple[float, tuple[float, float, float]]]) -> str:
+    """
+    Returns the pdf function (a stitching function of linear interpolations) for the stops of a gradient.
+    """
+    stops = [(0.0, stops[0][1])] + stops + [(1.0, stops[-1][1])]
+    segments = [(stops[i], stops[i + 1]) for i in range(len(stops) - 1) if stops[i + 1][0] > stops[i][0]]
+    if len(segments) == 0:
+        segments = [((0.0, stops[-1][1]), (1.0, stops[-1][1]))]
+
+    functions = [
+        f"<< /FunctionType 2 /Domain [0 1] /C0 [{_format_color(start[1])}] /C1 [{_format_color(end[1])}] /N 1 >>"
+        for start, end in segments
+    ]
+    if len(functions) == 1:
+        return functions[0]
+    bounds = _format_values([start[0] for start, _ in segments[1:]])
+    encode = " ".join("0 1" for _ in segments)
+    return f"<< /FunctionType 3 /Domain [0 1] /Functions [{' '.join(functions)}] /Bounds [{bounds}] /Encode [{encode}] >>"
+
+
+def _operations_rect(operations: list[str]) -> fitz.Rect:
+    numbers = [float(value) for operation in operations for value in _number_pattern.findall(operation)]
+    if len(numbers) == 0:
+        return fitz.Rect(0, 0, 1, 1)
+    # A generous bounding box: all numbers in the operations bound the (local) coordinates of the shapes.
+    extent = max(abs(number) for number in numbers)
+    return fitz.Rect(-extent, -extent, extent, extent)
+
+
+def _shape(tag: str, element: ElementTree.Element) -> tuple[str, fitz.Rect] | None:
+    """
+    Returns the path operations and bounding box (both in user units) of a basic shape or path element.
+    """
+    if tag == "rect":
+        x, y = _length(element.get("x")), _length(element.get("y"))
+        width, height = _length(element.get("width")), _length(element.get("height"))
+        if width <= 0 or height <= 0:
+            return None
+        rx, ry = element.get("rx"), element.get("ry")
+        rx_value = _length(rx if rx is not None else ry)
+        ry_value = _length(ry if ry is not None else rx)
+        rx_value, ry_value = min(rx_value, width / 2), min(ry_value, height / 2)
+        if rx_value <= 0 or ry_value <= 0:
+            return f"{_format_values([x, y, width, height])} re", fitz.Rect(x, y, x + width, y + height)
+        return _path(
+            f"M{x + rx_value},{y} H{x + width - rx_value} A{rx_value},{ry_value} 0 0 1 {x + width},{y + ry_value} "
+            f"V{y + height - ry_value} A{rx_value},{ry_value} 0 0 1 {x + width - rx_value},{y + height} H{x + rx_value} "
+            f"A{rx_value},{ry_value} 0 0 1 {x},{y + height - ry_value} V{y + ry_value} A{rx_value},{ry_value} 0 0 1 "
+            f"{x + rx_value},{y} Z"
+        )
+    if tag in ("circle", "ellipse"):
+        cx, cy = _length(element.get("cx")), _length(element.get("cy"))
+        rx = _length(element.get("r") if tag == "circle" else element.get("rx"))
+        ry = _length(element.get("r") if tag == "circle" else element.get("ry"))
+        if rx <= 0 or ry <= 0:
+            return None
+        return _path(f"M{cx + rx},{cy} A{rx},{ry} 0 0 1 {cx - rx},{cy} A{rx},{ry} 0 0 1 {cx + rx},{cy} Z")
+    if tag == "line":
+        x1, y1 = _length(element.get("x1")), _length(element.get("y1"))
+        x2, y2 = _length(element.get("x2")), _length(element.get("y2"))
+        rect = fitz.Rect(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        return f"{_format(x1)} {_format(y1)} m {_format(x2)} {_format(y2)} l", rect
+    if tag in ("polygon", "polyline"):
+        values = _number_pattern.findall(element.get("points", ""))
+        if len(values) < 4:
+            return None
+        return _path("M" + " ".join(values) + (" Z" if tag == "polygon" else ""))
+    if tag == "path":
+        return _path(element.get("d", ""))
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _path(path_data: str) -> tuple[str, fitz.Rect] | None:
+    """
+    Returns the pdf path operations and the bounding box (of all points, including control points) of svg path data. Arcs and
+    quadratic curves are converted to cubic curves.
+    """
+    tokens = _path_token_pattern.findall(path_data)
+    operations: list[str] = []
+    points: list[tuple[float, float]] = []
+    i_token = 0
+    command = ""
+    x = y = start_x = start_y = 0.0
+    control: tuple[float, float] | None = None
+    previous_command = ""
+
+    def number() -> float:
+        nonlocal i_token
+        value = float(tokens[i_token])
+        i_token += 1
+        return value
+
+    def flag() -> bool:
+        # Arc flags may be written without separator ("a2 2 0 104 0").
+        nonlocal i_token
+        token = tokens[i_token]
+        if len(token) > 1:
+            tokens[i_token] = token[1:]
+        else:
+            i_token += 1
+        return token[0] == "1"
+
+    def move(to_x: float, to_y: float):
+        operations.append(f"{_format(to_x)} {_format(to_y)} m")
+        points.append((to_x, to_y))
+
+    def line(to_x: float, to_y: float):
+        operations.append(f"{_format(to_x)} {_format(to_y)} l")
+        points.append((to_x, to_y))
+
+    def curve(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float):
+        operations.append(f"{_format_values([x1, y1, x2, y2, x3, y3])} c")
+        points.extend([(x1, y1), (x2, y2), (x3, y3)])
+
+    try:
+        while i_token < len(tokens):
+            if tokens[i_token].isalpha():
+                command = tokens[i_token]
+                i_token += 1
+                if command in "Zz":
+                    operations.append("h")
+                    x, y = start_x, start_y
+                    previous_command, control = command, None
+                    continue
+            elif command == "":
+                return None
+
+            relative = command.islower()
+            offset_x, offset_y = (x, y) if relative else (0.0, 0.0)
+            upper = command.upper()
+            new_control: tuple[float, float] | None = None
+            if upper == "M":
+                x, y = offset_x + number(), offset_y + number()
+                move(x, y)
+                start_x, start_y = x, y
+                # Subsequent coordinate pairs are implicit line commands.
+                command = "l" if relative else "L"
+            elif upper == "L":
+                x, y = offset_x + number(), offset_y + number()
+                line(x, y)
+            elif upper == "H":
+                x = offset_x + number()
+                line(x, y)
+            elif upper == "V":
+                y = offset_y + number()
+                line(x, y)
+            elif upper in "CS":
+                if upper == "C":
+                    x1, y1 = offset_x + number(), offset_y + number()
+                elif control is not None and previous_command.upper() in "CS":
+                    x1, y1 = 2 * x - control[0], 2 * y - control[1]
+                else:
+                    x1, y1 = x, y
+                x2, y2 = offset_x + number(), offset_y + number()
+                x3, y3 = offset_x + number(), offset_y + number()
+                curve(x1, y1, x2, y2, x3, y3)
+                new_control = (x2, y2)
+                x, y = x3, y3
+            elif upper in "QT":
+                if upper == "Q":
+                    qx, qy = offset_x + number(), offset_y + number()
+                elif control is not None and previous_command.upper() in "QT":
+                    qx, qy = 2 * x - control[0], 2 * y - control[1]
+                else:
+                    qx, qy = x, y
+                x3, y3 = offset_x + number(), offset_y + number()
+                curve(x + 2 / 3 * (qx - x), y + 2 / 3 * (qy - y), x3 + 2 / 3 * (qx - x3), y3 + 2 / 3 * (qy - y3), x3, y3)
+                new_control = (qx, qy)
+                x, y = x3, y3
+            elif upper == "A":
+                rx, ry, angle = number(), number(), number()
+                large_arc, sweep = flag(), flag()
+                x3, y3 = offset_x + number(), offset_y + number()
+                arc = _arc_curves(x, y, rx, ry, angle, large_arc, sweep, x3, y3)
+                if arc is None:
+                    line(x3, y3)
+                for segment in arc or []:
+                    curve(*segment)
+                x, y = x3, y3
+            else:
+                return None
+            previous_command, control = command, new_control
+    except (IndexError, ValueError):
+        # Like browsers, render the path up to the first error.
+        pass
+
+    if len(points) == 0:
+        return None
+    xs, ys = [point[0] for point in points], [point[1] for point in points]
+    return " ".join(operations), fitz.Rect(min(xs), min(ys), max(xs), max(ys))
+
+
+def _arc_curves(
+    x1: float, y1: float, rx: float, ry: float, angle: float, large_arc: bool, sweep: bool, x2: float, y2: float
+) -> list[tuple[float, float, float, float, float, float]] | None:
+    """
+    Returns the cubic curves that approximate an elliptical arc (svg endpoint parametrization), or None if the arc is a straight
+    line.
+    """
+    if (x1, y1) == (x2, y2):
+        return []
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return None
+
+    phi = radians(angle)
+    cos_phi, sin_phi = cos(phi), sin(phi)
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1_prime = cos_phi * dx + sin_phi * dy
+    y1_prime = -sin_phi * dx + cos_phi * dy
+    radii_check = x1_prime**2 / rx**2 + y1_prime**2 / ry**2
+    if radii_check > 1:
+        rx, ry = rx * sqrt(radii_check), ry * sqrt(radii_check)
+
+    numerator = rx**2 * ry**2 - rx**2 * y1_prime**2 - ry**2 * x1_prime**2
+    denominator = rx**2 * y1_prime**2 + ry**2 * x1_prime**2
+    coefficient = sqrt(max(0.0, numerator / denominator)) if denominator > 0 else 0.0
+    if large_arc == sweep:
+        coefficient = -coefficient
+    cx_prime = coefficient * rx * y1_prime / ry
+    cy_prime = -coefficient * ry * x1_prime / rx
+    cx = cos_phi * cx_prime - sin_phi * cy_prime + (x1 + x2) / 2
+    cy = sin_phi * cx_prime + cos_phi * cy_prime + (y1 + y2) / 2
+
+    def vector_angle(ux: float, uy: float, vx: float, vy: float) -> float:
+        return atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    start_x, start_y = (x1_prime - cx_prime) / rx, (y1_prime - cy_prime) / ry
+    end_x, end_y = (-x1_prime - cx_prime) / rx, (-y1_prime - cy_prime) / ry
+    theta = vector_angle(1, 0, start_x, start_y)
+    delta = vector_angle(start_x, start_y, end_x, end_y)
+    if not sweep and delta > 0:
+        delta -= 2 * pi
+    elif sweep and delta < 0:
+        delta += 2 * pi
+
+    n_segments = max(1, ceil(abs(delta) / (pi / 2) - 1e-9))
+    step = delta / n_segments
+    handle = 4 / 3 * tan(step / 4)
+
+    def point(unit_x: float, unit_y: float) -> tuple[float, float]:
+        return cx + rx * unit_x * cos_phi - ry * unit_y * sin_phi, cy + rx * unit_x * sin_phi + ry * unit_y * cos_phi
+
+    curves: list[tuple[float, float, float, float, float, float]] = []
+    for i_segment in range(n_segments):
+        angle1 = theta + i_segment * step
+        angle2 = angle1 + step
+        control1 = point(cos(angle1) - handle * sin(angle1), sin(angle1) + handle * cos(angle1))
+        control2 = point(cos(angle2) + handle * sin(angle2), sin(angle2) - handle * cos(angle2))
+        end = point(cos(angle2), sin(angle2))
+        curves.append((*control1, *control2, *end))
+    return curves
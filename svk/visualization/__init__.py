@@ -22,13 +22,16 @@ from .documents._document import CustomPagesDocument, ResearchQuestionsDocument
 from .documents._knowledge_calendar_document import KnowledgeCalendarDocument
 from .documents._impact_pathway_document import ImpactPathwayDocument
 from .documents._lifetime_analysis_document import LifeTimeAnalysDocument
+from .documents._layout_report import LayoutReport
 
 from .pages._time_line_overview_page import TimeLineOverviewPage
 from .pages._question_details_page import QuestionDetailsPage
 from .pages._lifetime_analysis_page import LifeTimeAnalysisPage
 
-from ._layout_configuration import LayoutConfiguration
+from ._layout_configuration import LayoutConfiguration, LayoutContext
+from .helpers._text_styles import TextStyle
 
+from .elements._render_context import RenderContext
 from .elements._column import Column
 from .elements._cluster import Cluster
 from .elements._group import Group
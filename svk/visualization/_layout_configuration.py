@@ -18,7 +18,11 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydantic import BaseModel
+from functools import cached_property
+from typing import Any
+from pydantic import BaseModel, ConfigDict
+from svk.visualization.helpers._text_styles import TextStyle
+from svk.visualization.helpers._page_chrome import PageChrome
 
 
 class LayoutConfiguration(BaseModel):
@@ -50,6 +54,8 @@ class LayoutConfiguration(BaseModel):
 
     n_columns: int = 3
     details_page_width: float = 1500.0
+    details_page_max_height: float | None = None
+    """Maximum height of a question details page. Questions that do not fit are moved to continuation pages (None: no limit)."""
     summary_question_lines_width: float = 535.0
     priority_arrow_width: float = 15.0
     question_id_box_width: float = 40.0
@@ -62,6 +68,28 @@ class LayoutConfiguration(BaseModel):
     cluster_colors: dict[int, tuple[int, int, int]] = {}
     """A dictionary with group colors."""
 
+    text_style_classes: bool = True
+    """Write the text styles as one style sheet per page and refer to them by class (instead of repeating font attributes)."""
+
+    batch_primitives: bool = True
+    """Write the separator lines and priority dots of a page as one path per style (instead of an element per line or dot)."""
+
+    @property
+    def text_styles(self) -> dict[str, TextStyle]:
+        """The named text styles (title, column header, group title, body and disclaimer), derived from the font sizes."""
+        return {
+            text_style.name: text_style
+            for text_style in [
+                TextStyle(name="title", font_size=self.page_title_font_size, font_weight="bold"),
+                TextStyle(name="column-header", font_size=self.column_header_font_size, font_weight="bold"),
+                TextStyle(name="column-subheader", font_size=self.column_header_font_size),
+                TextStyle(name="group-title", font_size=self.group_title_font_size, font_weight="bold"),
+                TextStyle(name="body", font_size=self.font_size),
+                TextStyle(name="body-italic", font_size=self.font_size, font_style="italic"),
+                TextStyle(name="disclaimer", font_size=self.disclamer_font_size, font_family=None),
+            ]
+        }
+
     @property
     def overview_page_width(self) -> float:
         return 2 * self.paper_margin + self.n_columns * self.column_width
@@ -77,3 +105,47 @@ class LayoutConfiguration(BaseModel):
             + 2 * self.arrow_depth
             + 2 * self.intermediate_margin
         )
+
+    def create_context(self, **changes: Any) -> "LayoutContext":
+        """
+        Creates a frozen copy of this configuration (with optional changes) to use while building a single document or page.
+
+        :param changes: Values that differ from this configuration (for example question_id_box_width or n_columns).
+        :type changes: Any
+        :return: The layout context.
+        :rtype: LayoutContext
+        """
+        return LayoutContext.model_construct(**{**dict(self), **changes})
+
+
+class LayoutContext(LayoutConfiguration):
+    """
+    Frozen layout configuration that is created once per document build (and per page when a page needs different values).
+    Nothing changes it while building, so documents that share a layout configuration can be built in parallel threads. Derived
+    sizes are computed only once.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def overview_page_width(self) -> float:
+        return 2 * self.paper_margin + self.n_columns * self.column_width
+
+    @cached_property
+    def column_width(self) -> float:
+        return LayoutConfiguration.column_width.fget(self)  # type: ignore
+
+    @cached_property
+    def text_styles(self) -> dict[str, TextStyle]:
+        return LayoutConfiguration.text_styles.fget(self)  # type: ignore
+
+    @cached_property
+    def page_chrome(self) -> PageChrome:
+        """The cache of the chrome (title callout and disclaimer) that is shared by all pages of a build."""
+        return PageChrome()
+
+    def create_context(self, **changes: Any) -> "LayoutContext":
+        context = super().create_context(**changes)
+        # Pages that need a context of their own still share the page chrome of the document.
+        context.__dict__["page_chrome"] = self.page_chrome
+        return context
@@ -18,19 +18,31 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-import os, re
-from pydantic import BaseModel
+import asyncio, os
+from contextlib import nullcontext
+from pydantic import BaseModel, PrivateAttr
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from svk.data import ResearchQuestion, LinksRegister, ResearchLine, Translator, TimeFrame, Label
-from svk.io import svg_to_pdf_chrome, merge_pdf_files, add_links
+from svk.io import (
+    AsyncChromiumPdfConverter,
+    ChromiumPdfConverter,
+    PdfConverter,
+    merge_pdf_bytes,
+    insert_links,
+    SvgCompaction,
+    VectorPdfRenderer,
+)
 from svk.visualization.helpers import _calendar_helper as helper
-from svk.visualization._layout_configuration import LayoutConfiguration
+from svk.visualization.helpers._text_layout_cache import use_text_layout_cache
+from svk.visualization._layout_configuration import LayoutConfiguration, LayoutContext
 from svk.visualization.pages._time_line_overview_page import TimeLineOverviewPage
 from svk.visualization.pages._question_details_page import QuestionDetailsPage
 from svk.visualization.elements._question_details import QuestionDetailsElement
 from svk.visualization.pages._page import Page
+from svk.visualization.documents._layout_report import LayoutReport
 from svk.visualization.elements._column import Column
+from svk.visualization.elements._render_context import RenderContext
 
 
 class Document(BaseModel, ABC):
@@ -43,49 +55,185 @@ class Document(BaseModel, ABC):
     disclaimer: str | None = None
     disclaimer_links: list[tuple[str, str]] | None = None
     cleanup: bool = True
-    """When set to false, intermediate files are left in the output dir."""
-    _str_table = str.maketrans({".": "-", " ": "-"})
+    """Deprecated: has no effect, builds assemble the pdf in memory and write no intermediate files."""
+    text_layout_cache_file: str | None = None
+    """Optional path of a persistent cache of text sizes and wrapped lines that is reused by subsequent builds."""
+    streaming_svg: bool = False
+    """When set to true, pages are written with the streaming svg writer instead of building an svgwrite DOM."""
+    svg_compaction: SvgCompaction | None = SvgCompaction()
+    """Compaction of the svg of each page before it is converted to pdf (None to convert the svg as drawn)."""
+    pdf_concurrency: int = 1
+    """The number of pages that are converted to pdf at the same time (in separate browser pages of the same browser). Only
+    applies to the default Chromium converter: it cannot be combined with a converter passed to build, single_print or
+    vector_pdf. Like the default converter, it runs its own event loop, so build cannot be called from a running event loop
+    (call it from a worker thread instead, e.g. with asyncio.to_thread)."""
+    single_print: bool = False
+    """Print all pages at once from a single html document (with a page size per page), instead of a pdf per page that
+    are merged afterwards. Has no effect with vector_pdf (which always renders a single document)."""
+    vector_pdf: VectorPdfRenderer | None = None
+    """Render the pages to pdf natively (without a browser) with this renderer, instead of printing them with Chromium. It
+    cannot be combined with a converter passed to build."""
+    _layout_context: LayoutContext | None = PrivateAttr(default=None)
+    _svg_bytes_saved: dict[int, int] = PrivateAttr(default_factory=dict)
+
+    @property
+    def svg_bytes_saved(self) -> dict[int, int]:
+        """
+        The number of bytes saved by svg compaction per page number during the last build.
+        """
+        return self._svg_bytes_saved
+
+    @property
+    def layout_context(self) -> LayoutContext:
+        """
+        The frozen layout context used by all pages and elements of the current build (derived from layout_configuration).
+        """
+        if self._layout_context is None:
+            self._layout_context = self.create_layout_context()
+        return self._layout_context
+
+    @property
+    def render_context(self) -> RenderContext:
+        """
+        The layout context, links register and translator shared by all elements of the current build.
+        """
+        return RenderContext(self.layout_context, self.links_register, self.translator)
+
+    def create_layout_context(self) -> LayoutContext:
+        """
+        Creates the layout context for a build of this document. The layout configuration itself is never changed.
+
+        :return: The layout context.
+        :rtype: LayoutContext
+        """
+        return self.layout_configuration.create_context()
 
     @abstractmethod
     def create_pages(self) -> list[Page]:
         return []
 
-    def build(self):
-        self.pages = self.create_pages()
+    def build(self, converter: PdfConverter | None = None):
+        """
+        Creates all pages, converts them to pdf and merges them into a single pdf (with links) in the output dir. The pages are
+        merged in memory, the pdf file is the only file that is written. When vector_pdf is set, the pages are rendered to a
+        single pdf directly (no browser).
+
+        :param converter: The converter to use for this build (e.g. a ChromiumPdfConverter that is shared by a batch of builds, or
+            an in-process CairoSvgPdfConverter). A Chromium converter is started (and closed) for this build when not specified
+            (converting pdf_concurrency pages at a time).
+        :type converter: PdfConverter | None
+        :raises ValueError: When options are combined that exclude each other: a converter with vector_pdf or pdf_concurrency,
+            or pdf_concurrency with single_print or vector_pdf. Also when the pages would be converted by the default Chromium
+            converter from a running event loop.
+        :return: The path of the pdf file.
+        :rtype: str
+        """
+        self._check_build_options(converter)
+        if self.vector_pdf is not None:
+            return self._render_vector_pdf()
+
+        # Pages are passed as pdf bytes and merged in memory, only the final pdf is written.
+        with use_text_layout_cache(self.text_layout_cache_file):
+            self.pages = self.create_pages()
+
+            if self.pdf_concurrency > 1:
+                pdfs = asyncio.run(self._convert_pages_to_pdf_concurrently())
+            else:
+                with ChromiumPdfConverter() if converter is None else nullcontext(converter) as build_converter:
+                    if self.single_print:
+                        pdfs = [self._print_pages_to_pdf(build_converter)]
+                    else:
+                        pdfs = self._convert_pages_to_pdf(build_converter)
 
-        all_files = self._convert_pages_to_pdf()
+        output_file_final = os.path.join(self.output_dir, self.output_file + ".pdf")
+        with merge_pdf_bytes(pdfs) as doc:
+            # TODO: This assumes all page numbers are correct.
+            insert_links(doc, self.links_register)
+            doc.save(output_file_final, garbage=3, deflate=True)
 
-        no_links_output_file = os.path.join(self.output_dir, self.output_file + " - no links.pdf")
-        merge_pdf_files(all_files, no_links_output_file)
+        return output_file_final
 
-        # TODO: This assumes all page numbers are correct.
+    def layout(self) -> LayoutReport:
+        """
+        Dry run of build: creates, lays out and draws all pages (in memory), without converting them to pdf. No browser or pdf
+        backend is needed. The links register is left as it was.
+
+        :return: A report with the page sizes, element counts, registered links and link targets and dangling link ids.
+        :rtype: LayoutReport
+        """
+        links_register_state = self.links_register.model_copy(deep=True)
+        with use_text_layout_cache(self.text_layout_cache_file):
+            self.pages = self.create_pages()
+            for page in self.pages:
+                page.draw()
+
+        report = LayoutReport.from_pages(self.pages, self.links_register)
+        self.links_register.links = links_register_state.links
+        self.links_register.link_targets = links_register_state.link_targets
+        self.links_register.page_sizes = links_register_state.page_sizes
+        return report
+
+    def _check_build_options(self, converter: PdfConverter | None):
+        if converter is None and self.vector_pdf is None and _event_loop_is_running():
+            raise ValueError(
+                "The default Chromium converter (and pdf_concurrency) cannot be used from a running event loop: call build from a "
+                "worker thread (e.g. with asyncio.to_thread), or use vector_pdf."
+            )
+        if converter is not None and self.vector_pdf is not None:
+            raise ValueError("A converter cannot be used when the pages are rendered with vector_pdf.")
+        if self.pdf_concurrency > 1:
+            if converter is not None:
+                raise ValueError("pdf_concurrency only applies to the default converter, not to a converter passed to build.")
+            if self.single_print:
+                raise ValueError("pdf_concurrency cannot be combined with single_print (all pages are printed at once).")
+            if self.vector_pdf is not None:
+                raise ValueError("pdf_concurrency cannot be combined with vector_pdf (pages are not converted by a browser).")
+
+    def _render_vector_pdf(self) -> str:
         output_file_final = os.path.join(self.output_dir, self.output_file + ".pdf")
-        add_links(no_links_output_file, output_file_final, self.links_register)
-
-        if self.cleanup:
-            for file in all_files:
-                if os.path.exists(file):
-                    os.remove(file)
-            if os.path.exists(no_links_output_file):
-                os.remove(no_links_output_file)
+        with use_text_layout_cache(self.text_layout_cache_file):
+            self.pages = self.create_pages()
+            drawings = [page.draw(streaming=self.streaming_svg) for page in sorted(self.pages, key=lambda p: p.page_number)]
+            self.vector_pdf.render(drawings, output_file_final, self.links_register)
 
+        self._svg_bytes_saved = {}
         return output_file_final
 
-    def _convert_pages_to_pdf(self) -> list[str]:
-        pages_file_paths: list[str] = []
+    def _convert_pages_to_pdf(self, converter: PdfConverter) -> list[bytes]:
+        pdfs: list[bytes] = []
+        self._svg_bytes_saved = {}
         for page in sorted(self.pages, key=lambda p: p.page_number):
-            safe_title = re.sub(r'[\\/**?:"<>|/]', "_", page.title.translate(self._str_table))
-            target_path = os.path.join(self.output_dir, f"{self.output_file} - {safe_title}.pdf")
-            svg_to_pdf_chrome(svg_dwg=page.draw(), pdf_path=target_path)
-            pages_file_paths.append(target_path)
+            pdf, self._svg_bytes_saved[page.page_number] = converter.convert_to_bytes(
+                svg_dwg=page.draw(streaming=self.streaming_svg), compaction=self.svg_compaction
+            )
+            pdfs.append(pdf)
+
+        return pdfs
+
+    def _print_pages_to_pdf(self, converter: PdfConverter) -> bytes:
+        pages = sorted(self.pages, key=lambda p: p.page_number)
+        pdf, bytes_saved = converter.convert_document_to_bytes(
+            [page.draw(streaming=self.streaming_svg) for page in pages], compaction=self.svg_compaction
+        )
+        self._svg_bytes_saved = {page.page_number: page_bytes_saved for page, page_bytes_saved in zip(pages, bytes_saved)}
+        return pdf
 
-        return pages_file_paths
+    async def _convert_pages_to_pdf_concurrently(self) -> list[bytes]:
+        # All pages are drawn first (in page order), only the conversion by the browser runs concurrently.
+        pages = sorted(self.pages, key=lambda p: p.page_number)
+        drawings = [page.draw(streaming=self.streaming_svg) for page in pages]
+        async with AsyncChromiumPdfConverter(max_concurrency=self.pdf_concurrency) as converter:
+            conversions = await converter.convert_all_to_bytes(drawings, compaction=self.svg_compaction)
+
+        self._svg_bytes_saved = {page.page_number: bytes_saved for page, (_, bytes_saved) in zip(pages, conversions)}
+        return [pdf for pdf, _ in conversions]
 
 
 class ResearchQuestionsDocument(Document):
     questions: list[ResearchQuestion]
 
     def create_pages(self) -> list[Page]:
+        self._layout_context = self.create_layout_context()
         return self.create_detailes_pages(current_page_number=1)
 
     def create_detailes_pages(self, current_page_number: int) -> list[Page]:
@@ -100,7 +248,7 @@ class ResearchQuestionsDocument(Document):
                 grouped_questions[question.research_line_primary].append(question)
 
         for research_line in sorted(grouped_questions, key=lambda r_l: r_l.number):
-            pages.append(
+            new_pages = self._paginate(
                 self.create_details_page(
                     page_number=current_page_number,
                     title=str(research_line.number) + ". " + self.translator.get_label(research_line.title),
@@ -108,25 +256,26 @@ class ResearchQuestionsDocument(Document):
                     questions=grouped_questions[research_line],
                 )
             )
-            current_page_number += 1
+            pages.extend(new_pages)
+            current_page_number += len(new_pages)
 
         if len(non_grouped) > 0:
-            pages.append(
-                self.create_details_page(
-                    page_number=current_page_number,
-                    title=self.translator.get_label(Label.D_NoResearchLine),
-                    link_target="",
-                    questions=non_grouped,
+            pages.extend(
+                self._paginate(
+                    self.create_details_page(
+                        page_number=current_page_number,
+                        title=self.translator.get_label(Label.D_NoResearchLine),
+                        link_target="",
+                        questions=non_grouped,
+                    )
                 )
             )
 
         return pages
 
     def add_time_frame_column(self, fig: TimeLineOverviewPage, time_frame: TimeFrame, number: int):
-        column = Column(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        column = Column.create(
+            self.render_context,
             header_title=self.translator.get_label(time_frame.description),
             header_subtitle=helper.get_subtitle(time_frame),
             header_color=helper.get_header_color(time_frame),
@@ -146,18 +295,16 @@ class ResearchQuestionsDocument(Document):
             page_number=page_number,
             title=title,
             title_link_target=link_target,
-            layout_configuration=self.layout_configuration,
+            layout_configuration=self.layout_context,
             links_register=self.links_register,
             translator=self.translator,
             disclaimer=self.disclaimer,
             disclaimer_links=self.disclaimer_links,
         )
         for question in sorted(questions, key=lambda q: q.id):
-            dwg_details_page.questions.append(
-                QuestionDetailsElement(
-                    layout_configuration=self.layout_configuration,
-                    links_register=self.links_register,
-                    translator=self.translator,
+            dwg_details_page.add_question(
+                QuestionDetailsElement.create(
+                    self.render_context,
                     research_question=question,
                     page_number=page_number,
                 )
@@ -165,9 +312,23 @@ class ResearchQuestionsDocument(Document):
 
         return dwg_details_page
 
+    def _paginate(self, page: Page) -> list[Page]:
+        max_height = self.layout_context.details_page_max_height
+        if max_height is None or not isinstance(page, QuestionDetailsPage):
+            return [page]
+        return list(page.paginate(max_height))
+
 
 class CustomPagesDocument(Document):
     custom_pages: list[Page] = []
 
     def create_pages(self):
         return self.custom_pages
+
+
+def _event_loop_is_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
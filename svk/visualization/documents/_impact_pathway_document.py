@@ -22,8 +22,9 @@ from collections import defaultdict
 from typing import cast
 from svk.data import ImpactPathwayResearchQuestion, StormSurgeBarrier, TimeFrame, ResearchLine, ImpactCategory, Translator
 from svk.visualization.pages._page import Page
+from svk.visualization._layout_configuration import LayoutContext
 from svk.visualization.helpers import _calendar_helper as helper
-from svk.visualization.helpers._measuretext import measure_text
+from svk.visualization.helpers._measuretext import measure_texts
 from svk.visualization.helpers._greyfraction import color_toward_grey
 from svk.visualization.pages._time_line_overview_page import TimeLineOverviewPage
 from svk.visualization.elements._column import Column
@@ -44,7 +45,14 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
     ]
     translator: Translator = Translator(lang="en")
 
+    def create_layout_context(self) -> LayoutContext:
+        return self.layout_configuration.create_context(
+            question_id_box_width=float(measure_texts([q.id for q in self.questions], self.layout_configuration.font_size)[0].max())
+            + 2 * self.layout_configuration.small_margin
+        )
+
     def create_pages(self) -> list[Page]:
+        self._layout_context = self.create_layout_context()
         return [self._create_overview_page(page_number=0), self._create_impact_overview_page(page_number=1)] + self.create_detailes_pages(
             current_page_number=2
         )
@@ -53,15 +61,10 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
         self,
         page_number: int,
     ) -> TimeLineOverviewPage:
-        self.layout_configuration.question_id_box_width = (
-            max([measure_text(q.id, self.layout_configuration.font_size)[0] for q in self.questions])
-            + 2 * self.layout_configuration.small_margin
-        )
-
         fig = TimeLineOverviewPage(
             page_number=page_number,
             title="SSB-∆ Impact Pathway",
-            layout_configuration=self.layout_configuration,
+            layout_configuration=self.layout_context,
             links_register=self.links_register,
             translator=self.translator,
             icon=StormSurgeBarrier.All,
@@ -72,10 +75,8 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
         self.add_time_frame_column(fig=fig, time_frame=TimeFrame.NearFuture, number=0)
         self.add_time_frame_column(fig=fig, time_frame=TimeFrame.Future, number=1)
         fig.columns.append(
-            Column(
-                layout_configuration=self.layout_configuration,
-                links_register=self.links_register,
-                translator=self.translator,
+            Column.create(
+                self.render_context,
                 header_title="",
                 header_subtitle="",
                 header_color="",
@@ -87,6 +88,12 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
             fig=fig, questions=cast(list[ImpactPathwayResearchQuestion], self.questions), page_number=page_number
         )
 
+        # The width of the overview page (and its clusters) depends on the number of columns.
+        page_context = self.layout_context.create_context(n_columns=len(fig.columns))
+        fig.layout_configuration = page_context
+        for cluster in fig.clusters:
+            cluster.layout_configuration = page_context
+
         return fig
 
     def add_clusters_per_impact_group(self, fig: TimeLineOverviewPage, questions: list[ImpactPathwayResearchQuestion], page_number: int):
@@ -113,30 +120,24 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
             current_research_line = questions_list_key[2]
 
             if current_impact_category.number not in clusters:
-                clusters[current_impact_category.number] = Cluster(
-                    layout_configuration=self.layout_configuration,
-                    links_register=self.links_register,
-                    translator=self.translator,
+                clusters[current_impact_category.number] = Cluster.create(
+                    self.render_context,
                     color=(180, 180, 180),
                 )
 
             cluster = clusters[current_impact_category.number]
 
-            new_group = Group(
-                layout_configuration=self.layout_configuration,
-                links_register=self.links_register,
-                translator=self.translator,
+            new_group = Group.create(
+                self.render_context,
                 title=self.translator.get_label(current_research_line.title),
                 color=color_toward_grey(current_research_line.base_color, current_time_frame.grey_fraction),
             )
 
-            cluster.groups[time_frame_column_numbers[current_time_frame]].append(new_group)
+            cluster.add_group(time_frame_column_numbers[current_time_frame], new_group)
             for question in sorted(grouped_quenstions_lists[questions_list_key], key=lambda q: q.priority, reverse=True):
-                new_group.questions.append(
-                    QuestionSummaryElement(
-                        layout_configuration=self.layout_configuration,
-                        links_register=self.links_register,
-                        translator=self.translator,
+                new_group.add_question(
+                    QuestionSummaryElement.create(
+                        self.render_context,
                         research_question=question,
                         page_number=page_number,
                         show_priority=False,
@@ -150,11 +151,10 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
             ImpactCategory.HumanCapical,
             ImpactCategory.Example,
         ]:
-            clusters[category.number].groups[2].append(
-                PlainTextGroup(
-                    layout_configuration=self.layout_configuration,
-                    links_register=self.links_register,
-                    translator=self.translator,
+            clusters[category.number].add_group(
+                2,
+                PlainTextGroup.create(
+                    self.render_context,
                     text=category.description,
                 )
             )
@@ -165,15 +165,10 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
         self,
         page_number: int,
     ) -> TimeLineOverviewPage:
-        self.layout_configuration.question_id_box_width = (
-            max([measure_text(q.id, self.layout_configuration.font_size)[0] for q in self.questions])
-            + 2 * self.layout_configuration.small_margin
-        )
-
         fig = TimeLineOverviewPage(
             page_number=page_number,
             title="Research agenda SSB-∆",
-            layout_configuration=self.layout_configuration,
+            layout_configuration=self.layout_context,
             links_register=self.links_register,
             translator=self.translator,
             icon=StormSurgeBarrier.All,
@@ -186,6 +181,12 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
         self.add_clusters_per_research_line(
             fig=fig, questions=cast(list[ImpactPathwayResearchQuestion], self.questions), page_number=page_number
         )
+
+        # The width of the overview page (and its clusters) depends on the number of columns.
+        page_context = self.layout_context.create_context(n_columns=len(fig.columns))
+        fig.layout_configuration = page_context
+        for cluster in fig.clusters:
+            cluster.layout_configuration = page_context
         return fig
 
     def add_clusters_per_research_line(self, fig: TimeLineOverviewPage, questions: list[ImpactPathwayResearchQuestion], page_number: int):
@@ -209,30 +210,24 @@ class ImpactPathwayDocument(ResearchQuestionsDocument):
             current_research_line = questions_list_key[1]
 
             if current_research_line.cluster not in clusters:
-                clusters[current_research_line.cluster] = Cluster(
-                    layout_configuration=self.layout_configuration,
-                    links_register=self.links_register,
-                    translator=self.translator,
+                clusters[current_research_line.cluster] = Cluster.create(
+                    self.render_context,
                     color=current_research_line.base_color,
                 )
 
             cluster = clusters[current_research_line.cluster]
 
-            new_group = Group(
-                layout_configuration=self.layout_configuration,
-                links_register=self.links_register,
-                translator=self.translator,
+            new_group = Group.create(
+                self.render_context,
                 title=self.translator.get_label(current_research_line.title),
                 color=color_toward_grey(current_research_line.base_color, current_time_frame.grey_fraction),
             )
 
-            cluster.groups[time_frame_column_numbers[current_time_frame]].append(new_group)
+            cluster.add_group(time_frame_column_numbers[current_time_frame], new_group)
             for question in sorted(grouped_quenstions_lists[questions_list_key], key=lambda q: q.priority, reverse=True):
-                new_group.questions.append(
-                    QuestionSummaryElement(
-                        layout_configuration=self.layout_configuration,
-                        links_register=self.links_register,
-                        translator=self.translator,
+                new_group.add_question(
+                    QuestionSummaryElement.create(
+                        self.render_context,
                         research_question=question,
                         page_number=page_number,
                         show_priority=False,
@@ -22,7 +22,8 @@ from collections import defaultdict
 from typing import DefaultDict
 
 from svk.data import ResearchQuestion, StormSurgeBarrier, TimeFrame, ResearchLine
-from svk.visualization.helpers._measuretext import measure_text
+from svk.visualization._layout_configuration import LayoutContext
+from svk.visualization.helpers._measuretext import measure_texts
 from svk.visualization.helpers._greyfraction import color_toward_grey
 from svk.visualization.helpers import _calendar_helper as helper
 from svk.visualization.pages._time_line_overview_page import TimeLineOverviewPage
@@ -45,7 +46,14 @@ class KnowledgeCalendarDocument(ResearchQuestionsDocument):
         ("Marit de Jong", "mailto:marit.de.jong@rws.nl"),
     ]
 
+    def create_layout_context(self) -> LayoutContext:
+        return self.layout_configuration.create_context(
+            question_id_box_width=float(measure_texts([q.id for q in self.questions], self.layout_configuration.font_size)[0].max())
+            + 2 * self.layout_configuration.small_margin
+        )
+
     def create_pages(self) -> list[Page]:
+        self._layout_context = self.create_layout_context()
         return [self._create_overview_page(page_number=0)] + self.create_detailes_pages(current_page_number=1)
 
     def _create_overview_page(
@@ -57,15 +65,10 @@ class KnowledgeCalendarDocument(ResearchQuestionsDocument):
         for q in self.questions:
             time_groups[q.time_frame].append(q)
 
-        self.layout_configuration.question_id_box_width = (
-            max([measure_text(q.id, self.layout_configuration.font_size)[0] for q in self.questions])
-            + 2 * self.layout_configuration.small_margin
-        )
-
         fig = TimeLineOverviewPage(
             page_number=page_number,
             title=self.translator.get_label(self.storm_surge_barrier.title),
-            layout_configuration=self.layout_configuration,
+            layout_configuration=self.layout_context,
             links_register=self.links_register,
             translator=self.translator,
             icon=self.storm_surge_barrier,
@@ -76,13 +79,17 @@ class KnowledgeCalendarDocument(ResearchQuestionsDocument):
         self.add_time_frame_column(fig=fig, questions=time_groups[TimeFrame.NearFuture], time_frame=TimeFrame.NearFuture, number=1)
         self.add_time_frame_column(fig=fig, questions=time_groups[TimeFrame.Future], time_frame=TimeFrame.Future, number=2)
         fig.clusters = list(self._clusters.values())
+
+        # The width of the overview page (and its clusters) depends on the number of columns.
+        page_context = self.layout_context.create_context(n_columns=len(fig.columns))
+        fig.layout_configuration = page_context
+        for cluster in fig.clusters:
+            cluster.layout_configuration = page_context
         return fig
 
     def add_time_frame_column(self, fig: TimeLineOverviewPage, questions: list[ResearchQuestion], time_frame: TimeFrame, number: int):
-        column = Column(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        column = Column.create(
+            self.render_context,
             header_title=self.translator.get_label(time_frame.description),
             header_subtitle=helper.get_subtitle(time_frame),
             header_color=helper.get_header_color(time_frame),
@@ -99,30 +106,24 @@ class KnowledgeCalendarDocument(ResearchQuestionsDocument):
 
             for research_line in sorted(now_questions_groups.keys(), key=lambda g: g.number):
                 if research_line.cluster not in self._clusters:
-                    cluster = Cluster(
-                        layout_configuration=self.layout_configuration,
-                        links_register=self.links_register,
-                        translator=self.translator,
+                    cluster = Cluster.create(
+                        self.render_context,
                         color=research_line.base_color,
                     )
                     self._clusters[research_line.cluster] = cluster
                 else:
                     cluster = self._clusters[research_line.cluster]
 
-                new_group = Group(
-                    layout_configuration=self.layout_configuration,
-                    links_register=self.links_register,
-                    translator=self.translator,
+                new_group = Group.create(
+                    self.render_context,
                     title=self.translator.get_label(research_line.title),
                     color=color_toward_grey(research_line.base_color, time_frame.grey_fraction),
                 )
-                cluster.groups[column.number].append(new_group)
+                cluster.add_group(column.number, new_group)
                 for question in sorted(now_questions_groups[research_line], key=lambda q: q.priority, reverse=True):
-                    new_group.questions.append(
-                        QuestionSummaryElement(
-                            layout_configuration=self.layout_configuration,
-                            links_register=self.links_register,
-                            translator=self.translator,
+                    new_group.add_question(
+                        QuestionSummaryElement.create(
+                            self.render_context,
                             research_question=question,
                             page_number=0,
                         )
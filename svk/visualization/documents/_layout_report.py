@@ -0,0 +1,73 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pydantic import BaseModel
+from svk.data import LinksRegister
+from svk.visualization.elements._visual_element import VisualElement
+from svk.visualization.pages._page import Page
+
+
+class LayoutReport(BaseModel):
+    """
+    Outcome of a dry run of a document (see Document.layout): all pages are laid out and drawn in memory, but not converted to
+    pdf.
+    """
+
+    page_titles: dict[int, str]
+    """The title of each page (per page number)."""
+    page_sizes: dict[int, tuple[float, float]]
+    """The size (width, height) of each page in pixels (per page number)."""
+    element_counts: dict[int, int]
+    """The number of visual elements on each page (per page number)."""
+    links: dict[str, list[tuple[int, float, float, float, float]]]
+    """The registered links: id, list[tuple[page_number, x, y, w, h]]"""
+    link_targets: dict[str, tuple[int, float, float]]
+    """The registered link targets: id, tuple[page_number, x, y]"""
+    dangling_link_ids: list[str]
+    """Ids of links without a link target (these links cannot be added to the pdf)."""
+    duplicate_page_numbers: list[int]
+    """Page numbers that are used by more than one page (links to and from these pages end up on the wrong page)."""
+
+    @classmethod
+    def from_pages(cls, pages: list[Page], links_register: LinksRegister) -> "LayoutReport":
+        """
+        Creates the report for pages that have been drawn.
+
+        :param pages: The pages of the document.
+        :type pages: list[Page]
+        :param links_register: The links register the pages registered their links and link targets in.
+        :type links_register: LinksRegister
+        :return: The report.
+        :rtype: LayoutReport
+        """
+        page_numbers = [page.page_number for page in pages]
+        return cls(
+            page_titles={page.page_number: page.title for page in pages},
+            page_sizes={page.page_number: page.get_size() for page in pages},
+            element_counts={page.page_number: sum(_count_elements(element) for element in page.elements) for page in pages},
+            links={key: list(value) for key, value in links_register.links.items()},
+            link_targets=dict(links_register.link_targets),
+            dangling_link_ids=sorted(links_register.links.keys() - links_register.link_targets.keys()),
+            duplicate_page_numbers=sorted({number for number in page_numbers if page_numbers.count(number) > 1}),
+        )
+
+
+def _count_elements(element: VisualElement) -> int:
+    return 1 + sum(_count_elements(child) for child in element.children)
@@ -17,11 +17,12 @@ class LifeTimeAnalysDocument(Document):
     technical_lifetime_grid: Grid
 
     def create_pages(self) -> list[Page]:
+        self._layout_context = self.create_layout_context()
         return [
             LifeTimeAnalysisPage(
                 page_number=0,
                 title=f"EFL - {self.translator.get_label(self.storm_surge_barrier.title)}",
-                layout_configuration=self.layout_configuration,
+                layout_configuration=self.layout_context,
                 links_register=self.links_register,
                 translator=self.translator,
                 icon=self.storm_surge_barrier,
@@ -32,7 +33,7 @@ class LifeTimeAnalysDocument(Document):
             LifeTimeAnalysisPage(
                 page_number=0,
                 title=f"ETL - {self.translator.get_label(self.storm_surge_barrier.title)}",
-                layout_configuration=self.layout_configuration,
+                layout_configuration=self.layout_context,
                 links_register=self.links_register,
                 translator=self.translator,
                 icon=self.storm_surge_barrier,
@@ -23,7 +23,9 @@ from svk.visualization.elements._group import GroupBase
 from svk.visualization.elements._column import Column
 from svk.visualization.helpers._greyfraction import color_toward_grey
 
-from svgwrite import Drawing
+from pydantic import PrivateAttr
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._defs_registry import get_defs_registry
 from uuid import uuid4
 from collections import defaultdict
 
@@ -34,21 +36,46 @@ class Cluster(VisualElement):
     groups: defaultdict[int, list[GroupBase]] = defaultdict(list[GroupBase])
     """A list of groups per column index (zero based)."""
 
+    _column_heights: dict[int, float] = PrivateAttr(default_factory=dict)
+    """The height of each column (as determined by the layout pass)."""
+
     @property
     def width(self) -> float:
         return self.layout_configuration.overview_page_width - 2 * self.layout_configuration.paper_margin
 
     @property
     def height(self) -> float:
-        return self.get_height()
+        return self.layout()[1]
 
     def get_height(self, column: Column | None = None):
         if column is None:
-            return max([self._get_height_for_column(c) for c in self.groups])
+            return self.height
         else:
-            return self._get_height_for_column(column.number) if column.number in self.groups else 0.0
+            self.layout()
+            return self._column_heights.get(column.number, 0.0)
+
+    def measure(self) -> tuple[float, float]:
+        self._column_heights = {c: self._get_height_for_column(c) for c in self.groups}
+        return (self.width, max(self._column_heights.values()))
 
-    def draw(self, dwg: Drawing, left: float, top: float):
+    @property
+    def children(self) -> list[GroupBase]:
+        return [group for i_column in self.groups for group in self.groups[i_column]]
+
+    def add_group(self, column_number: int, group: GroupBase):
+        """
+        Adds a group to a column of the cluster (and discards the stored size of the cluster).
+
+        :param column_number: The index of the column (zero based).
+        :type column_number: int
+        :param group: The group to add.
+        :type group: GroupBase
+        """
+        self.groups[column_number].append(group)
+        group._parent = self
+        self.invalidate_layout()
+
+    def draw(self, dwg: SvgDrawing, left: float, top: float):
         width = self.width
         height = self.height
 
@@ -79,8 +106,9 @@ class Cluster(VisualElement):
         stroke_radial_grad.add_stop_color(1, color_toward_grey(self.color, 0.0))
         stroke_radial_grad["gradientTransform"] = f"scale({x_scale},1)"
 
-        dwg.defs.add(fill_radial_grad)
-        dwg.defs.add(stroke_radial_grad)
+        defs_registry = get_defs_registry(dwg)
+        gradient_id = defs_registry.add_gradient(fill_radial_grad)
+        stroke_gradient_id = defs_registry.add_gradient(stroke_radial_grad)
 
         dwg.add(
             dwg.rect(
@@ -19,7 +19,8 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from svk.visualization.elements._visual_element import VisualElement
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
 from svk.visualization.helpers._drawchevron import draw_half_chevron
 
 
@@ -44,12 +45,12 @@ class Column(VisualElement):
     def height(self) -> float:
         return self.layout_configuration.column_header_height
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         """
         Draws the header
 
         :param dwg: The svgwrite.Drawing object used to draw the header
-        :type dwg: Drawing
+        :type dwg: SvgDrawing
         :param x: The x-position of the left upper corner of the header
         :type x: float
         :param y: The y-position of the left upper corner of the header
@@ -67,6 +68,7 @@ class Column(VisualElement):
                 width=self.width,
                 height=self.height,
                 color=self.header_color,
+                add_to_dwg=False,
             )
         )
         y_column_header_text = y + self.layout_configuration.column_header_height / 2
@@ -74,9 +76,7 @@ class Column(VisualElement):
             dwg.text(
                 self.header_title,
                 insert=(x + self.layout_configuration.arrow_depth + self.layout_configuration.intermediate_margin, y_column_header_text),
-                font_size=self.layout_configuration.column_header_font_size,
-                font_family="Arial",
-                font_weight="bold",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["column-header"]),
                 text_anchor="start",
                 dominant_baseline="middle",
             )
@@ -86,10 +86,8 @@ class Column(VisualElement):
                 dwg.text(
                     self.header_subtitle,
                     insert=(x + self.layout_configuration.column_width - self.layout_configuration.arrow_depth, y_column_header_text),
-                    font_family="Arial",
                     text_anchor="end",
                     dominant_baseline="middle",
-                    font_size=self.layout_configuration.column_header_font_size,
-                    font_weight="normal",
+                    **text_style_attributes(dwg, self.layout_configuration.text_styles["column-subheader"]),
                 )
             )
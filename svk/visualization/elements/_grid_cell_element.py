@@ -1,4 +1,4 @@
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from pydantic import PrivateAttr, model_validator
 from svk.io._endoflifedatabase import Color
 from svk.visualization.elements._visual_element import VisualElement
@@ -25,7 +25,7 @@ class GridCellElement(VisualElement):
     def height(self) -> float:
         return self._height
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         dwg.add(
             dwg.rect(
                 insert=(x, y),
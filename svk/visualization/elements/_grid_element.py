@@ -1,6 +1,8 @@
 from pydantic import model_validator, PrivateAttr
 from uuid import uuid4
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
+from svk.visualization.helpers._defs_registry import get_defs_registry
 from svk.data import Grid
 from svk.visualization.helpers._greyfraction import color_toward_grey
 from svk.visualization.elements._visual_elements_container import VisualElementsContainer
@@ -19,10 +21,8 @@ class GridElement(VisualElementsContainer):
     def validate(self):
         self._categories = list(dict.fromkeys(header.category for header in self.grid.column_headers))
         self._cell_elements = [
-            GridCellElement(
-                layout_configuration=self.layout_configuration,
-                translator=self.translator,
-                links_register=self.links_register,
+            GridCellElement.create(
+                self.render_context,
                 fill=c.color,
                 i_row=c.i_row,
                 i_column=c.i_column,
@@ -31,10 +31,8 @@ class GridElement(VisualElementsContainer):
         ]
 
         self._row_header_elements = [
-            GridHeaderElement(
-                layout_configuration=self.layout_configuration,
-                translator=self.translator,
-                links_register=self.links_register,
+            GridHeaderElement.create(
+                self.render_context,
                 label=r.label,
                 orientation=HeaderOrientation.Horizontal,
                 i_position=r.i_position,
@@ -44,10 +42,8 @@ class GridElement(VisualElementsContainer):
         ]
 
         self._column_header_elements = [
-            GridHeaderElement(
-                layout_configuration=self.layout_configuration,
-                translator=self.translator,
-                links_register=self.links_register,
+            GridHeaderElement.create(
+                self.render_context,
                 label=c.label,
                 orientation=HeaderOrientation.Vertical,
                 i_position=c.i_position,
@@ -109,7 +105,8 @@ class GridElement(VisualElementsContainer):
     def height(self) -> float:
         return self._height
 
-    def draw(self, dwg: Drawing, x: float, y: float) -> None:
+    def draw(self, dwg: SvgDrawing, x: float, y: float) -> None:
+        defs_registry = get_defs_registry(dwg)
         for category in self._category_info.keys():
             width = self._category_info[category][1]
             height = self.height
@@ -137,8 +134,8 @@ class GridElement(VisualElementsContainer):
             fill_gradient.add_stop_color(0.4, color_toward_grey(color, 0.8, grey=(250, 250, 250)))
             stroke_gradient.add_stop_color(1, "white")
 
-            dwg.defs.add(fill_gradient)
-            dwg.defs.add(stroke_gradient)
+            fill_gradient_id = defs_registry.add_gradient(fill_gradient)
+            stroke_gradient_id = defs_registry.add_gradient(stroke_gradient)
 
             dwg.add(
                 dwg.rect(
@@ -161,11 +158,8 @@ class GridElement(VisualElementsContainer):
                     category,
                     x=[left + self._category_info[category][1] / 2.0],
                     y=[y + self.layout_configuration.font_size * 0.6 + self.layout_configuration.small_margin],
-                    font_size=self.layout_configuration.font_size,
                     fill="white",
-                    font_family="Arial",
-                    font_weight="normal",
-                    font_style="italic",
+                    **text_style_attributes(dwg, self.layout_configuration.text_styles["body-italic"]),
                     text_anchor="middle",
                     dominant_baseline="central",
                 )
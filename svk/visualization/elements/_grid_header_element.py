@@ -1,6 +1,6 @@
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from pydantic import PrivateAttr, model_validator
-from svk.visualization.helpers._measuretext import measure_text
+from svk.visualization.helpers._measuretext import measure_texts
 from svk.visualization.helpers._wrappedtext import wrapped_lines, wrapped_text
 from svk.visualization.elements._visual_element import VisualElement
 from enum import Enum
@@ -27,12 +27,13 @@ class GridHeaderElement(VisualElement):
             text=self.label, max_width=self.layout_configuration.grid_header_maximum_width, font_size=self.layout_configuration.font_size
         )
 
+        max_line_width = float(measure_texts(self._lines, self.layout_configuration.font_size)[0].max())
         if self.orientation.value:
-            self._width = max([measure_text(text=l, font_size=self.layout_configuration.font_size)[0] for l in self._lines])
+            self._width = max_line_width
             self._height = len(self._lines) * self.layout_configuration.font_size * 1.2
         else:
             self._width = len(self._lines) * self.layout_configuration.font_size * 1.2
-            self._height = max([measure_text(text=l, font_size=self.layout_configuration.font_size)[0] for l in self._lines])
+            self._height = max_line_width
         return self
 
     @property
@@ -43,15 +44,13 @@ class GridHeaderElement(VisualElement):
     def height(self) -> float:
         return self._height
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         if self.orientation == HeaderOrientation.Vertical:
             text_element = wrapped_text(
                 dwg=dwg,
                 lines=self._lines,
                 insert=(x, y),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                text_style=self.layout_configuration.text_styles["body"],
                 text_anchor="start",
                 dominant_baseline="middle",
             )
@@ -63,9 +62,7 @@ class GridHeaderElement(VisualElement):
                     dwg=dwg,
                     lines=self._lines,
                     insert=(x, y),
-                    font_size=self.layout_configuration.font_size,
-                    font_family="Arial",
-                    font_weight="normal",
+                    text_style=self.layout_configuration.text_styles["body"],
                     text_anchor="end",
                     dominant_baseline="middle",
                 )
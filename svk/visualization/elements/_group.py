@@ -18,7 +18,8 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
 from svk.visualization.elements._question_summary_element import QuestionSummaryElement
 from svk.visualization.helpers._draw_callout import draw_callout
 from svk.visualization.helpers._wrappedtext import wrapped_lines, wrapped_text
@@ -34,7 +35,7 @@ class GroupBase(VisualElement):
     def width(self) -> float:
         return 0.0
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         pass
 
 
@@ -54,28 +55,47 @@ class Group(GroupBase):
     @property
     def height(self) -> float:
         """
-        Calculates the height of the group in pixels
+        The height of the group in pixels (as determined by the layout pass)
 
         :return: The height of the group
         :rtype: int
         """
+        return self.layout()[1]
+
+    @property
+    def width(self) -> float:
+        return self.layout_configuration.column_width - self.layout_configuration.arrow_depth
+
+    def measure(self) -> tuple[float, float]:
         return (
+            self.width,
             self.layout_configuration.group_header_height
             + sum([question.height for question in self.questions])
             + self.layout_configuration.small_margin * len(self.questions)
-            + self.layout_configuration.intermediate_margin
+            + self.layout_configuration.intermediate_margin,
         )
 
     @property
-    def width(self) -> float:
-        return self.layout_configuration.column_width - self.layout_configuration.arrow_depth
+    def children(self) -> list[QuestionSummaryElement]:
+        return self.questions
+
+    def add_question(self, question: QuestionSummaryElement):
+        """
+        Adds a question to the group (and discards the stored size of the group).
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+        :param question: The question to add.
+        :type question: QuestionSummaryElement
+        """
+        self.questions.append(question)
+        question._parent = self
+        self.invalidate_layout()
+
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         """
         Draws the group and its questions
 
         :param dwg: The svgwrite.Drawing object that should be used.
-        :type dwg: Drawing
+        :type dwg: SvgDrawing
         :param x: The x-position of the left upper corner of the group
         :type x: float
         :param y: The y-position of the left upper corner of the group
@@ -96,12 +116,12 @@ class Group(GroupBase):
             current_y += self.layout_configuration.small_margin + question.height
             pass
 
-    def draw_header(self, dwg: Drawing, x: float, y: float, width: float):
+    def draw_header(self, dwg: SvgDrawing, x: float, y: float, width: float):
         """
         Draws the groups header
 
         :param dwg: The svgwrite.Drawing object to use
-        :type dwg: Drawing
+        :type dwg: SvgDrawing
         :param x: The x-position of the upper left corner of the header
         :type x: float
         :param y: The y-position of the upper left corner of the header
@@ -109,7 +129,8 @@ class Group(GroupBase):
         :param width: The width of the header
         :type width: float
         """
-        draw_callout(dwg, x, y, width, self.height, self.color)
+        # The height differs per group: only groups with the same size share a callout template (defined by the page).
+        draw_callout(dwg, x, y, width, self.height, self.color, use_template=None)
 
         dwg.add(
             dwg.text(
@@ -118,9 +139,7 @@ class Group(GroupBase):
                     x + self.layout_configuration.arrow_depth + self.layout_configuration.intermediate_margin,
                     y + self.layout_configuration.group_header_height / 2,
                 ),
-                font_size=self.layout_configuration.group_title_font_size,
-                font_family="Arial",
-                font_weight="bold",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["group-title"]),
                 text_anchor="start",
                 dominant_baseline="middle",
             )
@@ -137,7 +156,10 @@ class PlainTextGroup(GroupBase):
 
     @property
     def height(self) -> float:
-        return self.layout_configuration.font_size * len(self._compute_lines()) * 1.2 + self.layout_configuration.small_margin
+        return self.layout()[1]
+
+    def measure(self) -> tuple[float, float]:
+        return (self.width, self.layout_configuration.font_size * len(self._compute_lines()) * 1.2 + self.layout_configuration.small_margin)
 
     def _compute_lines(self) -> list[str]:
         if self._lines is None:
@@ -145,13 +167,13 @@ class PlainTextGroup(GroupBase):
 
         return self._lines
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         dwg.add(
             wrapped_text(
                 dwg=dwg,
                 lines=self._compute_lines(),
                 insert=(x, y),
-                font_size=self.layout_configuration.font_size,
+                text_style=self.layout_configuration.text_styles["body"],
                 dominant_baseline="text-before-edge",
                 text_anchor="start",
             )
@@ -19,9 +19,10 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from __future__ import annotations
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
 from svk.visualization.elements._visual_element import VisualElement
-from svk.visualization.helpers._wrappedtext import measure_text
+from svk.visualization.helpers._measuretext import measure_text
 
 
 class IdElement(VisualElement):
@@ -42,15 +43,13 @@ class IdElement(VisualElement):
     def height(self) -> float:
         return (2 if self.is_bottom_margin else 1) * self.layout_configuration.small_margin + self.layout_configuration.font_size * 1.2
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         y_top = y + self.layout_configuration.small_margin
         dwg.add(
             dwg.text(
                 self.id,
                 insert=(x + self.width / 2.0, y_top),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                 text_anchor="middle",
                 dominant_baseline="text-before-edge",
             )
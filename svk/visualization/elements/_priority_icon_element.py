@@ -20,7 +20,7 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 
 from __future__ import annotations
 from pydantic import model_validator, PrivateAttr
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from svk.visualization.elements._visual_element import VisualElement
 from svk.visualization.helpers._draw_priority_arrow import draw_priority_arrow
 
@@ -47,7 +47,7 @@ class PriorityIconElement(VisualElement):
         self._width = self.layout_configuration.priority_arrow_width + self.layout_configuration.small_margin * 2
         return self
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         if not self.show:
             return
 
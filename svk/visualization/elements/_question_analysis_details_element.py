@@ -21,7 +21,7 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 from __future__ import annotations
 from pydantic import model_validator, PrivateAttr
 from svk.data import ResearchQuestion, Label
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from svk.visualization.elements._title_element import TitleElement
 from svk.visualization.helpers._measuretext import measure_text
 from svk.visualization.helpers._wrappedtext import wrapped_lines, wrapped_text
@@ -50,42 +50,33 @@ class QuestionAnalysisDetailsElement(VisualElementsContainer):
 
     @model_validator(mode="after")
     def validate(self) -> QuestionAnalysisDetailsElement:
-        self._driver_title_element = TitleElement(
+        self._driver_title_element = TitleElement.create(
+            self.render_context,
             title=Label.QD_Drivers,
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator
         )
-        self._function_title_element = TitleElement(
+        self._function_title_element = TitleElement.create(
+            self.render_context,
             title=Label.QD_Functions,
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator
         )
-        self._component_title_element = TitleElement(
+        self._component_title_element = TitleElement.create(
+            self.render_context,
             title=Label.QD_Components,
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator
         )
-        self._driver_element = WrappedBulletListElement(
+        self._driver_element = WrappedBulletListElement.create(
+            self.render_context,
             max_width=self.layout_configuration.analysis_details_width,
             bullet_list=self.research_question.related_drivers.split(";") if self.research_question.related_drivers is not None else ["-"],
-            layout_configuration=self.layout_configuration, 
-            links_register=self.links_register, 
-            translator=self.translator)
-        self._function_element = WrappedBulletListElement(
+        )
+        self._function_element = WrappedBulletListElement.create(
+            self.render_context,
             max_width=self.layout_configuration.analysis_details_width,
             bullet_list=self.research_question.related_functions.split(";") if self.research_question.related_functions is not None else ["-"],
-            layout_configuration=self.layout_configuration, 
-            links_register=self.links_register, 
-            translator=self.translator)
-        self._component_element = WrappedBulletListElement(
+        )
+        self._component_element = WrappedBulletListElement.create(
+            self.render_context,
             max_width=self.layout_configuration.analysis_details_width,
             bullet_list=self.research_question.related_components.split(";") if self.research_question.related_components is not None else ["-"],
-            layout_configuration=self.layout_configuration, 
-            links_register=self.links_register, 
-            translator=self.translator)
+        )
         
         self._width = max(
             self._driver_title_element.width,
@@ -112,12 +103,12 @@ class QuestionAnalysisDetailsElement(VisualElementsContainer):
     def width(self) -> float:
         return self._width
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         y_current = self.draw_bulleted_subsection(dwg=dwg, x=x, y=y + self.layout_configuration.small_margin, title_element=self._driver_title_element, element=self._driver_element)
         y_current = self.draw_bulleted_subsection(dwg=dwg, x=x, y=y_current, title_element=self._function_title_element, element=self._function_element)
         self.draw_bulleted_subsection(dwg=dwg, x=x, y=y_current, title_element=self._component_title_element, element=self._component_element)
 
-    def draw_bulleted_subsection(self, dwg:Drawing, x: float, y: float, title_element: TitleElement, element:WrappedBulletListElement) -> float:
+    def draw_bulleted_subsection(self, dwg:SvgDrawing, x: float, y: float, title_element: TitleElement, element:WrappedBulletListElement) -> float:
         title_element.draw(
             dwg=dwg,
             x=x,
@@ -21,12 +21,14 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 from __future__ import annotations
 from pydantic import model_validator, PrivateAttr
 from svk.data import ResearchQuestion, Label
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
 from svk.visualization.helpers._measuretext import measure_text
 from svk.visualization.helpers._wrappedtext import wrapped_text, wrapped_lines
 from svk.visualization.helpers._greyfraction import color_toward_grey
 from svk.visualization.elements._wrapped_text_element import WrappedTextElement
 from svk.visualization.elements._visual_elements_container import VisualElementsContainer, Alignment
+from svk.visualization.elements._visual_element import QuestionElement
 from svk.visualization.elements._question_organisation_details_element import QuestionOrganisationDetailsElement
 from svk.visualization.elements._question_priority_details_element import QuestionPriorityDetailsElement
 from svk.visualization.elements._priority_icon_element import PriorityIconElement
@@ -35,7 +37,7 @@ from svk.visualization.elements._question_analysis_details_element import Questi
 from svk.visualization.elements._ssb_icons_element import SsbIconsElement
 
 
-class QuestionDetailsElement(VisualElementsContainer):
+class QuestionDetailsElement(VisualElementsContainer, QuestionElement):
     research_question: ResearchQuestion
     """The research question"""
     page_number: int
@@ -62,56 +64,64 @@ class QuestionDetailsElement(VisualElementsContainer):
     def width(self) -> float:
         return self._width
 
+    @property
+    def source_question(self) -> ResearchQuestion:
+        return self.research_question
+
+    def set_page_number(self, page_number: int) -> None:
+        """
+        Moves the element to another page (the page number is used to register links and link targets).
+
+        :param page_number: The number of the page this element is drawn on.
+        :type page_number: int
+        """
+        self.page_number = page_number
+        for element in [self._organisation_details_element, self._analysis_element, self._id_element]:
+            element.page_number = page_number
+        for element in self._related_question_elements:
+            element.page_number = page_number
+
+    def set_research_question(self, research_question: ResearchQuestion) -> None:
+        self.research_question = research_question
+        self.validate()
+        self.invalidate_layout()
+
     @model_validator(mode="after")
     def validate(self):
-        self._priority_icon_element = PriorityIconElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._priority_icon_element = PriorityIconElement.create(
+            self.render_context,
             priority=self.research_question.priority,
         )
-        self._question_explanation_element = WrappedTextElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._question_explanation_element = WrappedTextElement.create(
+            self.render_context,
             text=self.research_question.explanation if self.research_question.explanation is not None else "-",
             max_width=self.layout_configuration.question_explanation_width,
         )
-        self._priority_details_element = QuestionPriorityDetailsElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._priority_details_element = QuestionPriorityDetailsElement.create(
+            self.render_context,
             research_question=self.research_question,
             color=self._color,
         )
-        self._organisation_details_element = QuestionOrganisationDetailsElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._organisation_details_element = QuestionOrganisationDetailsElement.create(
+            self.render_context,
             research_question=self.research_question,
             color=self._color,
             page_number=self.page_number,
         )
-        self._analysis_element = QuestionAnalysisDetailsElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._analysis_element = QuestionAnalysisDetailsElement.create(
+            self.render_context,
             research_question=self.research_question,
             color=self._color,
             page_number=self.page_number,
         )
-        self._id_element = IdElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._id_element = IdElement.create(
+            self.render_context,
             id=self.research_question.id,
             is_link_target=True,
             page_number=self.page_number,
         )
-        self._ssb_icons_element = SsbIconsElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._ssb_icons_element = SsbIconsElement.create(
+            self.render_context,
             storm_surge_barriers=self.research_question.storm_surge_barriers,
         )
 
@@ -122,22 +132,18 @@ class QuestionDetailsElement(VisualElementsContainer):
             + self._analysis_element.width
         )
 
-        self._question_wrapped_text_element = WrappedTextElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._question_wrapped_text_element = WrappedTextElement.create(
+            self.render_context,
             text=self.research_question.question,
             max_width=self.width - self._id_element.width - self._ssb_icons_element.width - 2 * self.layout_configuration.small_margin,
         )
 
         self._related_question_elements = [
-            IdElement(
+            IdElement.create(
+                self.render_context,
                 id=id,
                 is_link=True,
-                layout_configuration=self.layout_configuration,
-                links_register=self.links_register,
                 page_number=self.page_number,
-                translator=self.translator,
                 is_bottom_margin=True,
                 is_tight_width=True,
             )
@@ -189,7 +195,7 @@ class QuestionDetailsElement(VisualElementsContainer):
             else "rgb(120,120,120)"
         )
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         dwg.add(
             dwg.rect(
                 insert=(x, y),
@@ -208,7 +214,7 @@ class QuestionDetailsElement(VisualElementsContainer):
         self.draw_horizontal_separator(dwg, x, y_last_line, self.width, self._color)
         self.draw_last_lines(dwg, x, y_last_line)
 
-    def draw_first_line(self, dwg: Drawing, x: float, y: float):
+    def draw_first_line(self, dwg: SvgDrawing, x: float, y: float):
         width_first_column = max([self._id_element.width, self._priority_icon_element.width])
         self.draw_element(
             dwg=dwg,
@@ -243,7 +249,7 @@ class QuestionDetailsElement(VisualElementsContainer):
             alignment=Alignment.MiddleCenter,
         )
 
-    def draw_second_line(self, dwg: Drawing, x: float, y: float):
+    def draw_second_line(self, dwg: SvgDrawing, x: float, y: float):
         x_current = x
         height_container = self.height - self._h_first_line - self._h_last_line
         width_first_column = max([self._priority_icon_element.width, self._id_element.width])
@@ -303,7 +309,7 @@ class QuestionDetailsElement(VisualElementsContainer):
             alignment=Alignment.TopLeft,
         )
 
-    def draw_last_lines(self, dwg: Drawing, x: float, y: float):
+    def draw_last_lines(self, dwg: SvgDrawing, x: float, y: float):
         label = self.translator.get_label(Label.QD_Related_Questions) + ":"
         if len(self._related_question_elements) == 0:
             label += " -"
@@ -311,9 +317,7 @@ class QuestionDetailsElement(VisualElementsContainer):
             dwg.text(
                 label,
                 insert=(x + self.layout_configuration.small_margin, y + self.layout_configuration.small_margin),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                 text_anchor="start",
                 dominant_baseline="text-before-edge",
             )
@@ -339,9 +343,7 @@ class QuestionDetailsElement(VisualElementsContainer):
                     x + self.layout_configuration.small_margin,
                     y_keywords,
                 ),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                text_style=self.layout_configuration.text_styles["body"],
                 text_anchor="left",
                 dominant_baseline="text-before-edge",
             )
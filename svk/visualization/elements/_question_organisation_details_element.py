@@ -19,11 +19,13 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from __future__ import annotations
+import numpy as np
 from pydantic import model_validator, PrivateAttr
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
 from svk.data import ResearchQuestion, Label, ResearchLine
 from svk.visualization.elements._title_element import TitleElement
-from svk.visualization.helpers._measuretext import measure_text
+from svk.visualization.helpers._measuretext import measure_text, measure_texts
 from svk.visualization.elements._visual_elements_container import VisualElementsContainer
 
 
@@ -47,11 +49,9 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
 
     @model_validator(mode="after")
     def validate(self) -> QuestionOrganisationDetailsElement:
-        self._title_element = TitleElement(
+        self._title_element = TitleElement.create(
+            self.render_context,
             title=Label.QD_Organizational,
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator
         )
         
         fixed_fields: list[tuple[Label, float]] = [
@@ -69,18 +69,14 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
                 )
             ),
         ]
+        label_widths, _ = measure_texts(
+            [self.translator.get_label(l[0]) + ": " for l in fixed_fields], self.layout_configuration.font_size
+        )
         self._width = max([
             self._title_element.width,
             (
             self.layout_configuration.small_margin
-            + max([
-                measure_text(
-                    (self.translator.get_label(l[0]) + ": "),
-                    self.layout_configuration.font_size,
-                    )[0]
-                + l[1]
-                for l in fixed_fields
-                ])
+            + float((label_widths + np.array([l[1] for l in fixed_fields])).max())
             + self.layout_configuration.small_margin
             )])
         self._height = (
@@ -91,7 +87,7 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
         )
         return self
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         self._title_element.draw(dwg, x, y)
         
         y += self._title_element.height
@@ -108,9 +104,7 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
                     x + self.layout_configuration.small_margin,
                     y_current,
                 ),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                 text_anchor="start",
                 dominant_baseline="text-before-edge",
             )
@@ -125,9 +119,7 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
                     x + self.layout_configuration.small_margin,
                     y_current,
                 ),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                 text_anchor="start",
                 dominant_baseline="text-before-edge",
             )
@@ -154,12 +146,12 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
         )
 
     def _get_max_research_line_title_length(self) -> float:
-        return max(
-            [measure_text(self.translator.get_label(line.title), self.layout_configuration.font_size)[0] for line in list(ResearchLine)]
+        return float(
+            measure_texts([self.translator.get_label(line.title) for line in list(ResearchLine)], self.layout_configuration.font_size)[0].max()
         )
 
     def _draw_research_line_link(
-        self, dwg: Drawing, page_number: int, x_start: float, y_start: float, research_line: ResearchLine | None, label: Label
+        self, dwg: SvgDrawing, page_number: int, x_start: float, y_start: float, research_line: ResearchLine | None, label: Label
     ):
         link_text = self.translator.get_label(research_line.title) if research_line is not None else ""
         dwg.add(
@@ -169,9 +161,7 @@ class QuestionOrganisationDetailsElement(VisualElementsContainer):
                     x_start,
                     y_start,
                 ),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                 text_anchor="start",
                 dominant_baseline="text-before-edge",
             )
@@ -21,9 +21,11 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 from __future__ import annotations
 from pydantic import model_validator, PrivateAttr
 from svk.data import ResearchQuestion, Priority, Label
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
+from svk.visualization.helpers._primitive_batch import draw_dot
 from svk.visualization.elements._title_element import TitleElement
-from svk.visualization.helpers._measuretext import measure_text
+from svk.visualization.helpers._measuretext import measure_texts
 from svk.visualization.helpers._wrappedtext import wrapped_text, wrapped_lines
 from svk.visualization.elements._visual_elements_container import VisualElementsContainer
 
@@ -50,16 +52,14 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
 
     @model_validator(mode="after")
     def validate(self) -> QuestionPriorityDetailsElement:
-        self._title_element = TitleElement(
+        self._title_element = TitleElement.create(
+            self.render_context,
             title=Label.QD_Priority,
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator
         )
         prio_labels = [Label.QD_WaterSafety, Label.QD_OtherFunctions, Label.QD_Operation, Label.QD_Maitenance]
         self._w_priority_metrices_column = (
             self.layout_configuration.small_margin
-            + max([measure_text(self.translator.get_label(l) + ":", self.layout_configuration.font_size)[0] for l in prio_labels])
+            + float(measure_texts([self.translator.get_label(l) + ":" for l in prio_labels], self.layout_configuration.font_size)[0].max())
             + self.layout_configuration.small_margin
             + self.dotradius * 7
             + self.layout_configuration.small_margin
@@ -95,7 +95,7 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
         self._height = max([h_priority_column_fixed_items, h_priority_column_explained_lines])
         return self
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         self._title_element.draw(dwg, x, y)
         y_prios_start = y + self._title_element.height
         self.draw_horizontal_separator(
@@ -113,7 +113,7 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
             (Label.QD_Maitenance, self.research_question.prio_management_maintenance),
         ]
         prios_translated = [(self.translator.get_label(p[0]) + ":", p[1]) for p in prios]
-        max_label_width = max([measure_text(p[0], self.layout_configuration.font_size)[0] for p in prios_translated])
+        max_label_width = float(measure_texts([p[0] for p in prios_translated], self.layout_configuration.font_size)[0].max())
         y_prio_current = y_prios_start + self.layout_configuration.small_margin
         x_prio_label = x + self.layout_configuration.small_margin
         x_prio_first = x_prio_label + max_label_width + self.layout_configuration.small_margin
@@ -125,9 +125,7 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
                         x_prio_label,
                         y_prio_current,
                     ),
-                    font_size=self.layout_configuration.font_size,
-                    font_family="Arial",
-                    font_weight="normal",
+                    **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                     text_anchor="start",
                     dominant_baseline="text-before-edge",
                 )
@@ -152,12 +150,12 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
                         x + self._w_priority_metrices_column + self.layout_configuration.small_margin,
                         y_prios_start + self.layout_configuration.small_margin,
                     ),
-                    font_size=self.layout_configuration.font_size,
+                    text_style=self.layout_configuration.text_styles["body"],
                     dominant_baseline="text-before-edge",
                 )
             )
 
-    def draw_priority_dots(self, dwg: Drawing, x: float, y_current: float, prio: Priority):
+    def draw_priority_dots(self, dwg: SvgDrawing, x: float, y_current: float, prio: Priority):
         y_center = y_current + self.layout_configuration.font_size - self.dotradius
         x_prio_first = x + self.dotradius
         x_prio_second = x_prio_first + self.dotradius * 2.5
@@ -165,22 +163,20 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
 
         match prio:
             case Priority.High:
-                dwg.add(dwg.circle(center=(x_prio_first, y_center), r=self.dotradius, fill="black"))
-                dwg.add(dwg.circle(center=(x_prio_second, y_center), r=self.dotradius, fill="black"))
-                dwg.add(dwg.circle(center=(x_prio_third, y_center), r=self.dotradius, fill="black"))
+                draw_dot(dwg, center=(x_prio_first, y_center), r=self.dotradius, fill="black")
+                draw_dot(dwg, center=(x_prio_second, y_center), r=self.dotradius, fill="black")
+                draw_dot(dwg, center=(x_prio_third, y_center), r=self.dotradius, fill="black")
             case Priority.Medium:
-                dwg.add(dwg.circle(center=(x_prio_first, y_center), r=self.dotradius, fill="black"))
-                dwg.add(dwg.circle(center=(x_prio_second, y_center), r=self.dotradius, fill="black"))
+                draw_dot(dwg, center=(x_prio_first, y_center), r=self.dotradius, fill="black")
+                draw_dot(dwg, center=(x_prio_second, y_center), r=self.dotradius, fill="black")
             case Priority.Low:
-                dwg.add(dwg.circle(center=(x_prio_first, y_center), r=self.dotradius, fill="black"))
+                draw_dot(dwg, center=(x_prio_first, y_center), r=self.dotradius, fill="black")
             case Priority.No:
                 dwg.add(
                     dwg.text(
                         "-",
                         insert=(x, y_current),
-                        font_size=self.layout_configuration.font_size,
-                        font_family="Arial",
-                        font_weight="normal",
+                        **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                         text_anchor="start",
                         dominant_baseline="text-before-edge",
                     )
@@ -190,9 +186,7 @@ class QuestionPriorityDetailsElement(VisualElementsContainer):
                     dwg.text(
                         "?",
                         insert=(x, y_current),
-                        font_size=self.layout_configuration.font_size,
-                        font_family="Arial",
-                        font_weight="normal",
+                        **text_style_attributes(dwg, self.layout_configuration.text_styles["body"]),
                         text_anchor="start",
                         dominant_baseline="text-before-edge",
                     )
@@ -19,18 +19,19 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from pydantic import model_validator, PrivateAttr
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 
 from svk.data import ResearchQuestion
 from svk.visualization.helpers._wrappedtext import wrapped_text, wrapped_lines
 from svk.visualization.helpers._greyfraction import color_toward_grey
 from svk.visualization.elements._visual_elements_container import VisualElementsContainer, Alignment
+from svk.visualization.elements._visual_element import QuestionElement
 from svk.visualization.elements._question_details import IdElement, PriorityIconElement
 from svk.visualization.elements._wrapped_text_element import WrappedTextElement
 from svk.visualization.helpers._measuretext import measure_text
 
 
-class QuestionSummaryElement(VisualElementsContainer):
+class QuestionSummaryElement(VisualElementsContainer, QuestionElement):
     """
     Represents a question element (as part of  a group, column on the overview page)
     """
@@ -51,25 +52,19 @@ class QuestionSummaryElement(VisualElementsContainer):
 
     @model_validator(mode="after")
     def validate(self):
-        self._id_element = IdElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
+        self._id_element = IdElement.create(
+            self.render_context,
             id=self.research_question.id,
-            translator=self.translator,
             is_link=True,
             page_number=self.page_number,
         )
-        self._priority_icon_element = PriorityIconElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
+        self._priority_icon_element = PriorityIconElement.create(
+            self.render_context,
             priority=self.research_question.priority,
-            translator=self.translator,
             show=self.show_priority,
         )
-        self._question_element = WrappedTextElement(
-            layout_configuration=self.layout_configuration,
-            links_register=self.links_register,
-            translator=self.translator,
+        self._question_element = WrappedTextElement.create(
+            self.render_context,
             max_width=self.layout_configuration.summary_question_lines_width,
             text=self.research_question.question,
         )
@@ -86,6 +81,15 @@ class QuestionSummaryElement(VisualElementsContainer):
     def width(self) -> float:
         return self._width
 
+    @property
+    def source_question(self) -> ResearchQuestion:
+        return self.research_question
+
+    def set_research_question(self, research_question: ResearchQuestion) -> None:
+        self.research_question = research_question
+        self.validate()
+        self.invalidate_layout()
+
     @property
     def _color(self):
         research_line = self.research_question.research_line_primary
@@ -98,7 +102,7 @@ class QuestionSummaryElement(VisualElementsContainer):
             else "rgb(120,120,120)"
         )
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         dwg.add(
             dwg.rect(
                 insert=(x, y),
@@ -0,0 +1,39 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svk.data import LinksRegister, Translator
+from svk.visualization._layout_configuration import LayoutConfiguration
+
+
+class RenderContext:
+    """
+    The objects shared by all elements of a document: the layout configuration, the links register and the translator. Elements
+    that are created by the toolbox itself receive these through a single render context (see VisualElement.create).
+    """
+
+    __slots__ = ("layout_configuration", "links_register", "translator")
+
+    def __init__(self, layout_configuration: LayoutConfiguration, links_register: LinksRegister, translator: Translator):
+        self.layout_configuration: LayoutConfiguration = layout_configuration
+        """The layout configuration shared across all elements of a document."""
+        self.links_register: LinksRegister = links_register
+        """The links register shared across all elements of a document."""
+        self.translator: Translator = translator
+        """The translator used for all elements of a document."""
@@ -1,10 +1,10 @@
 
 from __future__ import annotations
 from pydantic import model_validator, PrivateAttr
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from svk.data import StormSurgeBarrier
 from svk.visualization.elements._visual_elements_container import VisualElementsContainer
-from svk.visualization.helpers._draw_scaled_icon import draw_scaled_icon
+from svk.visualization.helpers._draw_scaled_icon import get_icon_library
 
 class SsbIconsElement(VisualElementsContainer):
     """A container for the storm surge barrier icons."""
@@ -34,17 +34,11 @@ class SsbIconsElement(VisualElementsContainer):
     def width(self) -> float:
         return self._width
 
-    def draw(self, dwg: Drawing, x: float, y: float):
+    def draw(self, dwg: SvgDrawing, x: float, y: float):
         x_icon_current = x + self.layout_configuration.small_margin
         y_icon_current = y + self.layout_configuration.small_margin
+        icon_size = (self.layout_configuration.icon_width_small, self.layout_configuration.icon_width_small)
+        icon_library = get_icon_library()
         for barrier in self.storm_surge_barriers:
-            draw_scaled_icon(
-                dwg=dwg,
-                storm_surge_barrier=barrier,
-                insert=(
-                    x_icon_current,
-                    y_icon_current,
-                ),
-                size=(self.layout_configuration.icon_width_small, self.layout_configuration.icon_width_small),
-            )
+            icon_library.place(dwg=dwg, name=barrier.name, insert=(x_icon_current, y_icon_current), size=icon_size)
             x_icon_current += self.layout_configuration.icon_width_small + self.layout_configuration.small_margin
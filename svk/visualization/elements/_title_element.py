@@ -1,4 +1,5 @@
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import text_style_attributes
 from pydantic import PrivateAttr, model_validator
 from svk.visualization.helpers._measuretext import measure_text
 from svk.visualization.elements._visual_element import VisualElement
@@ -32,7 +33,7 @@ class TitleElement(VisualElement):
     def width(self) -> float:
         return self._width
 
-    def draw(self, dwg: Drawing, x: float, y: float) -> None:
+    def draw(self, dwg: SvgDrawing, x: float, y: float) -> None:
         dwg.add(
             dwg.text(
                 self.translator.get_label(self.title),
@@ -40,10 +41,7 @@ class TitleElement(VisualElement):
                     x + self.layout_configuration.small_margin,
                     y + self.layout_configuration.small_margin
                 ),
-                font_size=self.layout_configuration.font_size,
-                font_family="Arial",
-                font_weight="normal",
-                font_style="italic",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["body-italic"]),
                 text_anchor="start",
                 dominant_baseline="text-before-edge",
             )
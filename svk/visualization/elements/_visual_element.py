@@ -18,12 +18,62 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from pydantic import BaseModel
-from svk.data import LinksRegister, Translator
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Callable, TypeVar
+from pydantic import BaseModel, PrivateAttr
+from pydantic_core import PydanticUndefined
+from svk.data import LinksRegister, Translator, ResearchQuestion
 from svk.visualization._layout_configuration import LayoutConfiguration
-from svgwrite import Drawing
+from svk.visualization.elements._render_context import RenderContext
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from abc import ABC, abstractmethod
 
+_immutable_types = (str, int, float, bool, tuple, frozenset, Enum, type(None))
+
+
+class _ConstructionTemplate:
+    """
+    Everything VisualElement.create needs to know about an element class, determined once per class.
+    """
+
+    def __init__(self, cls: type[VisualElement]):
+        self.defaults: dict[str, Any] = {}
+        """Immutable default values of the fields (shared by all instances)."""
+        self.default_factories: dict[str, Callable[[], Any]] = {}
+        """Functions that return a fresh copy of the mutable default values of the fields."""
+        self.private_defaults: dict[str, Any] = {}
+        """Immutable default values of the private attributes."""
+        self.private_default_factories: dict[str, Callable[[], Any]] = {}
+        """Functions that return a fresh copy of the mutable default values of the private attributes."""
+        self.after_validators: list[str] = [
+            name for name, decorator in cls.__pydantic_decorators__.model_validators.items() if decorator.info.mode == "after"
+        ]
+        """Names of the model validators that run after the fields are set (in definition order)."""
+
+        for name, field in cls.model_fields.items():
+            if field.is_required():
+                continue
+            default = field.get_default(call_default_factory=True)
+            if isinstance(default, _immutable_types):
+                self.defaults[name] = default
+            else:
+                self.default_factories[name] = lambda field=field: field.get_default(call_default_factory=True)
+
+        for name, attribute in cls.__private_attributes__.items():
+            default = attribute.get_default()
+            if default is PydanticUndefined:
+                continue
+            if isinstance(default, _immutable_types):
+                self.private_defaults[name] = default
+            else:
+                self.private_default_factories[name] = attribute.get_default
+
+
+_construction_templates: dict[type, _ConstructionTemplate] = {}
+
+TElement = TypeVar("TElement", bound="VisualElement")
+
 
 class VisualElement(BaseModel, ABC):
     layout_configuration: LayoutConfiguration
@@ -31,6 +81,57 @@ class VisualElement(BaseModel, ABC):
     links_register: LinksRegister
     translator: Translator
 
+    _layout_size: tuple[float, float] | None = PrivateAttr(default=None)
+    _parent: Any = PrivateAttr(default=None)
+    """The element (or page) that contains this element. It is notified when the size of this element changes."""
+
+    @classmethod
+    def create(cls: type[TElement], context: RenderContext, **data: Any) -> TElement:
+        """
+        Fast construction path for elements that are created by the toolbox itself. The values are known to be valid, so pydantic
+        validation (and copying) is skipped. Model validators with mode "after" still run, so the element is measured as usual.
+        User-built elements should use the normal (validating) constructor.
+
+        :param context: The layout configuration, links register and translator shared by all elements of a document.
+        :type context: RenderContext
+        :param data: The values of the other fields of the element.
+        :type data: Any
+        :return: The new element.
+        :rtype: VisualElement
+        """
+        template = _construction_templates.get(cls)
+        if template is None:
+            template = _construction_templates[cls] = _ConstructionTemplate(cls)
+
+        values = {
+            **template.defaults,
+            **{name: factory() for name, factory in template.default_factories.items() if name not in data},
+            "layout_configuration": context.layout_configuration,
+            "links_register": context.links_register,
+            "translator": context.translator,
+            **data,
+        }
+        private_values = {
+            **template.private_defaults,
+            **{name: factory() for name, factory in template.private_default_factories.items()},
+        }
+
+        element = cls.__new__(cls)
+        object.__setattr__(element, "__dict__", values)
+        object.__setattr__(element, "__pydantic_fields_set__", {"layout_configuration", "links_register", "translator", *data})
+        object.__setattr__(element, "__pydantic_extra__", None)
+        object.__setattr__(element, "__pydantic_private__", private_values)
+        for validator_name in template.after_validators:
+            element = getattr(element, validator_name)()
+        return element
+
+    @property
+    def render_context(self) -> RenderContext:
+        """
+        The layout configuration, links register and translator of this element (to create child elements with).
+        """
+        return RenderContext(self.layout_configuration, self.links_register, self.translator)
+
     @property
     @abstractmethod
     def width(self) -> float:
@@ -42,5 +143,85 @@ class VisualElement(BaseModel, ABC):
         pass
 
     @abstractmethod
-    def draw(self, dwg: Drawing, x: float, y: float) -> None:
+    def draw(self, dwg: SvgDrawing, x: float, y: float) -> None:
         pass
+
+    def layout(self) -> tuple[float, float]:
+        """
+        Layout pass: determines the size (width, height) of this element once and stores it. Drawing uses the stored size.
+
+        :return: The size of the element.
+        :rtype: tuple[float, float]
+        """
+        if self._layout_size is None:
+            for child in self.children:
+                child._parent = self
+            self._layout_size = self.measure()
+        return self._layout_size
+
+    def measure(self) -> tuple[float, float]:
+        """
+        Computes the size (width, height) of this element. Elements whose size depends on their children override this method
+        (and return the stored size from their width and height properties, see layout).
+
+        :return: The size of the element.
+        :rtype: tuple[float, float]
+        """
+        return (self.width, self.height)
+
+    def invalidate_layout(self) -> None:
+        """
+        Discards the stored size of this element and of all elements (and the page) that contain it. This needs to be called
+        after the children of an element changed.
+        """
+        self._layout_size = None
+        if self._parent is not None:
+            self._parent.invalidate_layout()
+
+    @property
+    def children(self) -> list[VisualElement]:
+        """
+        The elements contained in this element that are measured as part of its layout.
+        """
+        return []
+
+    def update_question(self, research_question: ResearchQuestion) -> bool:
+        """
+        Replaces the research question (with the same id) in this element and all elements it contains. Only the elements that
+        were created from this question are measured again (and the elements that contain them).
+
+        :param research_question: The new (edited) research question.
+        :type research_question: ResearchQuestion
+        :return: Whether this element (or any of its children) was created from the question.
+        :rtype: bool
+        """
+        updated = False
+        if isinstance(self, QuestionElement) and self.source_question.id == research_question.id:
+            self.set_research_question(research_question)
+            updated = True
+        for child in self.children:
+            updated = child.update_question(research_question) or updated
+        return updated
+
+
+class QuestionElement(ABC):
+    """
+    Mixin of the visual elements that are created from a research question. These are updated by VisualElement.update_question
+    when the question changes.
+    """
+
+    @property
+    @abstractmethod
+    def source_question(self) -> ResearchQuestion:
+        """
+        The research question this element was created from.
+        """
+
+    @abstractmethod
+    def set_research_question(self, research_question: ResearchQuestion) -> None:
+        """
+        Replaces the research question this element was created from and measures the element again.
+
+        :param research_question: The new (edited) research question.
+        :type research_question: ResearchQuestion
+        """
@@ -18,7 +18,8 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._primitive_batch import draw_line
 from enum import Enum
 from svk.visualization.elements._visual_element import VisualElement
 
@@ -36,29 +37,27 @@ class Alignment(Enum):
 
 
 class VisualElementsContainer(VisualElement):
-    def draw_vertical_separator(self, dwg: Drawing, x: float, y: float, element_height: float, color: str):
-        dwg.add(
-            dwg.line(
-                start=(x, y + self.layout_configuration.small_margin),
-                end=(x, y + element_height - self.layout_configuration.small_margin),
-                stroke_width=0.5,
-                stroke=color,
-            )
+    def draw_vertical_separator(self, dwg: SvgDrawing, x: float, y: float, element_height: float, color: str):
+        draw_line(
+            dwg,
+            start=(x, y + self.layout_configuration.small_margin),
+            end=(x, y + element_height - self.layout_configuration.small_margin),
+            stroke_width=0.5,
+            stroke=color,
         )
 
-    def draw_horizontal_separator(self, dwg: Drawing, x: float, y: float, element_width: float, color: str):
-        dwg.add(
-            dwg.line(
-                start=(x + self.layout_configuration.small_margin, y),
-                end=(x + element_width - self.layout_configuration.small_margin, y),
-                stroke_width=0.5,
-                stroke=color,
-            )
+    def draw_horizontal_separator(self, dwg: SvgDrawing, x: float, y: float, element_width: float, color: str):
+        draw_line(
+            dwg,
+            start=(x + self.layout_configuration.small_margin, y),
+            end=(x + element_width - self.layout_configuration.small_margin, y),
+            stroke_width=0.5,
+            stroke=color,
         )
 
     def draw_element(
         self,
-        dwg: Drawing,
+        dwg: SvgDrawing,
         element: VisualElement,
         x_container: float,
         y_container: float,
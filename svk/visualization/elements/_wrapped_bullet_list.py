@@ -1,4 +1,4 @@
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from pydantic import PrivateAttr, model_validator
 from svk.visualization.elements._visual_element import VisualElement
 from svk.visualization.helpers._wrappedtext import wrapped_text, wrapped_lines
@@ -28,7 +28,7 @@ class WrappedBulletListElement(VisualElement):
     def width(self) -> float:
         return self._width
 
-    def draw(self, dwg: Drawing, x: float, y: float) -> None:
+    def draw(self, dwg: SvgDrawing, x: float, y: float) -> None:
         y_current = y + self.layout_configuration.small_margin
         if len(self.bullet_list) == 1 and self.bullet_list[0] == "-":
             dwg.add(
@@ -70,6 +70,7 @@ class WrappedBulletListElement(VisualElement):
                     ),
                     text_anchor="start",
                     dominant_baseline="text-before-edge",
+                    text_style=self.layout_configuration.text_styles["body"],
                 )
             )
             y_current += len(lines) * self.layout_configuration.font_size * 1.2
\ No newline at end of file
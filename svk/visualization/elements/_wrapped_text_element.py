@@ -1,4 +1,4 @@
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from pydantic import PrivateAttr, model_validator
 from svk.visualization.elements._visual_element import VisualElement
 from svk.visualization.helpers._wrappedtext import wrapped_text, wrapped_lines
@@ -27,7 +27,7 @@ class WrappedTextElement(VisualElement):
     def width(self) -> float:
         return self._width
 
-    def draw(self, dwg: Drawing, x: float, y: float) -> None:
+    def draw(self, dwg: SvgDrawing, x: float, y: float) -> None:
         dwg.add(    
             wrapped_text(
                 dwg,
@@ -38,5 +38,6 @@ class WrappedTextElement(VisualElement):
                 ),
                 text_anchor="start",
                 dominant_baseline="text-before-edge",
+                text_style=self.layout_configuration.text_styles["body"],
             )
         )
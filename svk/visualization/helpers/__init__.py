@@ -18,9 +18,18 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from ._measuretext import measure_text
+from ._measuretext import measure_text, measure_texts
+from ._font_metrics import FontMetrics, get_font_metrics
 from ._drawchevron import draw_half_chevron
-from ._wrappedtext import wrapped_text, wrapped_lines
+from ._wrappedtext import wrapped_text, wrapped_lines, wrapped_lines_for_widths
+from ._line_breaker import LineBreaker
 from ._greyfraction import color_toward_grey
-from ._draw_scaled_icon import draw_scaled_icon
+from ._draw_scaled_icon import draw_scaled_icon, get_icon_library
 from ._draw_disclaimer import draw_disclaimer
+from ._text_layout_cache import TextLayoutCache, use_text_layout_cache, get_text_layout_cache
+from ._streaming_svg import SvgDrawing, SvgElement, StreamingDrawing, create_drawing
+from ._defs_registry import DefsRegistry, get_defs_registry
+from ._icon_library import CompiledIcon, IconLibrary
+from ._text_styles import TextStyle, add_text_styles, text_style_attributes
+from ._primitive_batch import PrimitiveBatch, collect_primitives, draw_line, draw_dot
+from ._page_chrome import ChromeFragment, PageChrome
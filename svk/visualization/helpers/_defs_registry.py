@@ -0,0 +1,119 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from threading import Lock
+from typing import Any, Callable, Hashable
+from weakref import WeakKeyDictionary
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+
+
+def _content_key(element: Any) -> Hashable:
+    """
+    Returns a key that describes the content of a definition (its tag, attributes except the id and its sub elements).
+    """
+    attributes = tuple(sorted((key, str(value)) for key, value in element.attribs.items() if key != "id" and value is not None))
+    return (element.elementname, attributes, tuple(_content_key(sub_element) for sub_element in element.elements))
+
+
+class DefsRegistry:
+    """
+    Index of the definitions (symbols, gradients) of a single drawing.
+
+    Definitions are looked up by key in a dictionary instead of by scanning the defs of the drawing. Gradients are keyed by their
+    content, such that identical gradients (same stops and geometry) are only defined once.
+    """
+
+    def __init__(self, dwg: SvgDrawing):
+        self.dwg: SvgDrawing = dwg
+        """The drawing the definitions belong to."""
+        self._definitions: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Returns the definition registered with a key, or None if there is none.
+
+        :param key: The key of the definition (the id of a symbol for example).
+        :type key: Hashable
+        :return: The definition or None.
+        :rtype: Any | None
+        """
+        return self._definitions.get(key)
+
+    def register(self, key: Hashable, definition: Any):
+        """
+        Registers a definition that was added to the drawing by other means (for example the text styles of a style sheet).
+
+        :param key: The key of the definition.
+        :type key: Hashable
+        :param definition: The definition.
+        :type definition: Any
+        """
+        self._definitions[key] = definition
+
+    def get_or_add(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """
+        Returns the definition registered with a key. The definition is created and added to the defs of the drawing if it was
+        not registered yet.
+
+        :param key: The key of the definition.
+        :type key: Hashable
+        :param create: Function that creates the (complete) definition.
+        :type create: Callable[[], Any]
+        :return: The definition.
+        :rtype: Any
+        """
+        definition = self._definitions.get(key)
+        if definition is None:
+            definition = create()
+            self.dwg.defs.add(definition)
+            self._definitions[key] = definition
+        return definition
+
+    def add_gradient(self, gradient: Any) -> str:
+        """
+        Adds a (complete) gradient to the defs of the drawing, unless an identical gradient was added before.
+
+        :param gradient: The linear or radial gradient, including its stops.
+        :type gradient: Any
+        :return: The id of the gradient that should be referred to.
+        :rtype: str
+        """
+        return self.get_or_add(_content_key(gradient), lambda: gradient).get_id()
+
+
+_registries: WeakKeyDictionary = WeakKeyDictionary()
+_registries_lock = Lock()
+
+
+def get_defs_registry(dwg: SvgDrawing) -> DefsRegistry:
+    """
+    Returns the definitions registry of a drawing (created when it is first requested).
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :return: The registry of the drawing.
+    :rtype: DefsRegistry
+    """
+    with _registries_lock:
+        registry = _registries.get(dwg)
+        if registry is None:
+            registry = DefsRegistry(dwg)
+            _registries[dwg] = registry
+        return registry
@@ -18,12 +18,16 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from svk.visualization.helpers._radial_gradient import create_radial_gradient
+from svk.visualization.helpers._shape_templates import define_shape, has_shape, place_shape
+from collections import Counter
+from typing import Iterable
+from uuid import uuid4
 
 
 def draw_callout(
-    dwg: Drawing,
+    dwg: SvgDrawing,
     x: float,
     y: float,
     width: float,
@@ -33,12 +37,13 @@ def draw_callout(
     arrow_height: float = 30.0,
     arrow_depth: float = 20,
     gradient_center: float = 0.3,
+    use_template: bool | None = True,
 ):
     """
     Draws a callout object and adds it to the drawing.
 
     :param dwg: The svgwrite.Drawing object the callout should be added to.
-    :type dwg: Drawing
+    :type dwg: SvgDrawing
     :param x: The x-position (in points) of the left upper corner of the callout.
     :type x: float
     :param y: The y-position (in points) of the left upper corner of the callout.
@@ -57,22 +62,81 @@ def draw_callout(
     :type arrow_depth: float
     :param gradient_center: The location of the center of the radial gradient (horizontal, relative to the width). This needs to be in the range [0-1]
     :type gradient_center: float
+    :param use_template: Whether to place a shared callout template (with the same size) instead of drawing a separate polygon.
+        When None, the template is only placed when it was defined before (see define_callout_templates), such that callouts of
+        which the size varies are drawn inline instead of each defining a template that is used once.
+    :type use_template: bool | None
     """
 
     if gradient_center > 1 or gradient_center < 0:
         raise ValueError
 
-    gradient_id = create_radial_gradient(
-        dwg=dwg, x=x + gradient_center * width, y=y, width=(1 - gradient_center) * width * 2, height=arrow_height * 2, color=color
-    )
+    if use_template is None:
+        use_template = has_shape(dwg, _template_key(width, height, arrow_height, arrow_depth))
 
-    points = [
+    if use_template:
+        # The template and gradient are relative to the left upper corner, such that callouts of the same size and color share them.
+        gradient_id = create_radial_gradient(
+            dwg=dwg, x=gradient_center * width, y=0, width=(1 - gradient_center) * width * 2, height=arrow_height * 2, color=color
+        )
+        polygon = place_shape(
+            dwg,
+            _template_key(width, height, arrow_height, arrow_depth),
+            lambda: _create_template(dwg, width, height, arrow_height, arrow_depth),
+            insert=(x, y),
+            stroke=color,
+            fill=f"url(#{gradient_id})",
+            stroke_width=stroke_width,
+        )
+    else:
+        gradient_id = create_radial_gradient(
+            dwg=dwg, x=x + gradient_center * width, y=y, width=(1 - gradient_center) * width * 2, height=arrow_height * 2, color=color
+        )
+        points = _callout_points(x, y, width, height, arrow_height, arrow_depth)
+        polygon = dwg.polygon(points=points, stroke=color, fill=f"url(#{gradient_id})", stroke_width=stroke_width)
+    dwg.add(polygon)
+
+
+def define_callout_templates(
+    dwg: SvgDrawing, sizes: Iterable[tuple[float, float]], arrow_height: float = 30.0, arrow_depth: float = 20
+):
+    """
+    Defines a shared callout template for every size that occurs more than once, before the callouts are drawn. Callouts that
+    are drawn with use_template=None place these templates and draw the other sizes inline.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param sizes: The size (width, height) of every callout that will be drawn.
+    :type sizes: Iterable[tuple[float, float]]
+    :param arrow_height: The height of the arrow of the callouts.
+    :type arrow_height: float
+    :param arrow_depth: The depth of the arrow of the callouts.
+    :type arrow_depth: float
+    """
+    for (width, height), count in Counter(sizes).items():
+        if count > 1:
+            define_shape(
+                dwg,
+                _template_key(width, height, arrow_height, arrow_depth),
+                lambda: _create_template(dwg, width, height, arrow_height, arrow_depth),
+            )
+
+
+def _template_key(width: float, height: float, arrow_height: float, arrow_depth: float) -> tuple:
+    return ("callout", width, height, arrow_height, arrow_depth)
+
+
+def _create_template(dwg: SvgDrawing, width: float, height: float, arrow_height: float, arrow_depth: float):
+    return dwg.polygon(points=_callout_points(0, 0, width, height, arrow_height, arrow_depth), id=str(uuid4()))
+
+
+def _callout_points(
+    x: float, y: float, width: float, height: float, arrow_height: float, arrow_depth: float
+) -> list[tuple[float, float]]:
+    return [
         (x, y),
         (x + width, y),
         (x + width, y + height),
         (x + arrow_depth, y + height),
         (x + arrow_depth, y + arrow_height),
     ]
-
-    polygon = dwg.polygon(points=points, stroke=color, fill=f"url(#{gradient_id})", stroke_width=stroke_width)
-    dwg.add(polygon)
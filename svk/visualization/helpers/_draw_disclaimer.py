@@ -19,23 +19,25 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 import re
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._text_styles import TextStyle, text_style_attributes
 
 
 def draw_disclaimer(
-    dwg: Drawing,
+    dwg: SvgDrawing,
     disclaimer_text: str,
     insert: tuple[float, float],
     dominant_baseline: str = "hanging",
     text_anchor: str = "start",
     font_size: float = 12,
     links: list[tuple[str, str]] = [],
+    text_style: TextStyle | None = None,
 ):
     """
     This function helps to draw a disclaimer. It replaces specific words in the specified text with links and draws it on a svgwrite.Drawing.
 
     :param dwg: The svgwrite.Drawing object that should contain the disclaimer.
-    :type dwg: Drawing
+    :type dwg: SvgDrawing
     :param disclaimer_text: The actual disclaimer text.
     :type disclaimer_text: str
     :param insert: The insert (x,y) of the disclaimer (start position, see also text_anchor and dominant_baseline)
@@ -48,6 +50,53 @@ def draw_disclaimer(
     :type font_size: float
     :param links: A description of the links that should replace text (first tuple value is a string that should be a hyperlink, second tuple value is the actual link it should refer to).
     :type links: list[tuple[str, str]]
+    :param text_style: A named text style. When specified, it replaces the font size and is only set on the text element.
+    :type text_style: TextStyle | None
+    """
+    dwg.add(
+        create_disclaimer(
+            dwg,
+            disclaimer_text,
+            insert,
+            dominant_baseline=dominant_baseline,
+            text_anchor=text_anchor,
+            font_size=font_size,
+            links=links,
+            text_style=text_style,
+        )
+    )
+
+
+def create_disclaimer(
+    dwg: SvgDrawing,
+    disclaimer_text: str,
+    insert: tuple[float, float],
+    dominant_baseline: str = "hanging",
+    text_anchor: str = "start",
+    font_size: float = 12,
+    links: list[tuple[str, str]] = [],
+    text_style: TextStyle | None = None,
+):
+    """
+    Creates (without adding it) the text element of a disclaimer. Specific words in the specified text are replaced with links.
+
+    :param dwg: The drawing the disclaimer is created for.
+    :type dwg: SvgDrawing
+    :param disclaimer_text: The actual disclaimer text.
+    :type disclaimer_text: str
+    :param insert: The insert (x,y) of the disclaimer (start position, see also text_anchor and dominant_baseline)
+    :type insert: tuple[float, float]
+    :param dominant_baseline: The dominant baseline, determines where the string is placed relative to the specified insert (see also svgwrite documentation).
+    :type dominant_baseline: str
+    :param text_anchor: The text_anchor, determines where the string is placed relative to the specified insert (see also svgwrite documentation).
+    :type text_anchor: str
+    :param font_size: The font size used to draw the text.
+    :type font_size: float
+    :param links: A description of the links that should replace text (first tuple value is a string that should be a hyperlink, second tuple value is the actual link it should refer to).
+    :type links: list[tuple[str, str]]
+    :param text_style: A named text style. When specified, it replaces the font size and is only set on the text element.
+    :type text_style: TextStyle | None
+    :return: The text element.
     """
     pattern = f"({'|'.join(map(re.escape, [l[0] for l in links]))})"
     parts = re.split(pattern, disclaimer_text)
@@ -57,7 +106,7 @@ def draw_disclaimer(
         insert=insert,
         dominant_baseline=dominant_baseline,
         text_anchor=text_anchor,
-        font_size=font_size,
+        **(text_style_attributes(dwg, text_style) if text_style is not None else {"font_size": font_size}),
         **{"xml:space": "preserve"},
     )
 
@@ -77,6 +126,6 @@ def draw_disclaimer(
 
             disclaimer_text_element.add(link)
         else:
-            disclaimer_text_element.add(dwg.tspan(part, font_size=font_size))
+            disclaimer_text_element.add(dwg.tspan(part) if text_style is not None else dwg.tspan(part, font_size=font_size))
 
-    dwg.add(disclaimer_text_element)
+    return disclaimer_text_element
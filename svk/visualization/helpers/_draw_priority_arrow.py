@@ -18,15 +18,19 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._shape_templates import place_shape
+from uuid import uuid4
 
 
-def draw_priority_arrow(dwg: Drawing, x: float, y: float, width: float, height: float = 5, stroke_color="black"):
+def draw_priority_arrow(
+    dwg: SvgDrawing, x: float, y: float, width: float, height: float = 5, stroke_color="black", use_template: bool = True
+):
     """
     This function draws a simple arror (directed upward) at the specified position.
 
     :param dwg: The svgwrite.Drawing object used to draw the arrow with.
-    :type dwg: Drawing
+    :type dwg: SvgDrawing
     :param x: The x-position of the left of the arrow.
     :type x: float
     :param y: The y-position of the middle of the arrow.
@@ -36,8 +40,22 @@ def draw_priority_arrow(dwg: Drawing, x: float, y: float, width: float, height:
     :param height: The height of the arrow.
     :type height: float
     :param stroke_color: The stroke color of the arrow.
+    :param use_template: Whether to place a shared arrow template (with the same size) instead of drawing separate lines.
+    :type use_template: bool
     """
     stroke_width = 3
+    if use_template:
+        dwg.add(
+            place_shape(
+                dwg,
+                ("priority-arrow", width, height),
+                lambda: _create_arrow_template(dwg, width, height, stroke_width),
+                insert=(x, y),
+                stroke=stroke_color,
+            )
+        )
+        return
+
     line1 = dwg.line(
         start=(x, y + height / 2),
         end=(x + width / 2, y - height / 2),
@@ -54,3 +72,10 @@ def draw_priority_arrow(dwg: Drawing, x: float, y: float, width: float, height:
     )
     dwg.add(line1)
     dwg.add(line2)
+
+
+def _create_arrow_template(dwg: SvgDrawing, width: float, height: float, stroke_width: float):
+    template = dwg.g(id=str(uuid4()))
+    template.add(dwg.line(start=(0, height / 2), end=(width / 2, -height / 2), stroke_width=stroke_width, stroke_linecap="round"))
+    template.add(dwg.line(start=(width / 2, -height / 2), end=(width, height / 2), stroke_width=stroke_width, stroke_linecap="round"))
+    return template
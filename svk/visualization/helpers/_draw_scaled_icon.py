@@ -18,9 +18,12 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._icon_library import CompiledIcon, IconFragment, IconLibrary
+from svk.visualization.helpers._defs_registry import get_defs_registry
 from svk.data import StormSurgeBarrier
 from uuid import uuid4
+from functools import lru_cache
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
 
@@ -33,14 +36,24 @@ class SvgObject(ABC, BaseModel):
     """
 
     @abstractmethod
-    def create(self, dwg: Drawing):
+    def compile(self) -> IconFragment:
+        """
+        Compiles the svg object into a fragment that can be created in any drawing.
+
+        :return: The drawing factory, its keyword arguments and the sub elements.
+        :rtype: IconFragment
+        """
+        pass
+
+    def create(self, dwg: SvgDrawing):
         """
         Create the svg object
 
         :param dwg: The svgwrite.Drawing object that should be used to create the svg object.
-        :type dwg: Drawing
+        :type dwg: SvgDrawing
         """
-        pass
+        factory, arguments, _ = self.compile()
+        return getattr(dwg, factory)(**arguments)
 
 
 class Symbol(SvgObject):
@@ -57,37 +70,45 @@ class Symbol(SvgObject):
     objects: list[SvgObject] = []
     """A list of svg objects that form the symbol"""
 
-    def create(self, dwg: Drawing):
+    def compile(self) -> IconFragment:
+        icon = self.compile_icon()
+        return ("symbol", {"id": icon.id, "viewBox": icon.view_box}, icon.fragments)
+
+    def compile_icon(self) -> CompiledIcon:
         """
-        Retrieves the symbol from the defs of the dwg, or creates the symbol and adds it to the defs if necessary.
+        Compiles the symbol into an icon that can be placed by reference.
 
-        :param dwg: The svgwrite.Drawing that should be used to create the symbol.
-        :type dwg: Drawing
+        :return: The compiled icon.
+        :rtype: CompiledIcon
         """
-        for element in dwg.defs.elements:
-            if element.get_id() == self.id:
-                return element
+        return CompiledIcon(
+            id=self.id,
+            view_box=f"0 0 {self.width} {self.height}",
+            fragments=tuple(svg_object.compile() for svg_object in self.objects),
+        )
 
-        icon_symbol = dwg.symbol(id=self.id, viewBox=f"0 0 {self.width} {self.height}")
-        for svg_object in self.objects:
-            icon_symbol.add(svg_object.create(dwg))
-        dwg.defs.add(icon_symbol)
+    def create(self, dwg: SvgDrawing):
+        """
+        Retrieves the symbol from the defs of the dwg, or creates the symbol and adds it to the defs if necessary.
 
-        return icon_symbol
+        :param dwg: The svgwrite.Drawing that should be used to create the symbol.
+        :type dwg: SvgDrawing
+        """
+        icon = self.compile_icon()
+        return get_defs_registry(dwg).get_or_add(self.id, lambda: icon.create_symbol(dwg))
 
-    def add_to_dwg(self, dwg: Drawing, insert: tuple[float, float], size: tuple[float, float]) -> None:
+    def add_to_dwg(self, dwg: SvgDrawing, insert: tuple[float, float], size: tuple[float, float]) -> None:
         """
         Add the symbol to the defs of a dwg and use it at the specified location.
 
         :param dwg: The svgwrite.Drawing object
-        :type dwg: Drawing
+        :type dwg: SvgDrawing
         :param insert: The location of the top left of the symbol
         :type insert: tuple[float, float]
         :param size: the target size of the symbol
         :type size: tuple[float, float]
         """
-        icon_symbol = self.create(dwg)
-        dwg.add(dwg.use(icon_symbol, insert=insert, size=size))
+        self.compile_icon().place(dwg=dwg, insert=insert, size=size)
 
 
 class Path(SvgObject):
@@ -108,32 +129,24 @@ class Path(SvgObject):
     stroke_width: float = 20.0
     """Stroke width"""
 
-    def create(self, dwg: Drawing):
+    def compile(self) -> IconFragment:
         """
-        Creates an svg Path element that can be added to a symbol or directly added to an svgwrite.Drawing.
+        Compiles the Path into a fragment that can be added to a symbol or directly added to an svgwrite.Drawing.
 
-        :param dwg: The svgwrite.Drawing object to add this Path to.
-        :type dwg: Drawing
+        :return: The drawing factory, its keyword arguments and the sub elements.
+        :rtype: IconFragment
         """
-        if self.transform is None:
-            return dwg.path(
-                d=self.d,
-                fill=self.fill,
-                stroke="black",
-                stroke_linecap=self.stroke_linecap,
-                stroke_linejoin=self.stroke_linejoin,
-                stroke_width=self.stroke_width,
-            )
-        else:
-            return dwg.path(
-                d=self.d,
-                fill=self.fill,
-                stroke="black",
-                stroke_linecap=self.stroke_linecap,
-                stroke_linejoin=self.stroke_linejoin,
-                stroke_width=self.stroke_width,
-                transform=self.transform,
-            )
+        arguments = {
+            "d": self.d,
+            "fill": self.fill,
+            "stroke": "black",
+            "stroke_linecap": self.stroke_linecap,
+            "stroke_linejoin": self.stroke_linejoin,
+            "stroke_width": self.stroke_width,
+        }
+        if self.transform is not None:
+            arguments["transform"] = self.transform
+        return ("path", arguments, ())
 
 
 class Rect(SvgObject):
@@ -160,39 +173,34 @@ class Rect(SvgObject):
     fill: str = "#000000"
     """Fill color to be used"""
 
-    def create(self, dwg: Drawing):
+    def compile(self) -> IconFragment:
         """
-        Creates an svg Rect element that can be added to a symbol or directly added to an svgwrite.Drawing.
+        Compiles the Rect into a fragment that can be added to a symbol or directly added to an svgwrite.Drawing.
 
-        :param dwg: The svgwrite.Drawing object to add this Path to.
-        :type dwg: Drawing
+        :return: The drawing factory, its keyword arguments and the sub elements.
+        :rtype: IconFragment
         """
-        return dwg.rect(
-            insert=(self.x, self.y),
-            size=(self.width, self.height),
-            fill=self.fill,
-            stroke=self.stroke,
-            stroke_width=self.stroke_width,
-            stroke_linecap=self.stroke_linecap,
-            stroke_linejoin=self.strok_linejoin,
-        )
+        arguments = {
+            "insert": (self.x, self.y),
+            "size": (self.width, self.height),
+            "fill": self.fill,
+            "stroke": self.stroke,
+            "stroke_width": self.stroke_width,
+            "stroke_linecap": self.stroke_linecap,
+            "stroke_linejoin": self.strok_linejoin,
+        }
+        return ("rect", arguments, ())
 
 
 # TODO: This should be a separate module? This requires knowledge of the StormSurgeBarrier enum.
-def draw_scaled_icon(
-    dwg: Drawing, storm_surge_barrier: StormSurgeBarrier, insert: tuple[float, float], size: tuple[float, float] = (24, 24)
-):
+def barrier_symbol(storm_surge_barrier: StormSurgeBarrier) -> Symbol | None:
     """
-    This method adds and uses a symbol to represent a StormSurgeBarrier in an svgwrite.Drawing.
+    Returns the symbol that represents a StormSurgeBarrier.
 
-    :param dwg: The svgwrite.Drawing object to add the icon to.
-    :type dwg: Drawing
-    :param storm_surge_barrier: The storm surge barrier type to add an icon for.
+    :param storm_surge_barrier: The storm surge barrier type to return the symbol for.
     :type storm_surge_barrier: StormSurgeBarrier
-    :param insert: The insert (x-position, y-position) of the left upper corner of the icon.
-    :type insert: tuple[float, float]
-    :param size: The size (width and height) of the desired icon
-    :type size: tuple[float, float]
+    :return: The symbol, or None if there is no icon for the storm surge barrier.
+    :rtype: Symbol | None
     """
     ico = Symbol(id=storm_surge_barrier.name)
     match storm_surge_barrier:
@@ -302,6 +310,41 @@ def draw_scaled_icon(
                 )
             ]
         case _:
-            return
+            return None
+
+    return ico
+
+
+@lru_cache(maxsize=None)
+def get_icon_library() -> IconLibrary:
+    """
+    Returns the (shared) icon library, containing an icon for each StormSurgeBarrier (by name). The icons are compiled once per
+    process; external icon sets can be added with IconLibrary.load_directory.
+
+    :return: The icon library.
+    :rtype: IconLibrary
+    """
+    icon_library = IconLibrary()
+    for storm_surge_barrier in StormSurgeBarrier:
+        symbol = barrier_symbol(storm_surge_barrier)
+        if symbol is not None:
+            icon_library.add(storm_surge_barrier.name, symbol.compile_icon())
+    return icon_library
+
+
+def draw_scaled_icon(
+    dwg: SvgDrawing, storm_surge_barrier: StormSurgeBarrier, insert: tuple[float, float], size: tuple[float, float] = (24, 24)
+):
+    """
+    This method adds and uses a symbol to represent a StormSurgeBarrier in an svgwrite.Drawing.
 
-    ico.add_to_dwg(dwg=dwg, insert=insert, size=size)
+    :param dwg: The svgwrite.Drawing object to add the icon to.
+    :type dwg: SvgDrawing
+    :param storm_surge_barrier: The storm surge barrier type to add an icon for.
+    :type storm_surge_barrier: StormSurgeBarrier
+    :param insert: The insert (x-position, y-position) of the left upper corner of the icon.
+    :type insert: tuple[float, float]
+    :param size: The size (width and height) of the desired icon
+    :type size: tuple[float, float]
+    """
+    get_icon_library().place(dwg=dwg, name=storm_surge_barrier.name, insert=insert, size=size)
@@ -18,13 +18,14 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from uuid import uuid4
 from svk.visualization.helpers._radial_gradient import create_radial_gradient
+from svk.visualization.helpers._shape_templates import place_shape
 
 
 def draw_half_chevron(
-    dwg: Drawing,
+    dwg: SvgDrawing,
     x: float,
     y: float,
     width: float,
@@ -35,12 +36,13 @@ def draw_half_chevron(
     header_size: float = 30,
     add_to_dwg: bool = True,
     gradient_center: float = 0.3,
+    use_template: bool = True,
 ):
     """
     Draws a chevron inside an svgwrite.Drawing object.
 
     :param dwg: The svgwrite.Drawing object to add it to
-    :type dwg: Drawing
+    :type dwg: SvgDrawing
     :param x: x-position of the left upper corner of the chevron
     :type x: float
     :param y: y-position of the left upper corner of the chevron
@@ -61,16 +63,42 @@ def draw_half_chevron(
     :type add_to_dwg: bool
     :param gradient_center: The location of the center of the radial gradient (horizontal, relative to the width). This needs to be in the range [0-1]
     :type gradient_center: float
+    :param use_template: Whether to place a shared chevron template (with the same size) instead of drawing a separate polygon.
+    :type use_template: bool
     """
 
     if gradient_center > 1 or gradient_center < 0:
         raise ValueError
 
-    gradient_id = create_radial_gradient(
-        dwg=dwg, x=x + gradient_center * width, y=y, width=(1 - gradient_center) * width * 2, height=header_size * 2, color=color
-    )
+    if use_template:
+        # The template and gradient are relative to the left upper corner, such that chevrons of the same size and color share them.
+        gradient_id = create_radial_gradient(
+            dwg=dwg, x=gradient_center * width, y=0, width=(1 - gradient_center) * width * 2, height=header_size * 2, color=color
+        )
+        polygon = place_shape(
+            dwg,
+            ("half-chevron", width, height, arrow_depth),
+            lambda: dwg.polygon(points=_chevron_points(0, 0, width, height, arrow_depth), id=str(uuid4())),
+            insert=(x, y),
+            stroke=color,
+            fill=f"url(#{gradient_id})",
+            stroke_width=stroke_width,
+        )
+    else:
+        gradient_id = create_radial_gradient(
+            dwg=dwg, x=x + gradient_center * width, y=y, width=(1 - gradient_center) * width * 2, height=header_size * 2, color=color
+        )
+        points = _chevron_points(x, y, width, height, arrow_depth)
+        polygon = dwg.polygon(points=points, stroke=color, fill=f"url(#{gradient_id})", stroke_width=stroke_width, id=str(uuid4()))
 
-    points = [
+    if add_to_dwg:
+        dwg.add(polygon)
+
+    return polygon
+
+
+def _chevron_points(x: float, y: float, width: float, height: float, arrow_depth: float) -> list[tuple[float, float]]:
+    return [
         (x, y),
         (x + width - arrow_depth, y),
         (x + width, y + height / 2),
@@ -78,9 +106,3 @@ def draw_half_chevron(
         (x + arrow_depth, y + height),
         (x + arrow_depth, y + height / 2),
     ]
-    polygon = dwg.polygon(points=points, stroke=color, fill=f"url(#{gradient_id})", stroke_width=stroke_width, id=str(uuid4()))
-
-    if add_to_dwg:
-        dwg.add(polygon)
-
-    return polygon
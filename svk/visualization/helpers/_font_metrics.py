@@ -0,0 +1,184 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from threading import RLock
+from typing import Any, Callable
+from PIL import ImageFont
+import os
+
+default_font_file = os.path.join(os.path.dirname(__file__), "ARIAL.TTF")
+"""The font file used to predict text sizes (arial)."""
+
+
+def _pixel(value: int) -> int:
+    """
+    Rounds a 26.6 fixed point value (1/64 pixel) to whole pixels, the same way FreeType (and thus Pillow) does.
+    """
+    return (value + 32) >> 6
+
+
+class FontMetrics:
+    """
+    Predicts text sizes for a single (font file, font size) pair.
+
+    The font is loaded once. Strings are measured by walking a per-glyph table (advance and bounding box) and a table with
+    kerning corrections for pairs of glyphs. Both tables are filled lazily, so no glyph is loaded (and no text is rasterized)
+    more than once. The outcome equals the width and height of the bounding box Pillow reports for the same text.
+    """
+
+    def __init__(self, font_file: str, font_size: int, max_cached_strings: int = 4096):
+        self.font_file: str = font_file
+        """The font file (truetype) these metrics are based on."""
+        self.font_size: int = font_size
+        """The font size in pixels."""
+        self.max_cached_strings: int = max_cached_strings
+        """The maximum number of measured strings (and advances) that is remembered (least recently used strings are dropped first)."""
+
+        self._font = ImageFont.truetype(font_file, font_size)
+        self._glyphs: dict[str, tuple[int, int, int | None, int, int]] = {}
+        """Per character: advance (26.6), left of the box, right of the box (None when within the advance), top and bottom."""
+        self._kerning: dict[tuple[str, str], int] = {}
+        """Kerning correction (26.6) of the advance of the first character of a pair."""
+        self._measured: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self._advances: OrderedDict[str, int] = OrderedDict()
+        self._lock = RLock()
+
+    def measure(self, text: str) -> tuple[int, int]:
+        """
+        Returns the predicted width and height of a text in pixels.
+
+        :param text: The text to measure.
+        :type text: str
+        :return: Tuple of predicted text dimensions (width, height) in pixels.
+        :rtype: tuple[int, int]
+        """
+        return self._remember(self._measured, text, self._measure)
+
+    def advance(self, text: str) -> int:
+        """
+        Returns the distance the pen moves when writing a text (including kerning), in 1/64 pixels.
+
+        :param text: The text to measure.
+        :type text: str
+        :return: The advance of the text in 1/64 pixels.
+        :rtype: int
+        """
+        return self._remember(self._advances, text, self._advance)
+
+    def kerning(self, first: str, second: str) -> int:
+        """
+        Returns the kerning correction (in 1/64 pixels) of the advance of a character when it is followed by another character.
+
+        :param first: The first character of the pair.
+        :type first: str
+        :param second: The second character of the pair.
+        :type second: str
+        :return: The kerning correction in 1/64 pixels.
+        :rtype: int
+        """
+        with self._lock:
+            return self._kern(first, second)
+
+    def left(self, character: str) -> int:
+        """
+        Returns how far (in pixels) the box of a character extends to the left of the pen position (zero or negative).
+
+        :param character: The character.
+        :type character: str
+        :return: The left of the box of the character in pixels.
+        :rtype: int
+        """
+        with self._lock:
+            return self._glyph(character)[1]
+
+    def _remember(self, cache: OrderedDict, text: str, compute: Callable[[str], Any]) -> Any:
+        with self._lock:
+            value = cache.get(text)
+            if value is not None:
+                cache.move_to_end(text)
+                return value
+
+            value = compute(text)
+            cache[text] = value
+            if len(cache) > self.max_cached_strings:
+                cache.popitem(last=False)
+
+        return value
+
+    def _advance(self, text: str) -> int:
+        advance = sum(self._glyph(character)[0] for character in text)
+        return advance + sum(self._kern(text[i_character], text[i_character + 1]) for i_character in range(len(text) - 1))
+
+    def _measure(self, text: str) -> tuple[int, int]:
+        # Same approach as Pillow: the box contains the pen line (0 to the end position) and the boxes of all glyphs.
+        position = 0
+        x_min = x_max = y_min = y_max = 0
+        for i_character, character in enumerate(text):
+            advance, left, right, top, bottom = self._glyph(character)
+            x_pen = _pixel(position)
+            if i_character + 1 < len(text):
+                advance += self._kern(character, text[i_character + 1])
+            position += advance
+
+            x_min = min(x_min, x_pen + left)
+            x_max = max(x_max, _pixel(position), x_pen + right if right is not None else x_pen)
+            y_min = top if i_character == 0 else min(y_min, top)
+            y_max = bottom if i_character == 0 else max(y_max, bottom)
+
+        return x_max - x_min, y_max - y_min
+
+    def _glyph(self, character: str) -> tuple[int, int, int | None, int, int]:
+        glyph = self._glyphs.get(character)
+        if glyph is None:
+            advance = round(self._font.getlength(character) * 64)
+            left, top, right, bottom = self._font.getbbox(character)
+            # A single glyph is always measured including the pen line (0 to advance). Only a box that extends further is
+            # relevant when this glyph is followed by other glyphs.
+            glyph = (advance, left, right if right > _pixel(advance) else None, top, bottom)
+            self._glyphs[character] = glyph
+        return glyph
+
+    def _kern(self, first: str, second: str) -> int:
+        kerning = self._kerning.get((first, second))
+        if kerning is None:
+            kerning = round(self._font.getlength(first + second) * 64) - self._glyph(first)[0] - self._glyph(second)[0]
+            self._kerning[(first, second)] = kerning
+        return kerning
+
+
+def get_font_metrics(font_size: int, font_file: str = default_font_file) -> FontMetrics:
+    """
+    Returns the (shared) font metrics for a font file and size. Each pair is only loaded once per process.
+
+    :param font_size: Font size in pixels.
+    :type font_size: int
+    :param font_file: The truetype font file, arial by default.
+    :type font_file: str
+    :return: The font metrics.
+    :rtype: FontMetrics
+    """
+    return _load_font_metrics(font_file, font_size)
+
+
+@lru_cache(maxsize=None)
+def _load_font_metrics(font_file: str, font_size: int) -> FontMetrics:
+    return FontMetrics(font_file=font_file, font_size=font_size)
@@ -0,0 +1,238 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any
+import warnings
+import xml.etree.ElementTree as ET
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._defs_registry import get_defs_registry
+
+IconFragment = tuple[str, dict[str, Any], tuple["IconFragment", ...]]
+"""A compiled svg element: the drawing factory to call (path, rect, ...), its keyword arguments and the sub elements."""
+
+
+class CompiledIcon:
+    """
+    An icon that is ready to be placed in a drawing: the symbol id, its view box and the (compiled) elements it consists of. The
+    symbol is defined once per drawing and every placement refers to it.
+    """
+
+    __slots__ = ("id", "view_box", "fragments")
+
+    def __init__(self, id: str, view_box: str, fragments: tuple[IconFragment, ...]):
+        self.id: str = id
+        """The id of the symbol."""
+        self.view_box: str = view_box
+        """The view box of the symbol."""
+        self.fragments: tuple[IconFragment, ...] = fragments
+        """The elements of the symbol."""
+
+    def create_symbol(self, dwg: SvgDrawing):
+        """
+        Creates the symbol element of this icon for a drawing (without adding it).
+
+        :param dwg: The drawing.
+        :type dwg: SvgDrawing
+        :return: The symbol element.
+        """
+        icon_symbol = dwg.symbol(id=self.id, viewBox=self.view_box)
+        for fragment in self.fragments:
+            icon_symbol.add(_create_element(dwg, fragment))
+        return icon_symbol
+
+    def place(self, dwg: SvgDrawing, insert: tuple[float, float], size: tuple[float, float]):
+        """
+        Uses the icon at the specified location. The symbol is added to the defs of the drawing when it is not defined yet.
+
+        :param dwg: The drawing.
+        :type dwg: SvgDrawing
+        :param insert: The location of the top left of the icon.
+        :type insert: tuple[float, float]
+        :param size: The size of the icon.
+        :type size: tuple[float, float]
+        """
+        icon_symbol = get_defs_registry(dwg).get_or_add(self.id, lambda: self.create_symbol(dwg))
+        dwg.add(dwg.use(icon_symbol, insert=insert, size=size))
+
+
+def _create_element(dwg: SvgDrawing, fragment: IconFragment):
+    factory, arguments, sub_fragments = fragment
+    element = getattr(dwg, factory)(**arguments)
+    for sub_fragment in sub_fragments:
+        element.add(_create_element(dwg, sub_fragment))
+    return element
+
+
+def _local_name(name: str) -> str | None:
+    """
+    Returns the name of an svg tag or attribute, or None if it belongs to another namespace (inkscape, sodipodi, ...).
+    """
+    if name.startswith("{"):
+        namespace, name = name[1:].split("}")
+        if namespace != "http://www.w3.org/2000/svg":
+            return None
+    return name
+
+
+def _points(points: str) -> list[tuple[str, str]]:
+    values = points.replace(",", " ").split()
+    return list(zip(values[0::2], values[1::2]))
+
+
+def _compile_svg_element(element: ET.Element) -> IconFragment | None:
+    tag = _local_name(element.tag)
+    attributes = {}
+    for key, value in element.attrib.items():
+        name = _local_name(key)
+        if name is not None and name != "id":
+            attributes[name] = value
+
+    match tag:
+        case "g":
+            arguments = attributes
+        case "path":
+            arguments = attributes
+        case "rect":
+            arguments = {
+                "insert": (attributes.pop("x", "0"), attributes.pop("y", "0")),
+                "size": (attributes.pop("width", "0"), attributes.pop("height", "0")),
+                **attributes,
+            }
+        case "circle":
+            arguments = {"center": (attributes.pop("cx", "0"), attributes.pop("cy", "0")), **attributes}
+        case "line":
+            arguments = {
+                "start": (attributes.pop("x1", "0"), attributes.pop("y1", "0")),
+                "end": (attributes.pop("x2", "0"), attributes.pop("y2", "0")),
+                **attributes,
+            }
+        case "polygon" | "polyline":
+            arguments = {"points": _points(attributes.pop("points", "")), **attributes}
+        case _:
+            # Definitions, metadata and editor specific elements are not part of the icon.
+            return None
+
+    sub_fragments = tuple(fragment for fragment in map(_compile_svg_element, element) if fragment is not None)
+    return (tag, arguments, sub_fragments)
+
+
+class IconLibrary:
+    """
+    A set of compiled icons, identified by name. Icons are compiled once (when they are added to the library), such that placing
+    an icon only creates its symbol once per drawing and refers to it afterwards.
+    """
+
+    def __init__(self):
+        self._icons: dict[str, CompiledIcon] = {}
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the icons in the library."""
+        return list(self._icons.keys())
+
+    def add(self, name: str, icon: CompiledIcon):
+        """
+        Adds an icon to the library (replacing an icon with the same name).
+
+        :param name: The name of the icon.
+        :type name: str
+        :param icon: The compiled icon.
+        :type icon: CompiledIcon
+        """
+        self._icons[name] = icon
+
+    def get(self, name: str) -> CompiledIcon | None:
+        """
+        Returns the icon with the specified name, or None if the library does not contain it.
+
+        :param name: The name of the icon.
+        :type name: str
+        :return: The compiled icon or None.
+        :rtype: CompiledIcon | None
+        """
+        return self._icons.get(name)
+
+    def place(self, dwg: SvgDrawing, name: str, insert: tuple[float, float], size: tuple[float, float]) -> bool:
+        """
+        Uses the icon with the specified name at a location in a drawing.
+
+        :param dwg: The drawing.
+        :type dwg: SvgDrawing
+        :param name: The name of the icon.
+        :type name: str
+        :param insert: The location of the top left of the icon.
+        :type insert: tuple[float, float]
+        :param size: The size of the icon.
+        :type size: tuple[float, float]
+        :return: Whether the library contains the icon (nothing is drawn otherwise).
+        :rtype: bool
+        """
+        icon = self._icons.get(name)
+        if icon is None:
+            return False
+        icon.place(dwg=dwg, insert=insert, size=size)
+        return True
+
+    def load_svg(self, file_path: str | Path, name: str | None = None) -> CompiledIcon:
+        """
+        Compiles an svg file into an icon and adds it to the library. Shapes, groups and their styles are kept, editor specific
+        content (inkscape, sodipodi) and ids are removed.
+
+        :param file_path: The svg file.
+        :type file_path: str | Path
+        :param name: The name (and symbol id) of the icon, the file name without extension by default.
+        :type name: str | None
+        :return: The compiled icon.
+        :rtype: CompiledIcon
+        """
+        file_path = Path(file_path)
+        try:
+            root = ET.parse(file_path).getroot()
+        except ET.ParseError as error:
+            raise ValueError(f"Icon file could not be read: {file_path} ({error})") from error
+
+        name = name if name is not None else file_path.stem
+        view_box = root.get("viewBox", f"0 0 {root.get('width', '100')} {root.get('height', '100')}")
+        fragments = tuple(fragment for fragment in map(_compile_svg_element, root) if fragment is not None)
+        icon = CompiledIcon(id=name, view_box=view_box, fragments=fragments)
+        self.add(name, icon)
+        return icon
+
+    def load_directory(self, directory: str | Path, prefix: str = "") -> list[str]:
+        """
+        Compiles all svg files in a directory into icons and adds them to the library. Files that cannot be read are skipped
+        (with a warning).
+
+        :param directory: The directory with svg files.
+        :type directory: str | Path
+        :param prefix: Prefix for the names of the icons (the file names without extension).
+        :type prefix: str
+        :return: The names of the icons that were added.
+        :rtype: list[str]
+        """
+        names = []
+        for file_path in sorted(Path(directory).glob("*.svg")):
+            try:
+                names.append(self.load_svg(file_path, name=f"{prefix}{file_path.stem}").id)
+            except ValueError as error:
+                warnings.warn(str(error))
+        return names
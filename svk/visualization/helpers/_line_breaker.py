@@ -0,0 +1,113 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from functools import lru_cache
+from math import floor
+import numpy as np
+
+from svk.visualization.helpers._font_metrics import get_font_metrics
+
+
+class LineBreaker:
+    """
+    Splits a text into lines for one or more maximum widths (arial font).
+
+    Every word (followed by a space) is measured once. The end position of each possible line is derived from the cumulative
+    advances of the words, so finding a break point is a search in a sorted array instead of re-measuring the growing line.
+    Lines are broken exactly like before: a line keeps the trailing space and a word that does not fit starts a new line.
+    """
+
+    def __init__(self, text: str, font_size: int = 12):
+        self.words: list[str] = text.split()
+        """The words of the text."""
+        self.font_size: int = font_size
+        """The font size used to measure the words."""
+
+        metrics = get_font_metrics(font_size)
+        n_words = len(self.words)
+        # All values in 1/64 pixels: the advance of each word plus its trailing space and the kerning between the space and the
+        # first character of the next word.
+        advances = np.array(
+            [metrics.advance(word) + metrics.kerning(word[-1], " ") + metrics.advance(" ") for word in self.words],
+            dtype=np.int64,
+        )
+        links = np.array(
+            [metrics.kerning(" ", self.words[i_word + 1][0]) for i_word in range(n_words - 1)] + [0],
+            dtype=np.int64,
+        )
+        self._starts = np.concatenate(([0], np.cumsum(advances + links)))
+        """Pen position (relative to the first word) at the start of each word."""
+        self._ends = self._starts[:-1] + advances
+        """Pen position at the end of a line that ends with each word (including the trailing space)."""
+        self._left_overhang = np.array([-min(0, metrics.left(word[0])) for word in self.words], dtype=np.int64)
+        """Number of pixels each word extends to the left when it is the first word of a line."""
+
+    def lines(self, max_width: float) -> list[str]:
+        """
+        Returns the lines for a maximum width.
+
+        :param max_width: the maximum width of the lines once printed as svg text elements
+        :type max_width: float
+        :return: A list of lines that don't exceed the specified maximum width
+        :rtype: list[str]
+        """
+        lines: list[str] = []
+        n_words = len(self.words)
+        i_start = 0
+        while i_start < n_words:
+            # The width of a line in pixels is round(advance / 64) plus the left overhang of its first word. Translate the
+            # maximum width to the largest advance (1/64 pixels) that still fits.
+            max_advance = 64 * floor(max_width - self._left_overhang[i_start]) + 31
+            i_end = int(np.searchsorted(self._ends, self._starts[i_start] + max_advance, side="right"))
+            if i_end <= i_start:
+                if i_start == 0:
+                    # The first word does not even fit on its own (kept for backwards compatibility).
+                    lines.append("")
+                i_end = i_start + 1
+            lines.append(" ".join(self.words[i_start:i_end]) + " ")
+            i_start = i_end
+
+        return lines
+
+    def lines_for_widths(self, max_widths: list[float]) -> list[list[str]]:
+        """
+        Returns the lines for several maximum widths, reusing the measured words.
+
+        :param max_widths: The maximum widths.
+        :type max_widths: list[float]
+        :return: The lines for each of the maximum widths (in the same order).
+        :rtype: list[list[str]]
+        """
+        return [self.lines(max_width) for max_width in max_widths]
+
+
+@lru_cache(maxsize=1024)
+def get_line_breaker(text: str, font_size: int = 12) -> LineBreaker:
+    """
+    Returns a (shared) line breaker for a text, such that wrapping the same text at another width does not measure it again.
+
+    :param text: The text that should be split into lines.
+    :type text: str
+    :param font_size: The font size of the text.
+    :type font_size: int
+    :return: The line breaker.
+    :rtype: LineBreaker
+    """
+    return LineBreaker(text=text, font_size=font_size)
@@ -18,8 +18,12 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from PIL import ImageFont
-import os
+import numpy as np
+from svk.visualization.helpers._font_metrics import FontMetrics, get_font_metrics, default_font_file
+from svk.visualization.helpers._text_layout_cache import get_text_layout_cache
+
+font_files: dict[str, str] = {"normal": default_font_file}
+"""The font files used to measure text per font weight."""
 
 
 def measure_text(text: str, font_size: int):
@@ -34,11 +38,39 @@ def measure_text(text: str, font_size: int):
         (width, height): Tuple of predicted text dimensions in pixels.
     """
 
-    font = ImageFont.truetype(os.path.join(os.path.dirname(__file__), "ARIAL.TTF"), font_size)
+    return _measure(get_font_metrics(font_size, default_font_file), text)
+
+
+def measure_texts(strings: list[str], font_size: int, weight: str = "normal") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the predicted widths and heights of a batch of texts in pixels, based on an arial font. Each distinct text is
+    only measured once.
+
+    :param strings: The texts to measure.
+    :type strings: list[str]
+    :param font_size: Font size in pixels.
+    :type font_size: int
+    :param weight: The font weight (a font file needs to be available for this weight, see font_files).
+    :type weight: str
+    :return: Arrays with the predicted widths and heights (in the same order as the specified strings).
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    if weight not in font_files:
+        raise ValueError(f"No font file available to measure text with font weight '{weight}'.")
+
+    metrics = get_font_metrics(font_size, font_files[weight])
+    sizes = {text: _measure(metrics, text) for text in dict.fromkeys(strings)}
+    measured = np.array([sizes[text] for text in strings], dtype=float).reshape(-1, 2)
+    return measured[:, 0], measured[:, 1]
+
 
-    # This requires pillow >= 8.0. Otherwise we should use font.getsize(text)
-    bbox = font.getbbox(text)
-    width = bbox[2] - bbox[0]
-    height = bbox[3] - bbox[1]
+def _measure(metrics: FontMetrics, text: str) -> tuple[int, int]:
+    cache = get_text_layout_cache()
+    if cache is None:
+        return metrics.measure(text)
 
-    return width, height
+    size = cache.get_size(text, metrics.font_size, metrics.font_file)
+    if size is None:
+        size = metrics.measure(text)
+        cache.set_size(text, metrics.font_size, metrics.font_file, size)
+    return size
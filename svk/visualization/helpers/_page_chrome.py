@@ -0,0 +1,198 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from threading import Lock
+from typing import Any, Callable, Hashable
+from uuid import uuid4
+from svk.visualization.helpers._streaming_svg import SvgDrawing, StreamingDrawing
+from svk.visualization.helpers._defs_registry import get_defs_registry
+from svk.visualization.helpers._draw_callout import _callout_points
+from svk.visualization.helpers._draw_disclaimer import create_disclaimer
+from svk.visualization.helpers._icon_library import CompiledIcon
+from svk.visualization.helpers._radial_gradient import radial_gradient
+from svk.visualization.helpers._text_styles import TextStyle, text_style_attributes
+
+
+class ChromeFragment:
+    """
+    Pre-rendered content that is placed on several pages, together with the definitions (gradients, symbols) it refers to.
+    """
+
+    __slots__ = ("elements", "definitions")
+
+    def __init__(self, elements: list[Any], definitions: list[tuple[Hashable, Callable[[SvgDrawing], Any]]]):
+        self.elements: list[Any] = elements
+        """The elements of the fragment."""
+        self.definitions: list[tuple[Hashable, Callable[[SvgDrawing], Any]]] = definitions
+        """The definitions the elements refer to (registry key and a function that creates the definition for a drawing)."""
+
+
+class PageChrome:
+    """
+    Cache of the chrome that is repeated on every page of a document: the title callout with its icon and the disclaimer
+    (including its links). Each fragment is created once (per text, style and size) and the same elements are added to every
+    page. Only the definitions the fragment refers to are added to the defs of each page.
+    """
+
+    def __init__(self):
+        self._fragments: dict[Hashable, ChromeFragment] = {}
+        self._lock = Lock()
+
+    def draw_disclaimer(
+        self,
+        dwg: SvgDrawing,
+        disclaimer_text: str,
+        insert: tuple[float, float],
+        text_style: TextStyle,
+        links: list[tuple[str, str]] = [],
+        dominant_baseline: str = "hanging",
+        text_anchor: str = "start",
+    ):
+        """
+        Draws a disclaimer (see draw_disclaimer). The disclaimer is created at the origin once and translated to the insert.
+
+        :param dwg: The drawing.
+        :type dwg: SvgDrawing
+        :param disclaimer_text: The actual disclaimer text.
+        :type disclaimer_text: str
+        :param insert: The insert (x,y) of the disclaimer (start position, see also text_anchor and dominant_baseline)
+        :type insert: tuple[float, float]
+        :param text_style: The text style of the disclaimer.
+        :type text_style: TextStyle
+        :param links: A description of the links that should replace text (text and link).
+        :type links: list[tuple[str, str]]
+        :param dominant_baseline: The dominant baseline of the text.
+        :type dominant_baseline: str
+        :param text_anchor: The text anchor of the text.
+        :type text_anchor: str
+        """
+        attributes = tuple(sorted(text_style_attributes(dwg, text_style).items()))
+        key = ("disclaimer", disclaimer_text, tuple(links), attributes, dominant_baseline, text_anchor)
+
+        def create() -> ChromeFragment:
+            disclaimer = create_disclaimer(
+                dwg,
+                disclaimer_text,
+                insert=(0, 0),
+                dominant_baseline=dominant_baseline,
+                text_anchor=text_anchor,
+                links=links,
+                text_style=text_style,
+            )
+            return ChromeFragment([disclaimer], [])
+
+        group = dwg.g(transform=f"translate({insert[0]},{insert[1]})")
+        self._place(dwg, key, create, group)
+        dwg.add(group)
+
+    def draw_icon_callout(
+        self,
+        dwg: SvgDrawing,
+        icon: CompiledIcon | None,
+        insert: tuple[float, float],
+        size: tuple[float, float],
+        icon_insert: tuple[float, float],
+        icon_size: tuple[float, float],
+        color: str = "#000000",
+        stroke_width: float = 0.5,
+        arrow_height: float = 30.0,
+        arrow_depth: float = 20,
+        gradient_center: float = 0.3,
+    ):
+        """
+        Draws a callout (see draw_callout) with an icon on top of it.
+
+        :param dwg: The drawing.
+        :type dwg: SvgDrawing
+        :param icon: The icon (nothing but the callout is drawn when None).
+        :type icon: CompiledIcon | None
+        :param insert: The location of the left upper corner of the callout.
+        :type insert: tuple[float, float]
+        :param size: The width and height of the callout.
+        :type size: tuple[float, float]
+        :param icon_insert: The location of the top left of the icon.
+        :type icon_insert: tuple[float, float]
+        :param icon_size: The size of the icon.
+        :type icon_size: tuple[float, float]
+        :param color: The color of the callout (stroke and center of the gradient).
+        :type color: str
+        :param stroke_width: The stroke width of the callout.
+        :type stroke_width: float
+        :param arrow_height: The height of the arrow of the callout.
+        :type arrow_height: float
+        :param arrow_depth: The depth of the arrow of the callout.
+        :type arrow_depth: float
+        :param gradient_center: The location of the center of the gradient (horizontal, relative to the width).
+        :type gradient_center: float
+        """
+        (x, y), (width, height) = insert, size
+        key = (
+            "icon-callout",
+            icon.id if icon is not None else None,
+            insert,
+            size,
+            icon_insert,
+            icon_size,
+            color,
+            stroke_width,
+            arrow_height,
+            arrow_depth,
+            gradient_center,
+        )
+
+        def create() -> ChromeFragment:
+            gradient_id = f"gradient_page_title_{str(uuid4())}"
+            points = _callout_points(x, y, width, height, arrow_height, arrow_depth)
+            elements = [dwg.polygon(points=points, stroke=color, fill=f"url(#{gradient_id})", stroke_width=stroke_width)]
+            definitions: list[tuple[Hashable, Callable[[SvgDrawing], Any]]] = [
+                (
+                    ("page-chrome", gradient_id),
+                    lambda drawing: radial_gradient(
+                        drawing,
+                        x=x + gradient_center * width,
+                        y=y,
+                        width=(1 - gradient_center) * width * 2,
+                        height=arrow_height * 2,
+                        color=color,
+                        gradient_id=gradient_id,
+                    ),
+                )
+            ]
+            if icon is not None:
+                elements.append(dwg.use(f"#{icon.id}", insert=icon_insert, size=icon_size))
+                definitions.append((icon.id, icon.create_symbol))
+            return ChromeFragment(elements, definitions)
+
+        self._place(dwg, key, create, dwg)
+
+    def _place(self, dwg: SvgDrawing, key: Hashable, create: Callable[[], ChromeFragment], parent: Any):
+        # Elements are specific to the kind of drawing (svgwrite or streaming), so fragments are cached per kind.
+        key = (isinstance(dwg, StreamingDrawing), key)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                fragment = create()
+                self._fragments[key] = fragment
+
+        defs_registry = get_defs_registry(dwg)
+        for definition_key, create_definition in fragment.definitions:
+            defs_registry.get_or_add(definition_key, lambda: create_definition(dwg))
+        for element in fragment.elements:
+            parent.add(element)
@@ -0,0 +1,155 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Hashable, Iterator
+from weakref import WeakKeyDictionary
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+
+
+class PrimitiveBatch:
+    """
+    Collects the strokes (line segments) and dots that are drawn on a single drawing and writes them as one path element per
+    style, instead of a line or circle element per primitive.
+
+    Primitives are grouped by their presentation attributes (stroke, stroke width, fill, ...). The paths are written in order of
+    the first use of each style when the batch is flushed, so batched primitives end up on top of the other content.
+    """
+
+    def __init__(self, dwg: SvgDrawing):
+        self._dwg = dwg
+        self._paths: dict[Hashable, tuple[dict[str, Any], list[str]]] = {}
+
+    def line(self, start: tuple[float, float], end: tuple[float, float], **style: Any):
+        """
+        Adds a straight stroke.
+
+        :param start: The start of the line.
+        :type start: tuple[float, float]
+        :param end: The end of the line.
+        :type end: tuple[float, float]
+        :param style: The presentation attributes of the line (stroke, stroke_width, ...).
+        :type style: Any
+        """
+        self._add({**style, "fill": "none"}, f"M{start[0]},{start[1]}L{end[0]},{end[1]}")
+
+    def dot(self, center: tuple[float, float], r: float, **style: Any):
+        """
+        Adds a dot (circle).
+
+        :param center: The center of the dot.
+        :type center: tuple[float, float]
+        :param r: The radius of the dot.
+        :type r: float
+        :param style: The presentation attributes of the dot (fill, ...).
+        :type style: Any
+        """
+        self._add(style, f"M{center[0] - r},{center[1]}a{r},{r} 0 1,0 {2 * r},0a{r},{r} 0 1,0 {-2 * r},0z")
+
+    def flush(self):
+        """
+        Adds a path element per style (with all primitives of that style) to the drawing and empties the batch.
+        """
+        for style, path_data in self._paths.values():
+            self._dwg.add(self._dwg.path(d="".join(path_data), **style))
+        self._paths = {}
+
+    def _add(self, style: dict[str, Any], path_data: str):
+        key = tuple(sorted((name, str(value)) for name, value in style.items()))
+        if key not in self._paths:
+            self._paths[key] = (style, [])
+        self._paths[key][1].append(path_data)
+
+
+_batches: WeakKeyDictionary = WeakKeyDictionary()
+_batches_lock = Lock()
+
+
+@contextmanager
+def collect_primitives(dwg: SvgDrawing, enabled: bool = True) -> Iterator[PrimitiveBatch | None]:
+    """
+    Collects all lines and dots that are drawn on a drawing (with draw_line and draw_dot) within the context and adds them as
+    one path per style when the context is left. Primitives are added directly when enabled is False.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param enabled: Whether primitives are collected.
+    :type enabled: bool
+    """
+    if not enabled:
+        yield None
+        return
+
+    batch = PrimitiveBatch(dwg)
+    with _batches_lock:
+        _batches[dwg] = batch
+    try:
+        yield batch
+    finally:
+        with _batches_lock:
+            _batches.pop(dwg, None)
+    batch.flush()
+
+
+def _get_batch(dwg: SvgDrawing) -> PrimitiveBatch | None:
+    with _batches_lock:
+        return _batches.get(dwg)
+
+
+def draw_line(dwg: SvgDrawing, start: tuple[float, float], end: tuple[float, float], **style: Any):
+    """
+    Draws a straight line, as part of the collected primitives of the drawing (see collect_primitives) or as a separate line
+    element.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param start: The start of the line.
+    :type start: tuple[float, float]
+    :param end: The end of the line.
+    :type end: tuple[float, float]
+    :param style: The presentation attributes of the line (stroke, stroke_width, ...).
+    :type style: Any
+    """
+    batch = _get_batch(dwg)
+    if batch is not None:
+        batch.line(start, end, **style)
+    else:
+        dwg.add(dwg.line(start=start, end=end, **style))
+
+
+def draw_dot(dwg: SvgDrawing, center: tuple[float, float], r: float, **style: Any):
+    """
+    Draws a dot, as part of the collected primitives of the drawing (see collect_primitives) or as a separate circle element.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param center: The center of the dot.
+    :type center: tuple[float, float]
+    :param r: The radius of the dot.
+    :type r: float
+    :param style: The presentation attributes of the dot (fill, ...).
+    :type style: Any
+    """
+    batch = _get_batch(dwg)
+    if batch is not None:
+        batch.dot(center, r, **style)
+    else:
+        dwg.add(dwg.circle(center=center, r=r, **style))
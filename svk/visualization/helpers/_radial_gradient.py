@@ -19,11 +19,23 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from uuid import uuid4
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._defs_registry import get_defs_registry
 
 
-def create_radial_gradient(dwg: Drawing, x: float, y: float, width: float, height: float, color: str) -> str:
-    gradient_id = f"gradient_group_header_{str(uuid4())}"
+def create_radial_gradient(dwg: SvgDrawing, x: float, y: float, width: float, height: float, color: str) -> str:
+    return get_defs_registry(dwg).add_gradient(radial_gradient(dwg, x, y, width, height, color))
+
+
+def radial_gradient(
+    dwg: SvgDrawing, x: float, y: float, width: float, height: float, color: str, gradient_id: str | None = None
+):
+    """
+    Creates (without adding it to the defs) a radial gradient from a color (at x, y) to white, stretched to the specified width
+    and height.
+    """
+    if gradient_id is None:
+        gradient_id = f"gradient_group_header_{str(uuid4())}"
     x_scale = width / (height)
     radial_grad = dwg.radialGradient(
         center=(
@@ -39,6 +51,4 @@ def create_radial_gradient(dwg: Drawing, x: float, y: float, width: float, heigh
 
     radial_grad["gradientTransform"] = f"scale({x_scale},1)"
 
-    dwg.defs.add(radial_grad)
-
-    return gradient_id
+    return radial_grad
@@ -0,0 +1,77 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from typing import Any, Callable, Hashable
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._defs_registry import get_defs_registry
+
+
+def place_shape(
+    dwg: SvgDrawing, key: Hashable, create_template: Callable[[], Any], insert: tuple[float, float], **presentation: Any
+):
+    """
+    Creates a reference (use element) to a shape template. The template is defined once per drawing for every key: shapes that
+    only differ in position and presentation (fill, stroke) share their geometry.
+
+    The template is drawn relative to the origin and without the presentation attributes that differ between instances, these are
+    inherited from the use element. Paint servers referred to by the instance (gradients) are relative to the insert as well.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param key: Description of the geometry of the shape (for example the name of the shape and its sizes).
+    :type key: Hashable
+    :param create_template: Function that creates the template (an element with an id, drawn relative to the origin).
+    :type create_template: Callable[[], Any]
+    :param insert: The position of the origin of the template.
+    :type insert: tuple[float, float]
+    :param presentation: Presentation attributes of this instance (fill, stroke, stroke_width, ...).
+    :type presentation: Any
+    :return: The use element (not added to the drawing yet).
+    """
+    template = get_defs_registry(dwg).get_or_add(("shape", key), create_template)
+    return dwg.use(template, insert=insert, **presentation)
+
+
+def define_shape(dwg: SvgDrawing, key: Hashable, create_template: Callable[[], Any]):
+    """
+    Defines the template of a shape (see place_shape) in advance, unless it was defined before.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param key: Description of the geometry of the shape (for example the name of the shape and its sizes).
+    :type key: Hashable
+    :param create_template: Function that creates the template (an element with an id, drawn relative to the origin).
+    :type create_template: Callable[[], Any]
+    """
+    get_defs_registry(dwg).get_or_add(("shape", key), create_template)
+
+
+def has_shape(dwg: SvgDrawing, key: Hashable) -> bool:
+    """
+    Returns whether the template of a shape is defined in a drawing.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param key: Description of the geometry of the shape.
+    :type key: Hashable
+    :return: True if the template is defined.
+    :rtype: bool
+    """
+    return get_defs_registry(dwg).get(("shape", key)) is not None
@@ -0,0 +1,335 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from __future__ import annotations
+from io import StringIO
+from typing import Any, TextIO, Union
+from svgwrite import Drawing
+
+
+def _escape_text(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _escape_attribute(value: str) -> str:
+    return (
+        _escape_text(value).replace('"', "&quot;").replace("\r", "&#13;").replace("\n", "&#10;").replace("\t", "&#09;")
+    )
+
+
+def _join(values: Any, separator: str) -> str:
+    if isinstance(values, str):
+        return values
+    return separator.join(str(value) for value in values if value is not None)
+
+
+class SvgElement:
+    """
+    Lightweight svg element (tag, attributes, text and sub elements) created by a StreamingDrawing. Attribute names follow the
+    svgwrite conventions (trailing underscores are removed and inner underscores become hyphens).
+    """
+
+    __slots__ = ("tag", "attribs", "text", "elements")
+
+    def __init__(self, tag: str, text: str | None = None, **extra: Any):
+        self.tag: str = tag
+        """The name of the svg element."""
+        self.attribs: dict[str, Any] = {key.rstrip("_").replace("_", "-"): value for key, value in extra.items()}
+        """The attributes of the element."""
+        self.text: str | None = text
+        """The text content of the element (text and tspan elements)."""
+        self.elements: list[SvgElement] = []
+        """The sub elements."""
+
+    @property
+    def elementname(self) -> str:
+        """The name of the svg element (svgwrite naming)."""
+        return self.tag
+
+    def __getitem__(self, key: str) -> Any:
+        return self.attribs[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self.attribs[key] = value
+
+    def add(self, element: SvgElement) -> SvgElement:
+        """
+        Adds a sub element.
+
+        :param element: The element to add.
+        :type element: SvgElement
+        :return: The added element.
+        :rtype: SvgElement
+        """
+        self.elements.append(element)
+        return element
+
+    def get_id(self) -> str:
+        """
+        Returns the id of the element.
+
+        :return: The id.
+        :rtype: str
+        """
+        return self.attribs["id"]
+
+    def add_stop_color(self, offset: float | None = None, color: str | None = None, opacity: float | None = None) -> SvgElement:
+        """
+        Adds a stop color to a gradient.
+
+        :param offset: The position of the stop along the gradient vector (0 to 1).
+        :type offset: float | None
+        :param color: The color at the stop.
+        :type color: str | None
+        :param opacity: The opacity at the stop.
+        :type opacity: float | None
+        :return: The stop element.
+        :rtype: SvgElement
+        """
+        return self.add(SvgElement("stop", offset=offset, stop_color=color, stop_opacity=opacity))
+
+    def rotate(self, angle: float, center: tuple[float, float] | None = None):
+        """
+        Adds a rotation to the transform of the element (the same way svgwrite does).
+
+        :param angle: The rotation angle in degrees.
+        :type angle: float
+        :param center: The center of the rotation (the origin when not specified).
+        :type center: tuple[float, float] | None
+        """
+        values = [angle] if center is None else [angle, *center]
+        transform = f"{self.attribs.get('transform', '')} rotate({_join(values, ',')})"
+        self.attribs["transform"] = transform.strip()
+
+    def write(self, output: TextIO):
+        """
+        Writes the element (including its sub elements) as svg.
+
+        :param output: The buffer or file to write to.
+        :type output: TextIO
+        """
+        output.write(f"<{self.tag}")
+        for key, value in sorted(self.attribs.items()):
+            if value is None:
+                continue
+            value = str(value)
+            if value:
+                output.write(f' {key}="{_escape_attribute(value)}"')
+        if not self.text and len(self.elements) == 0:
+            output.write(" />")
+            return
+        output.write(">")
+        if self.text:
+            output.write(_escape_text(self.text))
+        for element in self.elements:
+            element.write(output)
+        output.write(f"</{self.tag}>")
+
+    def tostring(self) -> str:
+        """
+        Returns the element (including its sub elements) as svg.
+
+        :return: The svg string.
+        :rtype: str
+        """
+        output = StringIO()
+        self.write(output)
+        return output.getvalue()
+
+
+class _StreamingDefs:
+    """
+    The definitions of a StreamingDrawing. Every definition is written (in its own defs element) as soon as it is added. Only the
+    id of a definition is kept, such that it can be found and referred to later.
+    """
+
+    def __init__(self, drawing: StreamingDrawing):
+        self._drawing = drawing
+        self.elements: list[SvgElement] = []
+        """The (emptied) definitions that have been written, in order of addition."""
+
+    def add(self, element: SvgElement) -> SvgElement:
+        definitions = SvgElement("defs")
+        definitions.add(element)
+        self._drawing.add(definitions)
+        element.elements = []
+        element.attribs = {"id": element.attribs.get("id")}
+        self.elements.append(element)
+        return element
+
+
+class StreamingDrawing:
+    """
+    Svg drawing that writes every element straight into a buffer or file as soon as it is added to the drawing, instead of
+    building a DOM that is serialized at the end (like svgwrite.Drawing). It offers the same drawing primitives (and attribute
+    conventions) as svgwrite, so elements can draw on either of them. Elements need to be complete when they are added to the
+    drawing.
+    """
+
+    def __init__(self, size: tuple[str, str] = ("100%", "100%"), output: TextIO | None = None, **extra: Any):
+        self.attribs: dict[str, Any] = {
+            "width": size[0],
+            "height": size[1],
+            "baseProfile": "full",
+            "version": "1.1",
+            "xmlns": "http://www.w3.org/2000/svg",
+            "xmlns:ev": "http://www.w3.org/2001/xml-events",
+            "xmlns:xlink": "http://www.w3.org/1999/xlink",
+            **SvgElement("svg", **extra).attribs,
+        }
+        """The attributes of the svg element."""
+        self.defs: _StreamingDefs = _StreamingDefs(self)
+        """The definitions (symbols, gradients) of the drawing."""
+
+        self._output: TextIO = output if output is not None else StringIO()
+        self._closed: bool = False
+
+        header = SvgElement("svg")
+        header.attribs = self.attribs
+        self._output.write(header.tostring()[: -len(" />")] + ">")
+
+    def add(self, element: SvgElement) -> SvgElement:
+        """
+        Writes an element to the drawing.
+
+        :param element: The element to write.
+        :type element: SvgElement
+        :return: The element.
+        :rtype: SvgElement
+        """
+        if self._closed:
+            raise ValueError("The drawing is closed, no elements can be added anymore.")
+        element.write(self._output)
+        return element
+
+    def close(self):
+        """
+        Finishes the svg document (no elements can be added after this).
+        """
+        if not self._closed:
+            self._output.write("</svg>")
+            self._closed = True
+
+    def tostring(self) -> str:
+        """
+        Finishes the svg document and returns it.
+
+        :return: The svg document.
+        :rtype: str
+        """
+        self.close()
+        if not isinstance(self._output, StringIO):
+            raise ValueError("The drawing was written to a file.")
+        return self._output.getvalue()
+
+    def text(self, text: str, insert: tuple[float, float] | None = None, **extra: Any) -> SvgElement:
+        return self._text_element("text", text, insert, **extra)
+
+    def tspan(self, text: str, insert: tuple[float, float] | None = None, **extra: Any) -> SvgElement:
+        return self._text_element("tspan", text, insert, **extra)
+
+    def rect(self, insert: tuple[float, float] = (0, 0), size: tuple[float, float] = (1, 1), **extra: Any) -> SvgElement:
+        return SvgElement("rect", x=insert[0], y=insert[1], width=size[0], height=size[1], **extra)
+
+    def line(self, start: tuple[float, float] = (0, 0), end: tuple[float, float] = (0, 0), **extra: Any) -> SvgElement:
+        return SvgElement("line", x1=start[0], y1=start[1], x2=end[0], y2=end[1], **extra)
+
+    def circle(self, center: tuple[float, float] = (0, 0), r: float = 1, **extra: Any) -> SvgElement:
+        return SvgElement("circle", cx=center[0], cy=center[1], r=r, **extra)
+
+    def polygon(self, points: list[tuple[float, float]] = [], **extra: Any) -> SvgElement:
+        return SvgElement("polygon", points=" ".join(f"{x},{y}" for x, y in points), **extra)
+
+    def polyline(self, points: list[tuple[float, float]] = [], **extra: Any) -> SvgElement:
+        return SvgElement("polyline", points=" ".join(f"{x},{y}" for x, y in points), **extra)
+
+    def path(self, d: str | list[Any] | None = None, **extra: Any) -> SvgElement:
+        return SvgElement("path", d=_join(d, " ") if d is not None else None, **extra)
+
+    def g(self, **extra: Any) -> SvgElement:
+        return SvgElement("g", **extra)
+
+    def symbol(self, **extra: Any) -> SvgElement:
+        return SvgElement("symbol", **extra)
+
+    def style(self, content: str = "", **extra: Any) -> SvgElement:
+        return SvgElement("style", text=content, type="text/css", **extra)
+
+    def a(self, href: str, target: str | None = "_blank", **extra: Any) -> SvgElement:
+        return SvgElement("a", **{"xlink:href": href, "target": target}, **extra)
+
+    def use(
+        self, href: str | SvgElement, insert: tuple[float, float] | None = None, size: tuple[float, float] | None = None, **extra: Any
+    ) -> SvgElement:
+        element = SvgElement("use", **{"xlink:href": href if isinstance(href, str) else f"#{href.get_id()}"}, **extra)
+        if insert is not None:
+            element.attribs.update(x=insert[0], y=insert[1])
+        if size is not None:
+            element.attribs.update(width=size[0], height=size[1])
+        return element
+
+    def linearGradient(
+        self, start: tuple[float, float] | None = None, end: tuple[float, float] | None = None, **extra: Any
+    ) -> SvgElement:
+        element = SvgElement("linearGradient", **extra)
+        if start is not None:
+            element.attribs.update(x1=start[0], y1=start[1])
+        if end is not None:
+            element.attribs.update(x2=end[0], y2=end[1])
+        return element
+
+    def radialGradient(self, center: tuple[float, float] | None = None, r: float | None = None, **extra: Any) -> SvgElement:
+        element = SvgElement("radialGradient", **extra)
+        if center is not None:
+            element.attribs.update(cx=center[0], cy=center[1])
+        if r is not None:
+            element.attribs["r"] = r
+        return element
+
+    def _text_element(self, tag: str, text: str, insert: tuple[float, float] | None, **extra: Any) -> SvgElement:
+        if insert is not None:
+            extra["x"] = [insert[0]]
+            extra["y"] = [insert[1]]
+        for key in ["x", "y", "dx", "dy", "rotate"]:
+            if extra.get(key) is not None:
+                extra[key] = _join(extra[key], " ")
+        return SvgElement(tag, text=str(text), **extra)
+
+
+SvgDrawing = Union[Drawing, StreamingDrawing]
+"""A drawing elements can draw on: an svgwrite.Drawing (DOM) or a StreamingDrawing."""
+
+
+def create_drawing(size: tuple[str, str], streaming: bool = False, output: TextIO | None = None) -> SvgDrawing:
+    """
+    Creates the drawing for a page.
+
+    :param size: The size (width, height) of the drawing, including units.
+    :type size: tuple[str, str]
+    :param streaming: Whether to write the svg straight into a buffer or file (StreamingDrawing) instead of building an svgwrite DOM.
+    :type streaming: bool
+    :param output: The file a streaming drawing is written to (an in-memory buffer by default).
+    :type output: TextIO | None
+    :return: The drawing.
+    :rtype: SvgDrawing
+    """
+    if streaming:
+        return StreamingDrawing(size=size, output=output)
+    return Drawing(size=size, debug=False)
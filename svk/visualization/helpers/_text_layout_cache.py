@@ -0,0 +1,184 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from hashlib import sha256
+from threading import Lock
+from typing import Iterator
+import json
+import sqlite3
+
+
+@lru_cache(maxsize=None)
+def font_file_hash(font_file: str) -> str:
+    """
+    Returns a hash of the contents of a font file, such that cached layouts are invalidated when the font changes.
+
+    :param font_file: The font file.
+    :type font_file: str
+    :return: The hash (hexadecimal string).
+    :rtype: str
+    """
+    with open(font_file, "rb") as file:
+        return sha256(file.read()).hexdigest()
+
+
+class TextLayoutCache:
+    """
+    Persistent (SQLite) cache of predicted text sizes and wrapped lines.
+
+    Entries are keyed by the text, the maximum width (for wrapped lines), the font size and a hash of the font file. Every entry
+    remembers when it was last used. When the cache is closed, the least recently used entries are removed until no more than
+    max_entries remain (per kind of entry).
+    """
+
+    def __init__(self, file_path: str, max_entries: int = 250000):
+        self.file_path: str = file_path
+        """The path of the SQLite database file."""
+        self.max_entries: int = max_entries
+        """The maximum number of text sizes and the maximum number of wrapped texts that are kept."""
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(file_path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER);
+            CREATE TABLE IF NOT EXISTS text_sizes (
+                text TEXT, font_size INTEGER, font_hash TEXT, width INTEGER, height INTEGER, last_used INTEGER,
+                PRIMARY KEY (text, font_size, font_hash)
+            );
+            CREATE TABLE IF NOT EXISTS wrapped_lines (
+                text TEXT, max_width REAL, font_size INTEGER, font_hash TEXT, lines TEXT, last_used INTEGER,
+                PRIMARY KEY (text, max_width, font_size, font_hash)
+            );
+            """
+        )
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'clock'").fetchone()
+        self._clock: int = row[0] if row is not None else 0
+        """Counter that is increased with every use of an entry (to determine the least recently used entries)."""
+
+    def get_size(self, text: str, font_size: int, font_file: str) -> tuple[int, int] | None:
+        """
+        Returns the cached size (width, height) of a text, or None if it is not cached.
+        """
+        key = (text, font_size, font_file_hash(font_file))
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT width, height FROM text_sizes WHERE text = ? AND font_size = ? AND font_hash = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE text_sizes SET last_used = ? WHERE text = ? AND font_size = ? AND font_hash = ?", (self._tick(), *key)
+            )
+        return row[0], row[1]
+
+    def set_size(self, text: str, font_size: int, font_file: str, size: tuple[int, int]):
+        """
+        Stores the size (width, height) of a text.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO text_sizes VALUES (?, ?, ?, ?, ?, ?)",
+                (text, font_size, font_file_hash(font_file), size[0], size[1], self._tick()),
+            )
+
+    def get_lines(self, text: str, max_width: float, font_size: int, font_file: str) -> list[str] | None:
+        """
+        Returns the cached wrapped lines of a text, or None if they are not cached.
+        """
+        key = (text, max_width, font_size, font_file_hash(font_file))
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT lines FROM wrapped_lines WHERE text = ? AND max_width = ? AND font_size = ? AND font_hash = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE wrapped_lines SET last_used = ? WHERE text = ? AND max_width = ? AND font_size = ? AND font_hash = ?",
+                (self._tick(), *key),
+            )
+        return json.loads(row[0])
+
+    def set_lines(self, text: str, max_width: float, font_size: int, font_file: str, lines: list[str]):
+        """
+        Stores the wrapped lines of a text.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO wrapped_lines VALUES (?, ?, ?, ?, ?, ?)",
+                (text, max_width, font_size, font_file_hash(font_file), json.dumps(lines), self._tick()),
+            )
+
+    def close(self):
+        """
+        Removes the least recently used entries that exceed max_entries, writes all changes and closes the database.
+        """
+        with self._lock:
+            for table in ["text_sizes", "wrapped_lines"]:
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('clock', ?)", (self._clock,))
+            self._connection.commit()
+            self._connection.close()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+
+_active_cache: ContextVar[TextLayoutCache | None] = ContextVar("text_layout_cache", default=None)
+"""The cache of the current build (per thread or asyncio task, such that concurrent builds each use their own cache)."""
+
+
+def get_text_layout_cache() -> TextLayoutCache | None:
+    """
+    Returns the text layout cache that is currently in use (or None if no persistent cache is used).
+    """
+    return _active_cache.get()
+
+
+@contextmanager
+def use_text_layout_cache(file_path: str | None, max_entries: int = 250000) -> Iterator[TextLayoutCache | None]:
+    """
+    Uses a persistent text layout cache (stored in the specified file) for all text measurements and wrapped lines within the
+    context. Nothing is cached when file_path is None. The cache only applies to the current thread (or asyncio task).
+
+    :param file_path: The path of the cache file (SQLite database), or None.
+    :type file_path: str | None
+    :param max_entries: The maximum number of entries that is kept in the cache (per kind of entry).
+    :type max_entries: int
+    """
+    if file_path is None:
+        yield None
+        return
+
+    cache = TextLayoutCache(file_path=file_path, max_entries=max_entries)
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+        cache.close()
@@ -0,0 +1,98 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from typing import Any, Iterable
+from pydantic import BaseModel, ConfigDict
+from svk.visualization.helpers._streaming_svg import SvgDrawing
+from svk.visualization.helpers._defs_registry import get_defs_registry
+
+
+class TextStyle(BaseModel):
+    """
+    A named text style (font family, size, weight and style). Text refers to the style by class when the style sheet of the
+    drawing defines it, or repeats the font attributes otherwise.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    """The name of the style (used as css class name)."""
+    font_size: int | float
+    """The font size in pixels."""
+    font_family: str | None = "Arial"
+    """The font family (None to use the default font of the renderer)."""
+    font_weight: str = "normal"
+    """The font weight."""
+    font_style: str = "normal"
+    """The font style."""
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """The font attributes of this style (as keyword arguments of svg text elements)."""
+        attributes: dict[str, Any] = {"font_size": self.font_size}
+        if self.font_family is not None:
+            attributes["font_family"] = self.font_family
+        attributes["font_weight"] = self.font_weight
+        attributes["font_style"] = self.font_style
+        return attributes
+
+    @property
+    def css(self) -> str:
+        """The css rule of this style."""
+        font_family = f"font-family:{self.font_family};" if self.font_family is not None else ""
+        return (
+            f".{self.name}{{{font_family}font-size:{self.font_size}px;font-weight:{self.font_weight};font-style:{self.font_style}}}"
+        )
+
+
+def add_text_styles(dwg: SvgDrawing, text_styles: Iterable[TextStyle]):
+    """
+    Adds a style sheet with the specified text styles to a drawing, such that text can refer to them by class.
+
+    :param dwg: The drawing.
+    :type dwg: SvgDrawing
+    :param text_styles: The text styles.
+    :type text_styles: Iterable[TextStyle]
+    """
+    defs_registry = get_defs_registry(dwg)
+    new_styles = [text_style for text_style in text_styles if defs_registry.get(("text-style", text_style.name)) is None]
+    if len(new_styles) == 0:
+        return
+
+    dwg.defs.add(dwg.style("".join(text_style.css for text_style in new_styles)))
+    for text_style in new_styles:
+        defs_registry.register(("text-style", text_style.name), text_style)
+
+
+def text_style_attributes(dwg: SvgDrawing, text_style: TextStyle) -> dict[str, Any]:
+    """
+    Returns the attributes a text element needs to use a text style: the class of the style if the drawing defines it, the
+    font attributes otherwise.
+
+    :param dwg: The drawing the text is added to.
+    :type dwg: SvgDrawing
+    :param text_style: The text style.
+    :type text_style: TextStyle
+    :return: The attributes (as keyword arguments of svg text elements).
+    :rtype: dict[str, Any]
+    """
+    if get_defs_registry(dwg).get(("text-style", text_style.name)) == text_style:
+        return {"class_": text_style.name}
+    return text_style.attributes
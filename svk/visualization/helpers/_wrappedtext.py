@@ -18,10 +18,13 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
-from ._measuretext import measure_text
+from ._line_breaker import get_line_breaker
+from ._font_metrics import default_font_file
+from ._text_layout_cache import get_text_layout_cache
 
-from svgwrite import Drawing
 from svgwrite.text import Text
+from svk.visualization.helpers._streaming_svg import SvgDrawing, SvgElement
+from svk.visualization.helpers._text_styles import TextStyle, text_style_attributes
 
 
 def wrapped_lines(
@@ -41,25 +44,39 @@ def wrapped_lines(
     :return: A list of lines that don't exceed the specified maximum width
     :rtype: list[str]
     """
-    words = text.split()
-    lines = []
-    line = ""
-    for word in words:
-        test_line = line + word + " "
-        w, _ = measure_text(test_line, font_size)
-        if w > max_width:
-            lines.append(line)
-            line = word + " "
-        else:
-            line = test_line
-    if line:
-        lines.append(line)
-
+    cache = get_text_layout_cache()
+    if cache is None:
+        return get_line_breaker(text, font_size).lines(max_width)
+
+    lines = cache.get_lines(text, max_width, font_size, default_font_file)
+    if lines is None:
+        lines = get_line_breaker(text, font_size).lines(max_width)
+        cache.set_lines(text, max_width, font_size, default_font_file, lines)
     return lines
 
 
+def wrapped_lines_for_widths(
+    text: str,
+    max_widths: list[float],
+    font_size: int = 12,
+) -> list[list[str]]:
+    """
+    Method that splits a string into lines for several maximum widths at once (the words are only measured once). This method assumes the use of arial font.
+
+    :param text: The text that should be split into lines
+    :type text: str
+    :param max_widths: the maximum widths of the lines once printed as svg text elements
+    :type max_widths: list[float]
+    :param font_size: the desired font size for the printed text
+    :type font_size: int
+    :return: For each maximum width a list of lines that don't exceed that width
+    :rtype: list[list[str]]
+    """
+    return [wrapped_lines(text, max_width, font_size) for max_width in max_widths]
+
+
 def wrapped_text(
-    dwg: Drawing,
+    dwg: SvgDrawing,
     lines: list[str],
     insert: tuple[float, float],
     line_height: float = 1.2,
@@ -69,12 +86,13 @@ def wrapped_text(
     text_anchor: str = "start",
     dominant_baseline: str = "middle",
     font_style: str = "normal",
-) -> Text:
+    text_style: TextStyle | None = None,
+) -> Text | SvgElement:
     """
     Creates an svg text element with lines for each text line in lines.
 
     :param dwg: The svgwrite.Drawing object to add the lines to
-    :type dwg: Drawing
+    :type dwg: SvgDrawing
     :param lines: a list of lines that need to be printed (see also 'wrapped_lines')
     :type lines: list[str]
     :param insert: The insert (x,y) of the text
@@ -95,13 +113,19 @@ def wrapped_text(
     :type dominant_baseline: str
     :param font_style: The font style to use
     :type font_style: str
-    :param style: The svg text-style to use
-    :type style: str
+    :param text_style: A named text style. When specified, it replaces the font attributes and is set once on the text element
+        instead of on every line.
+    :type text_style: TextStyle | None
     :return: An element builder object (svg text) to add to the svgwrite.Drawing
     :rtype: ElementBuilder
     """
 
-    text_elem = dwg.text("", insert=insert, dominant_baseline=dominant_baseline)
+    if text_style is not None:
+        text_elem = dwg.text("", insert=insert, dominant_baseline=dominant_baseline, **text_style_attributes(dwg, text_style))
+        font_attributes = {}
+    else:
+        text_elem = dwg.text("", insert=insert, dominant_baseline=dominant_baseline)
+        font_attributes = dict(font_size=font_size, font_family=font_family, font_weight=font_weight, font_style=font_style)
 
     y = insert[1]
     start_offset = 0
@@ -117,11 +141,8 @@ def wrapped_text(
                 x=[insert[0]],
                 y=[y],
                 dy=[f"{dy}em"],
-                font_size=font_size,
-                font_family=font_family,
-                font_weight=font_weight,
                 text_anchor=text_anchor,
-                font_style=font_style,
+                **font_attributes,
             )
         )
 
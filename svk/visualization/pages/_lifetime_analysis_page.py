@@ -1,4 +1,4 @@
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 from pydantic import model_validator
 
 from svk.visualization.pages._page import Page
@@ -19,8 +19,12 @@ class LifeTimeAnalysisPage(Page):
 
         return self
 
+    @property
+    def elements(self) -> list[GridElement]:
+        return [self._grid_element]
+
     def get_content_size(self) -> tuple[float, float]:
         return (self._grid_element.width, self._grid_element.height)
 
-    def draw_content(self, dwg: Drawing, left: float, top: float):
+    def draw_content(self, dwg: SvgDrawing, left: float, top: float):
         self._grid_element.draw(dwg=dwg, x=left, y=top)
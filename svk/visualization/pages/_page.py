@@ -19,14 +19,18 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 """
 
 from abc import ABC, abstractmethod
-from pydantic import BaseModel
-from svgwrite import Drawing
+from pydantic import BaseModel, PrivateAttr
+from typing import TextIO
+from svk.visualization.helpers._streaming_svg import SvgDrawing, StreamingDrawing, create_drawing
 
-from svk.data import StormSurgeBarrier, LinksRegister, Translator
-from svk.visualization._layout_configuration import LayoutConfiguration
-from svk.visualization.helpers._draw_disclaimer import draw_disclaimer
-from svk.visualization.helpers._draw_scaled_icon import draw_scaled_icon
-from svk.visualization.helpers._draw_callout import draw_callout
+from svk.data import StormSurgeBarrier, LinksRegister, Translator, ResearchQuestion
+from svk.io import SvgCompaction
+from svk.visualization.elements._visual_element import VisualElement
+from svk.visualization._layout_configuration import LayoutConfiguration, LayoutContext
+from svk.visualization.helpers._draw_scaled_icon import get_icon_library
+from svk.visualization.helpers._page_chrome import PageChrome
+from svk.visualization.helpers._text_styles import add_text_styles, text_style_attributes
+from svk.visualization.helpers._primitive_batch import collect_primitives
 
 
 class Page(BaseModel, ABC):
@@ -50,15 +54,89 @@ class Page(BaseModel, ABC):
     translator: Translator
     """The translator that should be used for this page."""
 
+    _size: tuple[float, float] | None = PrivateAttr(default=None)
+    _needs_redraw: bool = PrivateAttr(default=True)
+    _is_drawn: bool = PrivateAttr(default=False)
+
     @abstractmethod
     def get_content_size(self) -> tuple[float, float]:
         pass
 
     @abstractmethod
-    def draw_content(self, dwg: Drawing, left: float, top: float):
+    def draw_content(self, dwg: SvgDrawing, left: float, top: float):
         pass
 
+    @property
+    def elements(self) -> list[VisualElement]:
+        """
+        The (top level) elements on this page.
+        """
+        return []
+
+    @property
+    def needs_redraw(self) -> bool:
+        """
+        Whether the page changed since it was last drawn.
+        """
+        return self._needs_redraw
+
+    @property
+    def page_chrome(self) -> PageChrome:
+        """
+        The cache of the chrome (title callout and disclaimer) of the layout context of the build. A page with a plain layout
+        configuration gets a new, empty cache.
+        """
+        if isinstance(self.layout_configuration, LayoutContext):
+            return self.layout_configuration.page_chrome
+        return PageChrome()
+
+    def update_question(self, research_question: ResearchQuestion) -> bool:
+        """
+        Replaces a research question (with the same id) in all elements on this page that were created from it. Only these
+        elements and the elements that contain them are measured again. The page needs to be redrawn if it contained the question.
+
+        :param research_question: The new (edited) research question.
+        :type research_question: ResearchQuestion
+        :return: Whether the page contained the question.
+        :rtype: bool
+        """
+        updated = False
+        for element in self.elements:
+            updated = element.update_question(research_question) or updated
+        if updated:
+            self.invalidate_layout()
+        return updated
+
     def get_size(self) -> tuple[float, float]:
+        """
+        Returns the size (width, height) of the page, as determined by the layout pass.
+
+        :return: The size of the page in pixels.
+        :rtype: tuple[float, float]
+        """
+        return self.layout()
+
+    def layout(self) -> tuple[float, float]:
+        """
+        Layout pass: measures the page (and all its elements) once and stores the size. Drawing the page uses the stored sizes.
+
+        :return: The size of the page in pixels.
+        :rtype: tuple[float, float]
+        """
+        if self._size is None:
+            for element in self.elements:
+                element._parent = self
+            self._size = self.measure()
+        return self._size
+
+    def invalidate_layout(self) -> None:
+        """
+        Discards the stored size of the page. This needs to be called after the content of the page changed.
+        """
+        self._size = None
+        self._needs_redraw = True
+
+    def measure(self) -> tuple[float, float]:
         content_size = self.get_content_size()
         title_height = (
             self.layout_configuration.paper_margin + self.layout_configuration.page_title_height + self.layout_configuration.large_margin
@@ -72,42 +150,74 @@ class Page(BaseModel, ABC):
         page_height = title_height + content_size[1] + disclaimer_height + self.layout_configuration.paper_margin
         return (page_width, page_height)
 
-    def draw(self) -> Drawing:
-        page_width, page_height = self.get_size()
+    def draw(self, streaming: bool = False, output: TextIO | None = None) -> SvgDrawing:
+        """
+        Draws the page.
+
+        :param streaming: Whether to write the svg straight into a buffer or file (see StreamingDrawing) instead of building an
+            svgwrite DOM.
+        :type streaming: bool
+        :param output: The file a streaming drawing is written to (an in-memory buffer by default).
+        :type output: TextIO | None
+        :return: The drawing. A streaming drawing is finished already.
+        :rtype: SvgDrawing
+        """
+        page_width, page_height = self.layout()
 
-        dwg = Drawing(size=(f"{page_width}px", f"{page_height}px"), debug=False)
+        if self._is_drawn:
+            self.links_register.unregister_page(self.page_number)
+
+        dwg = create_drawing(size=(f"{page_width}px", f"{page_height}px"), streaming=streaming, output=output)
         self.links_register.register_page(self.page_number, page_width, page_height)
+        if self.layout_configuration.text_style_classes:
+            add_text_styles(dwg, self.layout_configuration.text_styles.values())
 
-        self.draw_title(dwg=dwg)
+        with collect_primitives(dwg, enabled=self.layout_configuration.batch_primitives):
+            self.draw_title(dwg=dwg)
 
-        self.draw_content(
-            dwg=dwg,
-            left=self.layout_configuration.paper_margin,
-            top=self.layout_configuration.paper_margin
-            + self.layout_configuration.page_title_height
-            + self.layout_configuration.large_margin,
-        )
+            self.draw_content(
+                dwg=dwg,
+                left=self.layout_configuration.paper_margin,
+                top=self.layout_configuration.paper_margin
+                + self.layout_configuration.page_title_height
+                + self.layout_configuration.large_margin,
+            )
 
         self.draw_disclaimer(dwg=dwg)
+        if isinstance(dwg, StreamingDrawing):
+            dwg.close()
 
+        self._is_drawn = True
+        self._needs_redraw = False
         return dwg
 
-    def draw_title(self, dwg: Drawing):
+    def to_svg(self, compaction: SvgCompaction | None = None) -> str:
+        """
+        Draws the page and returns it as svg (for export as standalone svg).
+
+        :param compaction: Optional compaction of the svg (precision, default attributes, path data).
+        :type compaction: SvgCompaction | None
+        :return: The svg string.
+        :rtype: str
+        """
+        svg = self.draw().tostring()
+        return compaction.compact(svg) if compaction is not None else svg
+
+    def draw_title(self, dwg: SvgDrawing):
         left_title = self.layout_configuration.paper_margin
         if self.icon is not None:
             icon_size = self.layout_configuration.page_title_height
             icon_width = icon_size + self.layout_configuration.arrow_depth
-            draw_callout(
-                dwg, self.layout_configuration.paper_margin, self.layout_configuration.paper_margin, icon_width, icon_size, "#000000"
-            )
-            draw_scaled_icon(
-                dwg=dwg,
-                storm_surge_barrier=self.icon,
-                insert=(
+            self.page_chrome.draw_icon_callout(
+                dwg,
+                icon=get_icon_library().get(self.icon.name),
+                insert=(self.layout_configuration.paper_margin, self.layout_configuration.paper_margin),
+                size=(icon_width, icon_size),
+                icon_insert=(
                     self.layout_configuration.paper_margin + self.layout_configuration.arrow_depth + 2,
                     self.layout_configuration.paper_margin + 2,
                 ),
-                size=(icon_size - 4, icon_size - 4),
+                icon_size=(icon_size - 4, icon_size - 4),
             )
             left_title = 2 * self.layout_configuration.paper_margin + icon_width
 
@@ -118,9 +228,7 @@ class Page(BaseModel, ABC):
                     left_title,
                     self.layout_configuration.paper_margin + self.layout_configuration.page_title_height / 2,
                 ),
-                font_size=self.layout_configuration.page_title_font_size,
-                font_family="Arial",
-                font_weight="bold",
+                **text_style_attributes(dwg, self.layout_configuration.text_styles["title"]),
                 text_anchor="start",
                 dominant_baseline="middle",
             )
@@ -136,18 +244,18 @@ class Page(BaseModel, ABC):
                 - self.layout_configuration.page_title_font_size * 1.2 / 2,
             )
 
-    def draw_disclaimer(self, dwg: Drawing):
+    def draw_disclaimer(self, dwg: SvgDrawing):
         if self.disclaimer is not None:
             _, page_height = self.get_size()
-            draw_disclaimer(
-                dwg=dwg,
+            self.page_chrome.draw_disclaimer(
+                dwg,
                 disclaimer_text=self.disclaimer,
                 insert=(
                     self.layout_configuration.paper_margin,
                     page_height - self.layout_configuration.paper_margin - self.layout_configuration.disclamer_font_size * 1.2,
                 ),
+                text_style=self.layout_configuration.text_styles["disclaimer"],
+                links=self.disclaimer_links if self.disclaimer_links is not None else [],
                 dominant_baseline="hanging",
                 text_anchor="start",
-                font_size=self.layout_configuration.disclamer_font_size,
-                links=self.disclaimer_links if self.disclaimer_links is not None else [],
             )
@@ -18,9 +18,10 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
+from __future__ import annotations
 from svk.visualization.elements._question_details import QuestionDetailsElement
 from svk.visualization.pages._page import Page
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 
 
 class QuestionDetailsPage(Page):
@@ -33,7 +34,65 @@ class QuestionDetailsPage(Page):
             - self.layout_configuration.intermediate_margin,
         )
 
-    def draw_content(self, dwg: Drawing, top: float, left: float):
+    @property
+    def elements(self) -> list[QuestionDetailsElement]:
+        return self.questions
+
+    def add_question(self, question: QuestionDetailsElement):
+        """
+        Adds a question to the page (and discards the stored size of the page).
+
+        :param question: The question to add.
+        :type question: QuestionDetailsElement
+        """
+        self.questions.append(question)
+        question._parent = self
+        self.invalidate_layout()
+
+    def paginate(self, max_height: float) -> list[QuestionDetailsPage]:
+        """
+        Splits the questions of this page across pages that do not exceed a maximum height, using the measured heights of the
+        questions. The first page keeps the title, page number and link target of this page. Continuation pages get the
+        subsequent page numbers and a numbered title. A question that does not fit on an empty page gets a page of its own.
+
+        :param max_height: The maximum height of a page in pixels.
+        :type max_height: float
+        :return: The pages (this page if all questions fit).
+        :rtype: list[QuestionDetailsPage]
+        """
+        if len(self.questions) == 0 or self.get_size()[1] <= max_height:
+            return [self]
+
+        max_content_height = max_height - (self.get_size()[1] - self.get_content_size()[1])
+        chunks: list[list[QuestionDetailsElement]] = [[]]
+        content_height = -self.layout_configuration.intermediate_margin
+        for question in self.questions:
+            content_height += question.height + self.layout_configuration.intermediate_margin
+            if content_height > max_content_height and len(chunks[-1]) > 0:
+                chunks.append([])
+                content_height = question.height
+            chunks[-1].append(question)
+
+        pages: list[QuestionDetailsPage] = []
+        for i_chunk, chunk in enumerate(chunks):
+            page_number = self.page_number + i_chunk
+            for question in chunk:
+                question.set_page_number(page_number)
+            pages.append(
+                type(self)(
+                    **{
+                        **dict(self),
+                        "page_number": page_number,
+                        "title": self.title if i_chunk == 0 else f"{self.title} ({i_chunk + 1})",
+                        "title_link_target": self.title_link_target if i_chunk == 0 else None,
+                        "questions": chunk,
+                    }
+                )
+            )
+
+        return pages
+
+    def draw_content(self, dwg: SvgDrawing, top: float, left: float):
         top_current = top
         for question in self.questions:
             # self.links_register.register_link_target(
@@ -20,8 +20,10 @@ Deltares and remain full property of Stichting Deltares at all times. All rights
 
 from svk.visualization.elements._column import Column
 from svk.visualization.elements._cluster import Cluster
+from svk.visualization.elements._group import Group
+from svk.visualization.helpers._draw_callout import define_callout_templates
 from svk.visualization.pages._page import Page
-from svgwrite import Drawing
+from svk.visualization.helpers._streaming_svg import SvgDrawing
 
 
 class TimeLineOverviewPage(Page):
@@ -33,8 +35,11 @@ class TimeLineOverviewPage(Page):
     """The columns included in this overview page (that all hold groups and questions)"""
     clusters: list[Cluster] = []
 
+    @property
+    def elements(self) -> list[Column | Cluster]:
+        return [*self.columns, *self.clusters]
+
     def get_content_size(self) -> tuple[float, float]:
-        self.layout_configuration.n_columns = len(self.columns)
         max_column_height = sum([c.get_height() for c in self.clusters]) + self.layout_configuration.large_margin * (len(self.clusters) - 1)
 
         return (
@@ -42,12 +47,15 @@ class TimeLineOverviewPage(Page):
             self.layout_configuration.column_header_height + self.layout_configuration.large_margin + max_column_height,
         )
 
-    def draw_content(self, dwg: Drawing, left: float, top: float):
+    def draw_content(self, dwg: SvgDrawing, left: float, top: float):
         left_current = left
         for column in sorted(self.columns, key=lambda c: c.number):
             column.draw(dwg, left_current, top)
             left_current += self.layout_configuration.column_width
 
+        groups = [group for cluster in self.clusters for column_groups in cluster.groups.values() for group in column_groups]
+        define_callout_templates(dwg, [(group.width, group.height) for group in groups if isinstance(group, Group)])
+
         top_current = top + self.layout_configuration.column_header_height + self.layout_configuration.large_margin
         for cluster in self.clusters:
             cluster.draw(dwg=dwg, left=self.layout_configuration.paper_margin, top=top_current)
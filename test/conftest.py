@@ -0,0 +1,93 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from typing import Callable
+import pytest
+from svk.data import ResearchQuestion, ResearchLine, Priority, TimeFrame, StormSurgeBarrier, LinksRegister, Translator
+from svk.visualization import KnowledgeCalendarDocument, LayoutConfiguration, QuestionSummaryElement
+
+
+def _create_document(layout_configuration: LayoutConfiguration, id_prefix: str) -> KnowledgeCalendarDocument:
+    questions = [
+        ResearchQuestion(
+            id=f"{id_prefix}{i}",
+            question=f"Research question number {i}",
+            storm_surge_barriers=[StormSurgeBarrier.HaringvlietBarrier],
+            reference_ids=[],
+            reference_question=i,
+            prio_water_safety=Priority.Low,
+            prio_management_maintenance=Priority.High,
+            prio_other_functions=Priority.Medium,
+            prio_operation=Priority.High,
+            time_frame=[TimeFrame.Now, TimeFrame.NearFuture, TimeFrame.Future][i % 3],
+            research_line_primary=list(ResearchLine)[i % 4],
+            keywords="",
+        )
+        for i in range(12)
+    ]
+    return KnowledgeCalendarDocument(
+        output_dir="",
+        output_file="",
+        questions=questions,
+        storm_surge_barrier=StormSurgeBarrier.HaringvlietBarrier,
+        layout_configuration=layout_configuration,
+    )
+
+
+def _create_question_element(
+    id: str, question: str, config: LayoutConfiguration, links_register: LinksRegister, translator: Translator
+) -> QuestionSummaryElement:
+    return QuestionSummaryElement(
+        layout_configuration=config,
+        links_register=links_register,
+        translator=translator,
+        research_question=ResearchQuestion(
+            id=id,
+            question=question,
+            storm_surge_barriers=[StormSurgeBarrier.HaringvlietBarrier],
+            reference_ids=[],
+            reference_question=1,
+            prio_water_safety=Priority.Low,
+            prio_management_maintenance=Priority.High,
+            prio_other_functions=Priority.Medium,
+            prio_operation=Priority.High,
+            time_frame=TimeFrame.Now,
+            research_line_primary=ResearchLine.Adaptation.value,
+            keywords="",
+        ),
+        page_number=0,
+    )
+
+
+@pytest.fixture
+def create_document() -> Callable[[LayoutConfiguration, str], KnowledgeCalendarDocument]:
+    """
+    Factory of a knowledge calendar document with twelve questions (spread over time frames and research lines), with question
+    ids that start with the specified prefix.
+    """
+    return _create_document
+
+
+@pytest.fixture
+def create_question_element() -> Callable[..., QuestionSummaryElement]:
+    """
+    Factory of a question summary element for a question with the specified id and text.
+    """
+    return _create_question_element
@@ -0,0 +1,69 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svgwrite import Drawing
+from svk.io import AsyncChromiumPdfConverter, PdfConversionError
+from svk.visualization.helpers import draw_half_chevron
+import asyncio
+import os
+import pytest
+
+
+def create_drawings(output_dir: str, n_drawings: int) -> list[tuple[Drawing, str]]:
+    drawings = []
+    for i in range(n_drawings):
+        dwg = Drawing(size=(f"{400 + i * 10}px", "200px"))
+        dwg.add(draw_half_chevron(dwg, x=20, y=20, width=300, height=80, add_to_dwg=False))
+        drawings.append((dwg, os.path.join(output_dir, f"page {i}.pdf")))
+    return drawings
+
+
+def test_converter_needs_at_least_one_page():
+    with pytest.raises(ValueError):
+        AsyncChromiumPdfConverter(max_concurrency=0)
+
+
+def test_pages_are_converted_concurrently(tmp_path):
+    drawings = create_drawings(str(tmp_path), 6)
+
+    async def convert():
+        async with AsyncChromiumPdfConverter(max_concurrency=3) as converter:
+            return await converter.convert_all(drawings)
+
+    assert asyncio.run(convert()) == [0] * 6
+    assert all(os.path.isfile(pdf_path) for _, pdf_path in drawings)
+
+
+def test_failed_pages_are_reported(tmp_path):
+    drawings = create_drawings(str(tmp_path), 3)
+    # A directory can not be written as pdf file.
+    failing_path = os.path.join(str(tmp_path), "directory.pdf")
+    os.mkdir(failing_path)
+    drawings[1] = (drawings[1][0], failing_path)
+
+    async def convert():
+        async with AsyncChromiumPdfConverter(max_concurrency=2) as converter:
+            await converter.convert_all(drawings)
+
+    with pytest.raises(PdfConversionError) as error:
+        asyncio.run(convert())
+
+    assert list(error.value.failures.keys()) == [failing_path]
+    assert os.path.isfile(drawings[0][1]) and os.path.isfile(drawings[2][1])
@@ -0,0 +1,78 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import os
+import stat
+import sys
+import fitz
+import pytest
+from svk.io import InkscapePdfConverter, find_inkscape
+from svk.visualization import LayoutConfiguration
+
+# Imitates the shell mode of Inkscape: a prompt after every line of actions, a (blank) pdf page per export.
+_fake_inkscape = f"""#!{sys.executable}
+import sys, fitz
+with open(sys.argv[0] + ".log", "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+sys.stdout.write("Inkscape interactive shell mode.\\n> ")
+sys.stdout.flush()
+for line in sys.stdin:
+    if line.strip() == "quit":
+        break
+    actions = dict(action.split(":", 1) for action in line.strip().split(";") if ":" in action)
+    if "export-do" in line:
+        with fitz.open() as doc:
+            doc.new_page(width=300, height=150).insert_text((10, 50), open(actions["file-open"]).read()[:20])
+            doc.save(actions["export-filename"])
+    sys.stdout.write("> ")
+    sys.stdout.flush()
+"""
+
+
+@pytest.fixture
+def fake_inkscape(tmp_path) -> str:
+    executable = tmp_path / "bin" / "inkscape"
+    executable.parent.mkdir()
+    executable.write_text(_fake_inkscape)
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+    return str(executable)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The fake Inkscape is a python script with a shebang.")
+def test_inkscape_is_found_on_path(fake_inkscape, monkeypatch):
+    monkeypatch.setenv("PATH", os.path.dirname(fake_inkscape))
+
+    assert find_inkscape() == fake_inkscape
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The fake Inkscape is a python script with a shebang.")
+def test_one_inkscape_shell_converts_all_pages(fake_inkscape, tmp_path, create_document):
+    document = create_document(LayoutConfiguration(), "I")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+
+    with InkscapePdfConverter(executable=fake_inkscape) as converter:
+        output_file = document.build(converter=converter)
+
+    with open(fake_inkscape + ".log") as log:
+        assert log.read() == "--shell\n"
+    with fitz.open(output_file) as doc:
+        assert doc.page_count == len(document.pages)
+        assert doc[0].get_text().startswith("<svg")
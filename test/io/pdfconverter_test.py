@@ -0,0 +1,146 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import asyncio
+import fitz
+import os
+import pytest
+from svgwrite import Drawing
+from svk.io import CairoSvgPdfConverter, PdfConverter, SvgCompaction, VectorPdfRenderer
+from svk.io._pdfconverter import _svg_content
+from svk.visualization import LayoutConfiguration
+
+
+class NativePdfConverter(PdfConverter):
+    def __init__(self):
+        self.converted: int = 0
+        self.closed: bool = False
+
+    def convert_to_bytes(self, svg_dwg: Drawing, compaction: SvgCompaction | None = None) -> tuple[bytes, int]:
+        content, bytes_saved = _svg_content(svg_dwg, compaction)
+        with fitz.open() as doc:
+            VectorPdfRenderer().render_page(doc, content)
+            self.converted += 1
+            return doc.tobytes(), bytes_saved
+
+    def close(self):
+        self.closed = True
+
+
+def test_pdf_pages_are_merged_in_memory():
+    converter = NativePdfConverter()
+    drawings = [Drawing(size=(f"{100 * (i + 1)}px", "100px")) for i in range(3)]
+
+    pdf, bytes_saved = converter.convert_document_to_bytes(drawings)
+
+    assert bytes_saved == [0, 0, 0]
+    with fitz.open(stream=pdf, filetype="pdf") as doc:
+        assert [page.rect.width for page in doc] == [75, 150, 225]
+
+
+def test_document_is_built_with_a_custom_converter(tmp_path, create_document):
+    document = create_document(LayoutConfiguration(), "C")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+
+    with NativePdfConverter() as converter:
+        output_file = document.build(converter=converter)
+        assert not converter.closed
+    assert converter.closed
+
+    assert converter.converted == len(document.pages)
+    with fitz.open(output_file) as doc:
+        assert doc.page_count == len(document.pages)
+        assert any(link["kind"] == fitz.LINK_GOTO for page in doc for link in page.get_links())
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["calendar.pdf"]
+
+
+def test_document_is_printed_at_once_with_a_custom_converter(tmp_path, create_document):
+    document = create_document(LayoutConfiguration(), "S")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+    document.single_print = True
+
+    output_file = document.build(converter=NativePdfConverter())
+
+    with fitz.open(output_file) as doc:
+        assert doc.page_count == len(document.pages)
+        assert any(link["kind"] == fitz.LINK_GOTO for page in doc for link in page.get_links())
+
+
+def test_cairosvg_converts_svg_bytes_in_process(tmp_path):
+    pytest.importorskip("cairosvg")
+    dwg = Drawing(size=("400px", "200px"))
+    dwg.add(dwg.text("Hello", insert=(10, 50), font_size=20))
+    pdf_path = str(tmp_path / "page.pdf")
+
+    with CairoSvgPdfConverter() as converter:
+        converter.convert(dwg, pdf_path)
+
+    with fitz.open(pdf_path) as doc:
+        assert (doc[0].rect.width, doc[0].rect.height) == (300, 150)
+        assert "Hello" in doc[0].get_text()
+
+
+@pytest.mark.parametrize(
+    "options, use_converter",
+    [
+        ({"vector_pdf": VectorPdfRenderer()}, True),
+        ({"pdf_concurrency": 2}, True),
+        ({"pdf_concurrency": 2, "single_print": True}, False),
+        ({"pdf_concurrency": 2, "vector_pdf": VectorPdfRenderer()}, False),
+    ],
+)
+def test_conflicting_build_options_are_rejected(tmp_path, create_document, options: dict, use_converter: bool):
+    document = create_document(LayoutConfiguration(), "X")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+    for key, value in options.items():
+        setattr(document, key, value)
+
+    with pytest.raises(ValueError):
+        document.build(converter=NativePdfConverter() if use_converter else None)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("pdf_concurrency", [1, 2])
+def test_build_with_default_converter_is_rejected_in_running_event_loop(tmp_path, create_document, pdf_concurrency: int):
+    document = create_document(LayoutConfiguration(), "X")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+    document.pdf_concurrency = pdf_concurrency
+
+    async def build():
+        document.build()
+
+    with pytest.raises(ValueError, match="running event loop"):
+        asyncio.run(build())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_build_with_converter_runs_in_running_event_loop(tmp_path, create_document):
+    document = create_document(LayoutConfiguration(), "X")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+
+    async def build() -> str:
+        return document.build(converter=NativePdfConverter())
+
+    assert os.path.isfile(asyncio.run(build()))
@@ -0,0 +1,52 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svk.io import SvgCompaction, compact_svg
+
+
+def test_numbers_are_rounded_outside_text():
+    svg = '<svg width="100.0px"><text font-size="12" x="10.123456" y="20.0">1.23456</text></svg>'
+
+    compacted, bytes_saved = compact_svg(svg, SvgCompaction(precision=2))
+
+    assert compacted == '<svg width="100px"><text font-size="12" x="10.12" y="20">1.23456</text></svg>'
+    assert bytes_saved == len(svg) - len(compacted)
+
+
+def test_default_and_inherited_attributes_are_removed():
+    svg = (
+        '<svg width="10px"><text font-family="Arial" text-anchor="middle" x="0.0">'
+        '<tspan dy="0.0em" font-family="Arial" text-anchor="start" x="0">a</tspan></text>'
+        '<rect fill-opacity="1" x="0" y="5" /><defs><symbol id="s"><path d="M 0 0" fill="black" /></symbol></defs></svg>'
+    )
+
+    compacted = SvgCompaction(shorten_path_data=False).compact(svg)
+
+    assert compacted == (
+        '<svg width="10px"><text font-family="Arial" text-anchor="middle">'
+        '<tspan text-anchor="start" x="0">a</tspan></text>'
+        '<rect y="5" /><defs><symbol id="s"><path d="M 0 0" fill="black" /></symbol></defs></svg>'
+    )
+
+
+def test_path_data_is_shortened():
+    compaction = SvgCompaction(precision=3)
+
+    assert compaction.compact('<path d="M 10.0,20.5 L 0.25 -0.5 l 0.1,0.2 Z" />') == '<path d="M10 20.5L.25-.5l.1.2Z" />'
@@ -18,10 +18,82 @@ All names, logos, and references to "Deltares" are registered trademarks of Stic
 Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
 """
 
+from playwright.async_api import Error
 from svgwrite import Drawing
-from svk.io import svg_to_pdf_chrome
+from svk.io import svg_to_pdf_chrome, ChromiumPdfConverter
 from svk.visualization.helpers import draw_half_chevron
+import asyncio
+import fitz
 import os
+import pytest
+import time
+
+
+class FakePage:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.closed = False
+        self.crash_handlers = []
+
+    def set_default_timeout(self, timeout: float):
+        pass
+
+    def on(self, event: str, handler):
+        assert event == "crash"
+        self.crash_handlers.append(handler)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def set_content(self, html: str):
+        pass
+
+    async def pdf(self, path: str | None = None, **options) -> bytes:
+        failure = self.browser.failures.pop(0) if self.browser.failures else None
+        if failure == "hang":
+            await asyncio.sleep(60)
+        elif failure == "crash":
+            for handler in self.crash_handlers:
+                handler(self)
+            raise Error("Target crashed")
+        elif failure == "disconnect":
+            self.browser.connected = False
+            raise Error("Target closed")
+        elif failure == "error":
+            raise Error("Invalid page size")
+        return b"%PDF"
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, failures: list[str]):
+        self.failures = failures
+        self.connected = True
+        self.pages: list[FakePage] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_page(self) -> FakePage:
+        self.pages.append(FakePage(self))
+        return self.pages[-1]
+
+    async def close(self):
+        self.connected = False
+
+
+def create_stubbed_converter(failures: list[str], timeout: float = 30.0) -> tuple[ChromiumPdfConverter, list[FakeBrowser]]:
+    converter = ChromiumPdfConverter(timeout=timeout)
+    browsers: list[FakeBrowser] = []
+
+    async def launch_browser():
+        browsers.append(FakeBrowser(failures))
+        return browsers[-1]
+
+    converter._launch_browser = launch_browser
+    return converter, browsers
 
 
 def test_svgtopdf_produces_overview_page():
@@ -37,3 +109,64 @@ def test_svgtopdf_produces_overview_page():
     assert os.path.isfile(pt)
 
     os.remove(pt)
+
+
+def test_converter_reuses_browser_for_several_pages(tmp_path):
+    pdf_paths = [os.path.join(tmp_path, f"page {i}.pdf") for i in range(3)]
+
+    with ChromiumPdfConverter(timeout=60) as converter:
+        for i, pdf_path in enumerate(pdf_paths):
+            dwg = Drawing(size=(f"{400 + i * 100}px", "200px"))
+            dwg.add(draw_half_chevron(dwg, x=20, y=20, width=300, height=80, add_to_dwg=False))
+            converter.convert(dwg, pdf_path)
+        browser = converter._browser
+
+    assert browser is not None and not browser.is_connected()
+    assert all(os.path.isfile(pdf_path) for pdf_path in pdf_paths)
+
+
+def test_converter_prints_several_pages_at_once(tmp_path):
+    pdf_path = os.path.join(tmp_path, "document.pdf")
+    drawings = [Drawing(size=("400px", "200px")), Drawing(size=("800px", "600px"))]
+    for dwg in drawings:
+        dwg.add(draw_half_chevron(dwg, x=20, y=20, width=300, height=80, add_to_dwg=False))
+
+    with ChromiumPdfConverter(timeout=60) as converter:
+        converter.convert_document(drawings, pdf_path)
+
+    doc = fitz.open(pdf_path)
+    assert [(round(page.rect.width), round(page.rect.height)) for page in doc] == [(300, 150), (600, 450)]
+    doc.close()
+
+
+def test_converter_times_out_on_a_hanging_print():
+    converter, browsers = create_stubbed_converter(["hang"], timeout=0.2)
+    with converter:
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            converter.convert_to_bytes(Drawing(size=("400px", "200px")))
+        assert time.perf_counter() - start < 5.0
+
+        assert converter.convert_to_bytes(Drawing(size=("400px", "200px"))) == (b"%PDF", 0)
+        assert len(browsers) == 1
+        assert [page.closed for page in browsers[0].pages] == [True, False]
+
+
+@pytest.mark.parametrize("failure", ["crash", "disconnect"])
+def test_converter_restarts_browser_after_crash_or_disconnect(failure: str):
+    converter, browsers = create_stubbed_converter([failure])
+    with converter:
+        assert converter.convert_to_bytes(Drawing(size=("400px", "200px"))) == (b"%PDF", 0)
+
+    assert len(browsers) == 2
+    assert not browsers[0].connected
+
+
+def test_converter_raises_other_errors_without_restart():
+    converter, browsers = create_stubbed_converter(["error"])
+    with converter:
+        with pytest.raises(Error, match="Invalid page size"):
+            converter.convert_to_bytes(Drawing(size=("400px", "200px")))
+        assert converter.convert_to_bytes(Drawing(size=("400px", "200px"))) == (b"%PDF", 0)
+
+    assert len(browsers) == 1
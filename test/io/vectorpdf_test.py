@@ -0,0 +1,81 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import fitz
+import pytest
+from svk.io import VectorPdfRenderer
+from svk.visualization import LayoutConfiguration
+
+
+def render_svg(svg: str) -> fitz.Page:
+    doc = fitz.open()
+    return VectorPdfRenderer().render_page(doc, svg)
+
+
+def test_page_size_is_converted_to_points():
+    page = render_svg('<svg xmlns="http://www.w3.org/2000/svg" width="400px" height="200px"></svg>')
+
+    assert (page.rect.width, page.rect.height) == (300, 150)
+
+
+def test_text_is_written_as_extractable_text():
+    page = render_svg(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="400px" height="200px">'
+        '<text x="10" y="50" font-size="20">Research agenda SSB-∆</text>'
+        '<text x="390" y="100" font-size="20" text-anchor="end" font-weight="bold">Right</text></svg>'
+    )
+
+    words = page.get_text("words")
+    assert " ".join(word[4] for word in words) == "Research agenda SSB-∆ Right"
+    assert words[0][0] == pytest.approx(7.5, abs=0.5)
+    assert words[-1][2] == pytest.approx(292.5, abs=1)
+
+
+def test_shapes_are_filled_with_their_color():
+    page = render_svg(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="40px" height="40px">'
+        '<defs><symbol id="dot" viewBox="0 0 10 10"><circle cx="5" cy="5" r="5" /></symbol></defs>'
+        '<rect x="0" y="0" width="20" height="40" fill="#ff0000" />'
+        '<use xlink:href="#dot" xmlns:xlink="http://www.w3.org/1999/xlink" x="20" y="10" width="20" height="20" fill="blue" />'
+        "</svg>"
+    )
+
+    pixmap = page.get_pixmap(dpi=96)
+    assert pixmap.pixel(5, 20) == (255, 0, 0)
+    assert pixmap.pixel(30, 20) == (0, 0, 255)
+    assert pixmap.pixel(30, 2) == (255, 255, 255)
+
+
+def test_document_is_rendered_with_links(tmp_path, create_document):
+    document = create_document(LayoutConfiguration(), "V")
+    document.output_dir = str(tmp_path)
+    document.output_file = "calendar"
+    document.vector_pdf = VectorPdfRenderer()
+
+    output_file = document.build()
+
+    with fitz.open(output_file) as doc:
+        assert doc.page_count == len(document.pages)
+        for page, svg_page in zip(doc, sorted(document.pages, key=lambda p: p.page_number)):
+            width, height = svg_page.get_size()
+            assert page.rect.width == pytest.approx(width * 0.75, abs=0.01)
+            assert page.rect.height == pytest.approx(height * 0.75, abs=0.01)
+        assert "Research question number 1" in "".join(page.get_text() for page in doc)
+        assert any(link["kind"] == fitz.LINK_GOTO for page in doc for link in page.get_links())
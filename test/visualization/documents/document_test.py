@@ -0,0 +1,46 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svk.visualization import LayoutConfiguration
+
+
+def test_layout_reports_pages_and_links_without_pdf(create_document):
+    document = create_document(LayoutConfiguration(), "Q")
+    report = document.layout()
+
+    assert sorted(report.page_sizes) == list(range(5))
+    assert report.page_titles[0] == document.pages[0].title
+    assert report.element_counts[0] > len(document.questions)
+    assert report.dangling_link_ids == []
+    assert report.duplicate_page_numbers == []
+    assert all(report.link_targets[q.id][0] > 0 for q in document.questions)
+
+
+def test_layout_restores_links_register(create_document):
+    document = create_document(LayoutConfiguration(), "Q")
+    document.links_register.register_link("https://example.com", 7, 10.0, 20.0, 30.0, 40.0)
+    document.links_register.register_link_target("appendix", 7, 50.0, 60.0)
+    document.links_register.register_page(7, 800.0, 600.0)
+    links_register_state = document.links_register.model_copy(deep=True)
+
+    report = document.layout()
+
+    assert len(report.link_targets) > len(links_register_state.link_targets)
+    assert document.links_register == links_register_state
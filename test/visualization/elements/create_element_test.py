@@ -0,0 +1,51 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svk.visualization import LayoutConfiguration, QuestionDetailsElement, Group, RenderContext
+from svk.data import LinksRegister, Translator
+
+
+def test_create_matches_validating_constructor(create_question_element):
+    context = RenderContext(LayoutConfiguration(), LinksRegister(), Translator(lang="nl"))
+    research_question = create_question_element(
+        "T1", "This is my first question", context.layout_configuration, context.links_register, context.translator
+    ).research_question
+
+    validated = QuestionDetailsElement(
+        layout_configuration=context.layout_configuration,
+        links_register=context.links_register,
+        translator=context.translator,
+        research_question=research_question,
+        page_number=1,
+    )
+    created = QuestionDetailsElement.create(context, research_question=research_question, page_number=1)
+
+    assert created.model_dump() == validated.model_dump()
+    assert (created.width, created.height) == (validated.width, validated.height)
+    assert created.layout_configuration is context.layout_configuration
+
+
+def test_create_does_not_share_mutable_defaults(create_question_element):
+    context = RenderContext(LayoutConfiguration(), LinksRegister(), Translator(lang="nl"))
+    first = Group.create(context, title="first", color="black")
+    second = Group.create(context, title="second", color="black")
+
+    first.questions.append(create_question_element("T1", "A question", context.layout_configuration, context.links_register, context.translator))
+    assert len(second.questions) == 0
@@ -0,0 +1,104 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svk.visualization import LayoutConfiguration, Group, Cluster, Column, TimeLineOverviewPage
+from svk.data import LinksRegister, Translator
+
+
+def test_layout_stores_sizes_until_children_change(create_question_element):
+    config = LayoutConfiguration()
+    links_register = LinksRegister()
+    translator = Translator(lang="nl")
+
+    group = Group(layout_configuration=config, links_register=links_register, translator=translator, title="test", color="black")
+    group.add_question(create_question_element("T1", "This is my first question", config, links_register, translator))
+    cluster = Cluster(layout_configuration=config, links_register=links_register, translator=translator, color=(132, 243, 124))
+    cluster.add_group(0, group)
+
+    height = cluster.height
+    assert group.layout() is group.layout()
+
+    group.questions.append(create_question_element("T2", "This is my second question", config, links_register, translator))
+    assert cluster.height == height
+
+    group.invalidate_layout()
+    cluster.invalidate_layout()
+    assert cluster.height > height
+
+    group.add_question(create_question_element("T3", "This is my third question", config, links_register, translator))
+    assert group.height == group.measure()[1]
+
+
+def test_update_question_measures_and_redraws_affected_page_only(create_question_element):
+    config = LayoutConfiguration()
+    links_register = LinksRegister()
+    translator = Translator(lang="nl")
+
+    pages = []
+    for i_page in range(2):
+        group = Group(layout_configuration=config, links_register=links_register, translator=translator, title="test", color="black")
+        group.add_question(create_question_element(f"T{i_page}", "A short question", config, links_register, translator))
+        cluster = Cluster(layout_configuration=config, links_register=links_register, translator=translator, color=(132, 243, 124))
+        cluster.add_group(0, group)
+        page = TimeLineOverviewPage(
+            page_number=i_page, layout_configuration=config, links_register=links_register, translator=translator, title="test"
+        )
+        page.columns = [
+            Column(
+                layout_configuration=config,
+                links_register=links_register,
+                translator=translator,
+                header_title="test",
+                header_subtitle="sub",
+                header_color="#07583753",
+                number=0,
+            )
+        ]
+        page.clusters = [cluster]
+        page.draw()
+        pages.append(page)
+
+    width, height = pages[0].get_size()
+    edited = pages[0].clusters[0].groups[0][0].questions[0].research_question.model_copy(
+        update={"question": "A much longer question that does not fit on a single line of the summary anymore. " * 3}
+    )
+
+    assert [page.update_question(edited) for page in pages] == [True, False]
+    assert [page.needs_redraw for page in pages] == [True, False]
+    assert pages[0].get_size()[1] > height
+    assert pages[0].get_size()[0] == width
+
+    pages[0].draw()
+    assert not pages[0].needs_redraw
+    assert len(links_register.links["T0"]) == 1
+
+
+def test_update_question_only_updates_question_elements(create_question_element):
+    config = LayoutConfiguration()
+    links_register = LinksRegister()
+    translator = Translator(lang="nl")
+    group = Group(layout_configuration=config, links_register=links_register, translator=translator, title="test", color="black")
+    question = create_question_element("T1", "A short question", config, links_register, translator)
+    group.add_question(question)
+    edited = question.research_question.model_copy(update={"question": "An edited question"})
+
+    assert not group.update_question(edited.model_copy(update={"id": "T2"}))
+    assert group.update_question(edited)
+    assert question.research_question.question == "An edited question"
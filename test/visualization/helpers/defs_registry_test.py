@@ -0,0 +1,50 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from svk.data import StormSurgeBarrier
+from svk.visualization.helpers import draw_scaled_icon, get_defs_registry
+from svk.visualization.helpers._radial_gradient import create_radial_gradient
+from svk.visualization.helpers._streaming_svg import create_drawing
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_identical_gradients_are_defined_once(streaming: bool):
+    dwg = create_drawing(("100px", "100px"), streaming=streaming)
+
+    first_id = create_radial_gradient(dwg, x=10, y=10, width=40, height=20, color="red")
+    second_id = create_radial_gradient(dwg, x=10, y=10, width=40, height=20, color="red")
+    other_id = create_radial_gradient(dwg, x=10, y=10, width=40, height=20, color="blue")
+
+    assert first_id == second_id
+    assert other_id != first_id
+    assert len(dwg.defs.elements) == 2
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_symbols_are_defined_once(streaming: bool):
+    dwg = create_drawing(("100px", "100px"), streaming=streaming)
+
+    for i in range(5):
+        draw_scaled_icon(dwg, StormSurgeBarrier.MaeslantBarrier, insert=(i * 10, 0))
+    draw_scaled_icon(dwg, StormSurgeBarrier.HollandseIJsselBarrier, insert=(0, 50))
+
+    assert [definition.get_id() for definition in dwg.defs.elements] == ["MaeslantBarrier", "HollandseIJsselBarrier"]
+    assert get_defs_registry(dwg).get("MaeslantBarrier") is dwg.defs.elements[0]
@@ -0,0 +1,70 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from PIL import ImageFont
+from svk.visualization.helpers import FontMetrics, get_font_metrics, measure_text, measure_texts
+from svk.visualization.helpers._font_metrics import default_font_file
+
+texts = [
+    "",
+    " ",
+    "a",
+    "AV",
+    "Te kennen: ",
+    "This is my first question ",
+    "Now we try to pose a rediculous long question to see if outlines still match and all sizes and placement is correct.",
+    "Gerelateerde vragen: -",
+    "Hollandsche IJssel Kering",
+    "◦ Waterveiligheid (B&O) - 6SVK ∆",
+]
+
+
+@pytest.mark.parametrize("font_size", [8, 12, 18, 64])
+def test_font_metrics_matches_pillow(font_size: int):
+    font = ImageFont.truetype(default_font_file, font_size)
+    metrics = FontMetrics(font_file=default_font_file, font_size=font_size)
+    for text in texts:
+        bbox = font.getbbox(text)
+        assert metrics.measure(text) == (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+
+def test_font_metrics_is_shared_and_bounded():
+    assert get_font_metrics(12) is get_font_metrics(12)
+    assert get_font_metrics(12) is not get_font_metrics(14)
+
+    metrics = FontMetrics(font_file=default_font_file, font_size=12, max_cached_strings=2)
+    for text in texts[1:5]:
+        metrics.measure(text)
+    assert len(metrics._measured) == 2
+
+    assert measure_text("AV", 12) == metrics.measure("AV")
+
+
+def test_measure_texts_returns_sizes_in_order():
+    strings = ["AV", "Hollandsche IJssel Kering", "AV", ""]
+    widths, heights = measure_texts(strings, 12)
+    assert widths.shape == heights.shape == (4,)
+    for text, width, height in zip(strings, widths, heights):
+        assert (width, height) == measure_text(text, 12)
+
+    assert measure_texts([], 12)[0].size == 0
+    with pytest.raises(ValueError):
+        measure_texts(strings, 12, weight="bold")
@@ -0,0 +1,65 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from pathlib import Path
+import pytest
+from svk.data import StormSurgeBarrier
+from svk.visualization.helpers import IconLibrary, get_icon_library
+from svk.visualization.helpers._streaming_svg import create_drawing
+
+icons_directory = Path(__file__).parents[3] / "icons"
+
+
+def test_barrier_icons_are_compiled_once():
+    icon_library = get_icon_library()
+
+    assert icon_library is get_icon_library()
+    assert StormSurgeBarrier.MaeslantBarrier.name in icon_library.names
+    assert icon_library.names == [storm_surge_barrier.name for storm_surge_barrier in StormSurgeBarrier]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_icons_are_placed_by_reference(streaming: bool):
+    dwg = create_drawing(("100px", "100px"), streaming=streaming)
+    icon_library = get_icon_library()
+
+    assert icon_library.place(dwg, StormSurgeBarrier.Ramspol.name, insert=(0, 0), size=(10, 10))
+    assert icon_library.place(dwg, StormSurgeBarrier.Ramspol.name, insert=(20, 0), size=(10, 10))
+    assert not icon_library.place(dwg, "Unknown", insert=(40, 0), size=(10, 10))
+    if streaming:
+        dwg.close()
+
+    svg = dwg.tostring()
+    assert svg.count("<symbol") == 1
+    assert svg.count("<use") == 2
+
+
+def test_load_external_icon_set():
+    icon_library = IconLibrary()
+
+    with pytest.warns(UserWarning, match="6SVK.svg"):
+        names = icon_library.load_directory(icons_directory, prefix="external_")
+
+    assert "external_OSK" in names
+    dwg = create_drawing(("100px", "100px"))
+    icon_library.place(dwg, "external_OSK", insert=(0, 0), size=(10, 10))
+    svg = dwg.tostring()
+    assert 'viewBox="0 0 300 300"' in svg
+    assert "inkscape" not in svg and "sodipodi" not in svg
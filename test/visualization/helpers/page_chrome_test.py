@@ -0,0 +1,75 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from svk.visualization import LayoutConfiguration
+from svk.visualization.helpers import get_icon_library
+from svk.visualization.helpers._page_chrome import PageChrome
+from svk.visualization.helpers._streaming_svg import create_drawing
+from svk.visualization.helpers._text_styles import TextStyle
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_disclaimer_is_created_once(streaming: bool):
+    page_chrome = PageChrome()
+    style = TextStyle(name="disclaimer", font_size=8, font_family=None)
+    links = [("link", "https://www.deltares.nl")]
+
+    svgs = []
+    for page_height in [400, 600]:
+        dwg = create_drawing(("100px", f"{page_height}px"), streaming=streaming)
+        page_chrome.draw_disclaimer(dwg, "A disclaimer with a link.", insert=(20, page_height - 30), text_style=style, links=links)
+        svgs.append(dwg.tostring())
+
+    assert len(page_chrome._fragments) == 1
+    assert 'transform="translate(20,370)"' in svgs[0]
+    assert 'transform="translate(20,570)"' in svgs[1]
+    assert all('xlink:href="https://www.deltares.nl"' in svg for svg in svgs)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_icon_callout_definitions_are_added_to_every_page(streaming: bool):
+    page_chrome = PageChrome()
+    icon = get_icon_library().get("MaeslantBarrier")
+
+    svgs = []
+    for _ in range(2):
+        dwg = create_drawing(("100px", "100px"), streaming=streaming)
+        page_chrome.draw_icon_callout(dwg, icon, insert=(10, 10), size=(80, 60), icon_insert=(32, 12), icon_size=(56, 56))
+        svgs.append(dwg.tostring())
+
+    assert svgs[0] == svgs[1]
+    assert svgs[0].count("<radialGradient") == 1
+    assert svgs[0].count('<symbol id="MaeslantBarrier"') == 1
+    assert svgs[0].count('xlink:href="#MaeslantBarrier"') == 1
+
+
+def test_layout_context_shares_page_chrome():
+    context = LayoutConfiguration().create_context()
+
+    assert context.page_chrome is context.page_chrome
+    assert context.create_context(n_columns=2).page_chrome is context.page_chrome
+    assert not hasattr(LayoutConfiguration(), "page_chrome")
+
+
+def test_pages_of_a_document_share_page_chrome(create_document):
+    pages = create_document(LayoutConfiguration(), "Q").create_pages()
+
+    assert all(page.page_chrome is pages[0].page_chrome for page in pages)
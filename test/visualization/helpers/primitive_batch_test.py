@@ -0,0 +1,64 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from svk.visualization.helpers import collect_primitives, draw_dot, draw_line
+from svk.visualization.helpers._streaming_svg import create_drawing
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_primitives_are_written_as_one_path_per_style(streaming: bool):
+    dwg = create_drawing(("100px", "100px"), streaming=streaming)
+
+    with collect_primitives(dwg):
+        for i in range(10):
+            draw_line(dwg, start=(i, 0), end=(i, 10), stroke="red", stroke_width=0.5)
+        draw_line(dwg, start=(0, 0), end=(10, 0), stroke="blue", stroke_width=0.5)
+        for i in range(3):
+            draw_dot(dwg, center=(i * 10, 50), r=2, fill="black")
+
+    svg = dwg.tostring()
+    assert svg.count("<path") == 3
+    assert "<line" not in svg
+    assert "<circle" not in svg
+    assert svg.count("M0,0L0,10") == 1
+    assert svg.count("a2,2 0 1,0 4,0") == 3
+
+
+def test_primitives_are_added_directly_without_collecting():
+    dwg = create_drawing(("100px", "100px"))
+
+    with collect_primitives(dwg, enabled=False):
+        draw_line(dwg, start=(0, 0), end=(0, 10), stroke="red")
+    draw_dot(dwg, center=(5, 5), r=2, fill="black")
+
+    svg = dwg.tostring()
+    assert "<path" not in svg
+    assert svg.count("<line") == 1
+    assert svg.count("<circle") == 1
+
+
+def test_batched_lines_are_not_filled():
+    dwg = create_drawing(("100px", "100px"))
+
+    with collect_primitives(dwg):
+        draw_line(dwg, start=(0, 0), end=(0, 10), stroke="red")
+
+    assert 'fill="none"' in dwg.tostring()
@@ -0,0 +1,123 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from svk.data import LinksRegister, Translator
+from svk.visualization import LayoutConfiguration, Group, Cluster, Column, TimeLineOverviewPage
+from svk.visualization.helpers import draw_half_chevron
+from svk.visualization.helpers._draw_callout import draw_callout
+from svk.visualization.helpers._draw_priority_arrow import draw_priority_arrow
+from svk.visualization.helpers._streaming_svg import create_drawing
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_chevrons_of_the_same_size_share_a_template(streaming: bool):
+    dwg = create_drawing(("500px", "500px"), streaming=streaming)
+
+    chevrons = [draw_half_chevron(dwg, x=i * 100, y=10, width=90, height=30, color="red", add_to_dwg=False) for i in range(4)]
+    draw_half_chevron(dwg, x=0, y=100, width=120, height=30, color="red", add_to_dwg=False)
+
+    assert all(chevron.elementname == "use" for chevron in chevrons)
+    assert len({chevron["xlink:href"] for chevron in chevrons}) == 1
+    assert [chevron["x"] for chevron in chevrons] == [0, 100, 200, 300]
+    # Two templates (polygons) and two gradients (one per size), instead of a polygon and gradient per chevron.
+    assert sorted(definition.elementname for definition in dwg.defs.elements) == [
+        "polygon",
+        "polygon",
+        "radialGradient",
+        "radialGradient",
+    ]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_callouts_inherit_the_presentation_of_the_reference(streaming: bool):
+    dwg = create_drawing(("500px", "500px"), streaming=streaming)
+
+    draw_callout(dwg, x=10, y=10, width=200, height=40, color="red")
+    draw_callout(dwg, x=10, y=60, width=200, height=40, color="blue")
+
+    svg = dwg.tostring()
+    assert svg.count("<polygon") == 1
+    assert svg.count("<use") == 2
+    polygon = svg[svg.index("<polygon") : svg.index(">", svg.index("<polygon"))]
+    assert "fill=" not in polygon
+    assert "stroke=" not in polygon
+
+
+def test_inline_shapes_without_template():
+    dwg = create_drawing(("500px", "500px"))
+
+    draw_callout(dwg, x=10, y=10, width=200, height=40, color="red", use_template=False)
+    draw_priority_arrow(dwg, x=10, y=80, width=20, use_template=False)
+
+    svg = dwg.tostring()
+    assert "<use" not in svg
+    assert svg.count("<polygon") == 1
+    assert svg.count("<line") == 2
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_priority_arrows_share_a_template(streaming: bool):
+    dwg = create_drawing(("500px", "500px"), streaming=streaming)
+
+    for i in range(6):
+        draw_priority_arrow(dwg, x=i * 30, y=20, width=20, stroke_color="black" if i % 2 else "grey")
+
+    svg = dwg.tostring()
+    assert svg.count("<line") == 2
+    assert svg.count("<use") == 6
+    assert 'stroke="grey"' in svg
+
+
+def test_groups_of_the_same_size_share_a_callout_template(create_question_element):
+    config = LayoutConfiguration()
+    links_register = LinksRegister()
+    translator = Translator(lang="nl")
+    context = (config, links_register, translator)
+
+    cluster = Cluster(layout_configuration=config, links_register=links_register, translator=translator, color=(132, 243, 124))
+    for i_group, n_questions in enumerate([1, 1, 3]):
+        group = Group(layout_configuration=config, links_register=links_register, translator=translator, title="g", color="red")
+        for i_question in range(n_questions):
+            group.add_question(create_question_element(f"T{i_group}-{i_question}", "A short question", *context))
+        cluster.add_group(i_group, group)
+    page = TimeLineOverviewPage(page_number=0, layout_configuration=config, links_register=links_register, translator=translator, title="t")
+    page.columns = [
+        Column(
+            layout_configuration=config,
+            links_register=links_register,
+            translator=translator,
+            header_title="c",
+            header_subtitle="s",
+            header_color="#07583753",
+            number=i_column,
+        )
+        for i_column in range(3)
+    ]
+    page.clusters = [cluster]
+
+    dwg = page.draw()
+
+    svg = dwg.tostring()
+    templates = [definition.get_id() for definition in dwg.defs.elements if definition.elementname == "polygon"]
+    uses = {template: svg.count(f'xlink:href="#{template}"') for template in templates}
+    # One template for the two groups of the same size (and one for the column headers), the third group is drawn inline.
+    assert sorted(uses.values()) == [2, 3]
+    assert svg.count("<polygon") == len(templates) + 1
@@ -0,0 +1,61 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from io import StringIO
+import re
+import xml.etree.ElementTree as ET
+from svk.visualization import LayoutConfiguration
+from svk.visualization.helpers._streaming_svg import StreamingDrawing, create_drawing
+
+
+def canonical(svg: str) -> tuple[bytes, list[bytes]]:
+    root = ET.fromstring(re.sub(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", "uuid", svg))
+    definitions = []
+    for defs in [element for element in root if element.tag.endswith("defs")]:
+        definitions += [ET.tostring(definition) for definition in defs]
+        root.remove(defs)
+    return ET.tostring(root), sorted(definitions)
+
+
+def test_streaming_drawing_writes_same_svg_as_dom_drawing():
+    for drawing in [create_drawing(("10px", "20px")), create_drawing(("10px", "20px"), streaming=True)]:
+        gradient = drawing.radialGradient(id="gradient")
+        gradient.add_stop_color(offset=0, color="white")
+        drawing.defs.add(gradient)
+        text = drawing.text("a < b", insert=(1, 2), font_size=12, fill="black")
+        text.add(drawing.tspan("&", insert=(1, 14)))
+        text.rotate(-90, center=(1, 2))
+        drawing.add(text)
+        drawing.add(drawing.rect(insert=(0, 0), size=(5, 5), fill=f"url(#{gradient.get_id()})"))
+        if isinstance(drawing, StreamingDrawing):
+            drawing.close()
+            streamed = drawing.tostring()
+        else:
+            expected = drawing.tostring()
+
+    assert canonical(streamed) == canonical(expected)
+
+
+def test_streaming_pages_equal_dom_pages(create_document):
+    for page in create_document(LayoutConfiguration(), "Q").create_pages():
+        output = StringIO()
+        page.draw(streaming=True, output=output)
+
+        assert canonical(output.getvalue()) == canonical(page.draw().tostring())
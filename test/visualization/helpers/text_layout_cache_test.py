@@ -0,0 +1,86 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sqlite3
+from svk.visualization.helpers import TextLayoutCache, use_text_layout_cache, get_text_layout_cache, wrapped_lines, measure_text
+from svk.io import VectorPdfRenderer
+from svk.visualization import LayoutConfiguration
+from svk.visualization.helpers._font_metrics import default_font_file
+
+text = "Now we try to pose a rediculous long question to see if outlines still match and all sizes and placement is correct."
+
+
+def test_text_layout_cache_is_reused_across_builds(tmp_path):
+    cache_file = os.path.join(tmp_path, "layout.sqlite")
+    expected_lines = wrapped_lines(text, 120)
+    expected_size = measure_text(text, 12)
+
+    with use_text_layout_cache(cache_file) as cache:
+        assert get_text_layout_cache() is cache
+        assert wrapped_lines(text, 120) == expected_lines
+        assert measure_text(text, 12) == expected_size
+    assert get_text_layout_cache() is None
+
+    cache = TextLayoutCache(cache_file)
+    assert cache.get_lines(text, 120, 12, default_font_file) == expected_lines
+    assert cache.get_lines(text, 121, 12, default_font_file) is None
+    assert cache.get_size(text, 12, default_font_file) == expected_size
+    cache.close()
+
+
+def test_text_layout_cache_evicts_least_recently_used(tmp_path):
+    cache_file = os.path.join(tmp_path, "layout.sqlite")
+    with use_text_layout_cache(cache_file, max_entries=2):
+        wrapped_lines("first", 100)
+    with use_text_layout_cache(cache_file, max_entries=2):
+        wrapped_lines("second", 100)
+        wrapped_lines("first", 100)
+        wrapped_lines("third", 100)
+
+    cache = TextLayoutCache(cache_file)
+    assert cache.get_lines("second", 100, 12, default_font_file) is None
+    assert cache.get_lines("first", 100, 12, default_font_file) == ["first "]
+    assert cache.get_lines("third", 100, 12, default_font_file) == ["third "]
+    cache.close()
+
+    with use_text_layout_cache(None) as no_cache:
+        assert no_cache is None
+
+
+def test_concurrent_builds_use_their_own_cache(tmp_path, create_document):
+    def build(i_document: int) -> str:
+        document = create_document(LayoutConfiguration(), f"C{i_document}-")
+        document.output_dir = str(tmp_path)
+        document.output_file = f"document {i_document}"
+        document.text_layout_cache_file = os.path.join(tmp_path, f"layout {i_document}.sqlite")
+        document.vector_pdf = VectorPdfRenderer()
+        return document.build()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        output_files = list(executor.map(build, range(6)))
+
+    assert all(os.path.exists(output_file) for output_file in output_files)
+    assert get_text_layout_cache() is None
+    assert measure_text(text, 12) == measure_text(text, 12)
+    for i_document in range(6):
+        with sqlite3.connect(os.path.join(tmp_path, f"layout {i_document}.sqlite")) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM wrapped_lines").fetchone()[0] > 0
@@ -0,0 +1,63 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from svk.visualization import LayoutConfiguration
+from svk.visualization.helpers import add_text_styles, text_style_attributes, wrapped_text
+from svk.visualization.helpers._streaming_svg import create_drawing
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_text_refers_to_style_by_class(streaming: bool):
+    text_styles = LayoutConfiguration().text_styles
+    dwg = create_drawing(("100px", "100px"), streaming=streaming)
+    add_text_styles(dwg, text_styles.values())
+    add_text_styles(dwg, text_styles.values())
+
+    dwg.add(wrapped_text(dwg, lines=["first ", "second "], insert=(0, 0), text_style=text_styles["body"]))
+    if streaming:
+        dwg.close()
+
+    svg = dwg.tostring()
+    assert svg.count("<style") == 1
+    assert ".body{font-family:Arial;font-size:12px;font-weight:normal;font-style:normal}" in svg
+    assert 'class="body"' in svg
+    assert "font-size" not in svg.split("</style>")[1]
+
+
+def test_text_without_style_sheet_repeats_font_attributes():
+    text_style = LayoutConfiguration().text_styles["group-title"]
+    dwg = create_drawing(("100px", "100px"))
+
+    assert text_style_attributes(dwg, text_style) == {
+        "font_size": 14,
+        "font_family": "Arial",
+        "font_weight": "bold",
+        "font_style": "normal",
+    }
+
+
+def test_pages_define_text_styles_once(create_document):
+    for text_style_classes in [True, False]:
+        document = create_document(LayoutConfiguration(text_style_classes=text_style_classes), "Q")
+        svg = document.create_pages()[0].draw().tostring()
+
+        assert svg.count("<style") == (1 if text_style_classes else 0)
+        assert ('font-family="Arial"' in svg) != text_style_classes
@@ -0,0 +1,59 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+import pytest
+from svk.visualization.helpers import measure_text, wrapped_lines, wrapped_lines_for_widths
+
+texts = [
+    "",
+    "This is my first question",
+    "Now we try to pose a rediculous long question to see if outlines still match and all sizes and placement is correct. I will not stop trying until I get this right.",
+    "Averylongwordthatdoesnotfitatall in the available width",
+    "AV Te To Ty Yo LT",
+]
+
+
+def _wrapped_lines_word_by_word(text: str, max_width: float, font_size: int) -> list[str]:
+    # Reference: measures the growing line for every word.
+    lines = []
+    line = ""
+    for word in text.split():
+        test_line = line + word + " "
+        if measure_text(test_line, font_size)[0] > max_width:
+            lines.append(line)
+            line = word + " "
+        else:
+            line = test_line
+    if line:
+        lines.append(line)
+    return lines
+
+
+@pytest.mark.parametrize("font_size", [8, 12, 14])
+@pytest.mark.parametrize("max_width", [30, 57.5, 120, 535])
+def test_wrapped_lines_matches_word_by_word_wrapping(font_size: int, max_width: float):
+    for text in texts:
+        assert wrapped_lines(text, max_width, font_size) == _wrapped_lines_word_by_word(text, max_width, font_size)
+
+
+def test_wrapped_lines_for_widths():
+    max_widths = [30, 120, 535]
+    for text in texts:
+        assert wrapped_lines_for_widths(text, max_widths) == [wrapped_lines(text, w) for w in max_widths]
@@ -0,0 +1,61 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pydantic import ValidationError
+from svk.visualization import KnowledgeCalendarDocument, LayoutConfiguration
+
+
+def draw_sizes(document: KnowledgeCalendarDocument) -> list[tuple[float, float]]:
+    return [page.get_size() for page in document.create_pages()]
+
+
+def test_layout_context_is_frozen():
+    layout_configuration = LayoutConfiguration()
+    context = layout_configuration.create_context(n_columns=2)
+
+    assert context.overview_page_width == 2 * context.paper_margin + 2 * layout_configuration.column_width
+    with pytest.raises(ValidationError):
+        context.n_columns = 4
+
+
+def test_documents_sharing_a_configuration_build_concurrently(create_document):
+    layout_configuration = LayoutConfiguration()
+    expected = [draw_sizes(create_document(LayoutConfiguration(), "Q")), draw_sizes(create_document(LayoutConfiguration(), "LONG-ID-"))]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(draw_sizes, [create_document(layout_configuration, prefix) for prefix in ["Q", "LONG-ID-"] * 4])
+        )
+
+    assert results == expected * 4
+    assert layout_configuration == LayoutConfiguration()
+
+
+def test_overview_page_is_created_with_a_context_for_its_columns(create_document):
+    document = create_document(LayoutConfiguration(), "Q")
+    overview_page = document.create_pages()[0]
+    page_context = overview_page.layout_configuration
+
+    assert page_context.n_columns == len(overview_page.columns)
+    assert all(cluster.layout_configuration is page_context for cluster in overview_page.clusters)
+    assert overview_page.get_content_size()[0] == page_context.overview_page_width
+    assert overview_page.layout_configuration is page_context
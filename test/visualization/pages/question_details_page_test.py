@@ -0,0 +1,103 @@
+"""
+Copyright (C) Stichting Deltares 2026. All rights reserved.
+
+This file is part of the 6svk toolbox.
+
+This program is free software; you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation; either
+version 3 of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this
+program; if not, see <https://www.gnu.org/licenses/>.
+
+All names, logos, and references to "Deltares" are registered trademarks of Stichting
+Deltares and remain full property of Stichting Deltares at all times. All rights reserved.
+"""
+
+from svk.data import ResearchQuestion, ResearchLine, Priority, TimeFrame, StormSurgeBarrier, LinksRegister, Translator
+from svk.visualization import LayoutConfiguration, QuestionDetailsElement, QuestionDetailsPage
+
+
+def create_details_page(questions: list[str], links_register: LinksRegister) -> QuestionDetailsPage:
+    layout_configuration = LayoutConfiguration().create_context()
+    translator = Translator(lang="nl")
+    page = QuestionDetailsPage(
+        page_number=3,
+        title="Research line",
+        title_link_target="research-line",
+        layout_configuration=layout_configuration,
+        links_register=links_register,
+        translator=translator,
+    )
+    for i_question, question in enumerate(questions):
+        page.add_question(
+            QuestionDetailsElement(
+                layout_configuration=layout_configuration,
+                links_register=links_register,
+                translator=translator,
+                research_question=ResearchQuestion(
+                    id=f"Q{i_question}",
+                    question=question,
+                    storm_surge_barriers=[StormSurgeBarrier.HaringvlietBarrier],
+                    reference_ids=[],
+                    reference_question=i_question,
+                    prio_water_safety=Priority.Low,
+                    prio_management_maintenance=Priority.High,
+                    prio_other_functions=Priority.Medium,
+                    prio_operation=Priority.High,
+                    time_frame=TimeFrame.Now,
+                    research_line_primary=ResearchLine.Adaptation.value,
+                    keywords="",
+                ),
+                page_number=3,
+            )
+        )
+    return page
+
+
+def test_page_that_fits_is_not_paginated():
+    page = create_details_page([f"Research question number {i}" for i in range(3)], LinksRegister())
+
+    assert page.paginate(page.get_size()[1]) == [page]
+
+
+def test_questions_are_paginated_at_maximum_height():
+    links_register = LinksRegister()
+    page = create_details_page([f"Research question number {i}" for i in range(8)], links_register)
+    question_ids = [q.research_question.id for q in page.questions]
+    max_height = page.get_size()[1] / 3
+
+    pages = page.paginate(max_height)
+    for details_page in pages:
+        details_page.draw()
+
+    assert len(pages) > 2
+    assert [p.page_number for p in pages] == list(range(3, 3 + len(pages)))
+    assert [p.title for p in pages] == ["Research line"] + [f"Research line ({i + 2})" for i in range(len(pages) - 1)]
+    assert [p.title_link_target for p in pages] == ["research-line"] + [None] * (len(pages) - 1)
+    assert all(p.get_size()[1] <= max_height for p in pages)
+    assert [q.research_question.id for p in pages for q in p.questions] == question_ids
+    for details_page in pages:
+        for question in details_page.questions:
+            assert question.page_number == details_page.page_number
+            assert links_register.link_targets[question.research_question.id][0] == details_page.page_number
+
+
+def test_question_taller_than_maximum_height_gets_a_page_of_its_own():
+    short_page = create_details_page(["Research question number 0"], LinksRegister())
+    max_height = 2 * short_page.get_size()[1]
+    page = create_details_page(
+        ["Research question number 0", " ".join(["A very long research question"] * 400), "Research question number 2"],
+        LinksRegister(),
+    )
+    assert page.questions[1].height > max_height
+
+    pages = page.paginate(max_height)
+
+    assert [[q.research_question.id for q in p.questions] for p in pages] == [["Q0"], ["Q1"], ["Q2"]]
+    assert pages[1].get_size()[1] > max_height
+    assert all(p.get_size()[1] <= max_height for p in [pages[0], pages[2]])